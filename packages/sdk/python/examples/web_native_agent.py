@@ -16,11 +16,14 @@ Usage:
 """
 
 import os
-import time
+import sys
 import requests
 from eth_account import Account
 from eth_account.messages import encode_defunct
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from maldo import MaldoClient, MaldoTimeoutError
+
 # ─── Config ───────────────────────────────────────────────────────
 MALDO_API = os.getenv("MALDO_API", "https://api.maldo.uy")
 OPERATOR_KEY = os.getenv("OPERATOR_KEY")  # Human principal's private key
@@ -117,30 +120,26 @@ def main():
         print(f"  Deal ID: {data['dealId']}")
         print(f"  Funds locked in escrow on Sepolia ⛓")
 
-        # ── Step 6: Poll for result ──────────────────────────────
+        # ── Step 6: Wait for delivery (event stream, no polling) ─
         print("\n[6/6] Waiting for service delivery...")
-        for attempt in range(30):
-            time.sleep(2)
-            r = requests.get(f"{MALDO_API}/x402/deals/{deal_nonce}/result")
-            result = r.json()
-
-            if result.get("status") == "delivered":
-                print("\n✅ Service delivered!")
-                print(f"\n{'='*60}")
-                print("RESULT:")
-                print(f"{'='*60}")
-                print(result.get("result", {}).get("content", "No content"))
-                print(f"{'='*60}")
-
-                # Auto-confirm delivery (within criteria)
-                requests.post(f"{MALDO_API}/api/v1/deals/{deal_nonce}/complete")
-                print("\n✅ Delivery confirmed — USDC released to service agent")
-                print("✅ ERC-8004 reputation updated")
-                return
-
-            print(f"  Waiting... ({attempt + 1}/30)")
-
-        print("  Timeout — deal can be refunded after 7 days")
+        try:
+            with MaldoClient(api_url=MALDO_API) as client:
+                delivery = client.x402.wait_for_delivery(deal_nonce, max_wait=60)
+        except MaldoTimeoutError:
+            print("  Timeout — deal can be refunded after 7 days")
+            return
+
+        print("\n✅ Service delivered!")
+        print(f"\n{'='*60}")
+        print("RESULT:")
+        print(f"{'='*60}")
+        print(delivery.get("deliveryResult") or "No content")
+        print(f"{'='*60}")
+
+        # Auto-confirm delivery (within criteria)
+        requests.post(f"{MALDO_API}/api/v1/deals/{deal_nonce}/complete")
+        print("\n✅ Delivery confirmed — USDC released to service agent")
+        print("✅ ERC-8004 reputation updated")
 
     else:
         print(f"  Error: {r.status_code} — {r.text}")
@@ -6,9 +6,76 @@ Usage:
 
     client = MaldoClient(api_url="http://localhost:3000")
     agents = client.agents.discover(capability="market-analysis")
+
+Async usage (requires aiohttp):
+    from maldo import AsyncMaldoClient
+
+    async with AsyncMaldoClient(api_url="http://localhost:3000") as client:
+        agents = await client.agents.discover(capability="market-analysis")
 """
 
-from maldo.client import MaldoClient, MaldoApiError
+from maldo.client import MaldoClient
+from maldo.batch import BatchResult, DealSpec
+from maldo.cache import CacheConfig, CacheStats
+from maldo.concurrency import AdaptiveConcurrencyConfig, ConcurrencyStats
+from maldo.circuit import CircuitBreakerConfig, CircuitStats
+from maldo.async_client import AsyncMaldoClient
+from maldo.criteria import Criteria, CriteriaEvaluator
+from maldo.events import AsyncEventStream, DealEvent, EventStream
+from maldo.errors import (
+    CircuitOpenError,
+    MaldoApiError,
+    MaldoConnectionError,
+    MaldoTimeoutError,
+)
+from maldo.models import Agent, CriteriaEvaluation, Deal, Reputation, X402Requirements
+from maldo.pipeline import AsyncHirePipeline, HirePipeline, HireResult
+from maldo.ratelimit import RateLimit, RateLimitConfig
+from maldo.retry import RetryPolicy, new_idempotency_key
+from maldo.singleflight import FlightStats
+from maldo.table import AgentTable
+from maldo.timeouts import Deadline, Timeout
+from maldo.transport import PoolConfig
+from maldo.watcher import AsyncDealWatcher, DealWatcher
 
-__all__ = ["MaldoClient", "MaldoApiError"]
+__all__ = [
+    "MaldoClient",
+    "AsyncMaldoClient",
+    "MaldoApiError",
+    "MaldoTimeoutError",
+    "MaldoConnectionError",
+    "CircuitOpenError",
+    "RetryPolicy",
+    "RateLimit",
+    "RateLimitConfig",
+    "new_idempotency_key",
+    "Deadline",
+    "Timeout",
+    "PoolConfig",
+    "CacheConfig",
+    "CacheStats",
+    "CircuitBreakerConfig",
+    "CircuitStats",
+    "AdaptiveConcurrencyConfig",
+    "ConcurrencyStats",
+    "FlightStats",
+    "BatchResult",
+    "DealSpec",
+    "DealEvent",
+    "EventStream",
+    "AsyncEventStream",
+    "DealWatcher",
+    "AsyncDealWatcher",
+    "Agent",
+    "Reputation",
+    "Deal",
+    "CriteriaEvaluation",
+    "X402Requirements",
+    "AgentTable",
+    "Criteria",
+    "CriteriaEvaluator",
+    "HirePipeline",
+    "AsyncHirePipeline",
+    "HireResult",
+]
 __version__ = "0.1.0"
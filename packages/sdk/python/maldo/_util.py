@@ -0,0 +1,38 @@
+"""
+Maldo SDK client internals
+
+Constants and helpers shared by MaldoClient and AsyncMaldoClient.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from maldo.batch import BatchEndpoint
+from maldo.errors import MaldoApiError
+
+REPUTATION_BATCH = BatchEndpoint(
+    "/api/v1/agents/reputation/batch",
+    "agentIds",
+    "reputations",
+    "agentId",
+    "Agent not found",
+)
+DEAL_STATUS_BATCH = BatchEndpoint(
+    "/api/v1/deals/status/batch",
+    "nonces",
+    "statuses",
+    "nonce",
+    "Deal not found",
+)
+
+# Nonces whose last fetched status deals.status_many remembers
+DEAL_STATUS_MEMORY = 100_000
+UNSEEN = object()  # no status remembered yet
+
+
+def check_max_price(reqs: Any, max_price: Optional[int]) -> None:
+    """Raise a 402 MaldoApiError if x402 requirements ask for more than `max_price`."""
+    amount = int(reqs.get("requirements", {}).get("amount", 0))
+    if max_price and amount > max_price:
+        raise MaldoApiError(402, f"Price {amount} exceeds max {max_price}")
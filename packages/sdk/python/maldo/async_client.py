@@ -0,0 +1,1323 @@
+"""
+Maldo Python SDK Async Client
+
+asyncio counterpart of MaldoClient backed by aiohttp. Namespaces and method
+signatures mirror the sync client; every method is a coroutine.
+
+Requires aiohttp (pip install aiohttp).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Sequence, Union
+
+from maldo._util import (
+    DEAL_STATUS_BATCH,
+    DEAL_STATUS_MEMORY,
+    REPUTATION_BATCH,
+    UNSEEN,
+    check_max_price,
+)
+from maldo.batch import (
+    BatchEndpoint,
+    BatchResult,
+    DealSpec,
+    afetch_batched,
+    amap_bounded,
+    astart_bounded,
+)
+from maldo.cache import CacheConfig, CacheStats, ResponseStore, TTLCache
+from maldo.circuit import CircuitBreakerConfig, CircuitBreakers, CircuitStats
+from maldo.codec import CodecLike, get_codec
+from maldo.concurrency import AdaptiveConcurrencyConfig, AdaptiveLimiter, ConcurrencyStats
+from maldo.criteria import Criteria, CriteriaEvaluator
+from maldo.errors import MaldoApiError, MaldoConnectionError, MaldoTimeoutError
+from maldo.events import DELIVERY_EVENTS, DISCONNECTED, AsyncEventStream, is_delivered
+from maldo.models import (
+    Agent,
+    CriteriaEvaluation,
+    Deal,
+    Model,
+    Reputation,
+    X402Requirements,
+    wrap_items,
+)
+from maldo.paging import DEFAULT_PAGE_SIZE, aiter_pages, aiter_streamed_pages
+from maldo.ratelimit import RateLimitConfig, RateLimiter
+from maldo.retry import IDEMPOTENT_METHODS, Retrier, RetryPolicy, parse_retry_after
+from maldo.singleflight import AsyncSingleFlight, FlightStats, flight_key
+from maldo.streaming import STREAM_CHUNK_SIZE, AsyncJSONArrayStream
+from maldo.timeouts import Deadline, Timeout, TimeoutLike
+from maldo.transport import PoolConfig
+from maldo.watcher import AsyncDealWatcher
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency
+    aiohttp = None
+
+
+@dataclass
+class AsyncAgentNamespace:
+    """Agent-related operations."""
+
+    _client: "AsyncMaldoClient"
+
+    async def register(
+        self,
+        name: str,
+        capabilities: list[str],
+        wallet: str,
+        description: str = "",
+        base_price: int = 0,
+        endpoint: str = "",
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = await self._client._post(
+            "/api/v1/services/register",
+            {
+                "name": name,
+                "description": description,
+                "capabilities": capabilities,
+                "basePrice": base_price,
+                "endpoint": endpoint,
+                "wallet": wallet,
+            },
+            timeout=timeout,
+            deadline=deadline,
+        )
+        if self._client._agents_cache is not None:
+            await self._client._agents_cache.ainvalidate("list")
+        return res
+
+    async def discover(
+        self,
+        capability: str,
+        min_rep: Optional[int] = None,
+        limit: int = 10,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """
+        Discover agents by capability, ranked by reputation.
+
+        When the client has a discovery cache, results are answered from
+        memory; entries in their stale window are returned immediately and
+        refreshed in a background task. refresh=True bypasses the cache.
+        """
+        params = {"capability": capability, "limit": str(limit)}
+        if min_rep is not None:
+            params["minRep"] = str(min_rep)
+        cache = self._client._discovery_cache
+        key = (capability, min_rep, limit)
+        if cache is not None and not refresh:
+            cached, fresh = await cache.alookup(key)
+            if cached is not None:
+                if not fresh and cache.begin_refresh(key):
+                    self._client._spawn(self._refresh_discovery(key, params))
+                return self._client._typed_items(Agent, cached, "agents")
+        res = await self._client._get(
+            "/api/v1/services/discover",
+            params=params,
+            timeout=timeout,
+            deadline=deadline,
+        )
+        if cache is not None:
+            await cache.aset(key, res)
+        return self._client._typed_items(Agent, res, "agents")
+
+    async def _refresh_discovery(self, key: tuple, params: dict) -> None:
+        cache = self._client._discovery_cache
+        failed = True
+        try:
+            res = await self._client._get("/api/v1/services/discover", params=params)
+            await cache.aset(key, res)
+            failed = False
+        except Exception:
+            pass  # keep serving the stale entry until its window closes
+        finally:
+            cache.end_refresh(key, failed=failed)
+
+    async def get(
+        self,
+        agent_id: str,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        cache = self._client._agents_cache
+        key = ("agent", agent_id)
+        res = await cache.aget(key) if cache is not None and not refresh else None
+        if res is None:
+            res = await self._client._get(
+                f"/api/v1/agents/{agent_id}",
+                timeout=timeout,
+                deadline=deadline,
+            )
+            if cache is not None:
+                await cache.aset(key, res)
+        return self._client._typed(Agent, res)
+
+    async def list(
+        self,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """All registered agents; cached when the client has an agents cache."""
+        cache = self._client._agents_cache
+        res = await cache.aget("list") if cache is not None and not refresh else None
+        if res is None:
+            res = await self._client._get("/api/v1/agents", timeout=timeout, deadline=deadline)
+            if cache is not None:
+                await cache.aset("list", res)
+        return self._client._typed_items(Agent, res, "agents")
+
+    def iter_agents(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+        stream: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield registered agents one at a time, fetching `page_size` per request
+        and the next page in the background (unless `prefetch` is False).
+
+        With `stream=True` each page is decoded incrementally and items are
+        yielded while it is still downloading; pages are then fetched one
+        after another.
+        """
+        if stream:
+            pages = aiter_streamed_pages(
+                lambda params: self._client._stream(
+                    "/api/v1/agents",
+                    "agents",
+                    params=params,
+                    timeout=timeout,
+                    deadline=deadline,
+                ),
+                "agents",
+                page_size,
+            )
+            return self._client._typed_iter(Agent, pages)
+
+        async def fetch(params: dict) -> dict:
+            return await self._client._get(
+                "/api/v1/agents",
+                params=params,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        return self._client._typed_iter(Agent, aiter_pages(fetch, "agents", page_size, prefetch))
+
+    async def reputation(
+        self,
+        agent_id: str,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """An agent's reputation; cached when the client has a reputation cache."""
+        cache = self._client._reputation_cache
+        res = await cache.aget(agent_id) if cache is not None and not refresh else None
+        if res is None:
+            res = await self._client._get(
+                f"/api/v1/agents/{agent_id}/reputation",
+                timeout=timeout,
+                deadline=deadline,
+            )
+            if cache is not None:
+                await cache.aset(agent_id, res)
+        return self._client._typed(Reputation, res)
+
+    async def reputation_many(
+        self,
+        agent_ids: Iterable[str],
+        *,
+        refresh: bool = False,
+        max_concurrency: Optional[int] = None,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> list[BatchResult]:
+        """
+        Fetch reputations for many agents, returned in input order.
+
+        Reputations in the client's reputation cache are not fetched again
+        (unless `refresh`). The rest come from POST
+        /api/v1/agents/reputation/batch when the server provides it and
+        otherwise from parallel single GETs. Their concurrency adapts to the
+        server (see `adaptive_concurrency`), capped by `max_concurrency`.
+        Failures are reported per item.
+        """
+        ids = list(agent_ids)
+        unique = list(dict.fromkeys(ids))
+        fetched: dict[str, BatchResult] = {}
+
+        cache = self._client._reputation_cache
+        if cache is not None and not refresh:
+            for agent_id in unique:
+                rep = await cache.aget(agent_id)
+                if rep is not None:
+                    fetched[agent_id] = BatchResult(
+                        agent_id,
+                        value=self._client._typed(Reputation, rep),
+                    )
+            unique = [agent_id for agent_id in unique if agent_id not in fetched]
+
+        batched: dict[str, dict] = {}  # cached after the batch (disk writes are awaited)
+
+        def keep(agent_id: str, rep: dict) -> Any:
+            batched[agent_id] = rep
+            return self._client._typed(Reputation, rep)
+
+        async def one(agent_id: str) -> dict:
+            return await self.reputation(
+                agent_id,
+                refresh=refresh,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        fetched.update(
+            await self._client._batched(
+                REPUTATION_BATCH,
+                unique,
+                one,
+                max_concurrency,
+                timeout,
+                deadline,
+                keep,
+            )
+        )
+        if cache is not None:
+            for agent_id, rep in batched.items():
+                await cache.aset(agent_id, rep)
+        return [fetched[agent_id] for agent_id in ids]
+
+    async def rate(
+        self,
+        agent_id: str,
+        deal_nonce: str,
+        rater_address: str,
+        score: int,
+        comment: str = "",
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = await self._client._post(
+            f"/api/v1/agents/{agent_id}/rate",
+            {
+                "dealNonce": deal_nonce,
+                "raterAddress": rater_address,
+                "score": score,
+                "comment": comment,
+            },
+            timeout=timeout,
+            deadline=deadline,
+        )
+        if self._client._reputation_cache is not None:
+            await self._client._reputation_cache.ainvalidate(agent_id)
+        return res
+
+    async def vouch(
+        self,
+        vouchee_agent_id: str,
+        voucher_agent_id: str,
+        voucher_wallet: str,
+        signature: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return await self._client._post(
+            f"/api/v1/agents/{vouchee_agent_id}/vouch",
+            {
+                "voucherAgentId": voucher_agent_id,
+                "voucherWallet": voucher_wallet,
+                "signature": signature,
+            },
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    async def vouches(
+        self,
+        agent_id: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return await self._client._get(
+            f"/api/v1/agents/{agent_id}/vouches",
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+
+@dataclass
+class AsyncDealNamespace:
+    """Deal-related operations."""
+
+    _client: "AsyncMaldoClient"
+
+    async def create(
+        self,
+        agent_id: str,
+        client_address: str,
+        price_usdc: int,
+        task_description: str,
+        principal: Optional[str] = None,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> dict:
+        body: dict[str, Any] = {
+            "agentId": agent_id,
+            "clientAddress": client_address,
+            "priceUSDC": price_usdc,
+            "taskDescription": task_description,
+        }
+        if principal:
+            body["principal"] = principal
+        return await self._client._post(
+            "/api/v1/deals/create",
+            body,
+            timeout=timeout,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+
+    async def create_many(
+        self,
+        specs: Iterable[Union[DealSpec, dict]],
+        *,
+        max_concurrency: Optional[int] = None,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> list[BatchResult]:
+        """
+        Create many deals, returned in input order.
+
+        Specs are DealSpecs or dicts of deals.create arguments. Creations run
+        in parallel under the client's adaptive concurrency limit (see
+        `adaptive_concurrency`), capped by `max_concurrency`. Each
+        BatchResult's key is its spec as passed; values are the deals.create
+        responses (nonce or pendingApprovalId, requiresHumanApproval). A spec
+        that is not a valid DealSpec fails its own result with the TypeError.
+
+        Like deals.create, a spec's creation is only retried when it has an
+        idempotency_key (see new_idempotency_key). A retry is only safe if the
+        server deduplicates requests by that key; the Maldo server does not
+        yet, so after a timeout a retried or resubmitted spec may create and
+        fund a second deal. Check deals.list before resubmitting failures.
+        """
+        async def one(spec: Union[DealSpec, dict]) -> dict:
+            spec = DealSpec.coerce(spec)
+            return await self.create(
+                spec.agent_id,
+                spec.client_address,
+                spec.price_usdc,
+                spec.task_description,
+                spec.principal,
+                timeout=timeout,
+                deadline=deadline,
+                idempotency_key=spec.idempotency_key,
+            )
+
+        return await self._client._map(one, list(specs), max_concurrency)
+
+    async def status(
+        self,
+        nonce: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = await self._client._get(
+            f"/api/v1/deals/{nonce}/status",
+            timeout=timeout,
+            deadline=deadline,
+        )
+        return self._client._typed(Deal, res)
+
+    async def status_many(
+        self,
+        nonces: Iterable[str],
+        *,
+        changed_only: bool = True,
+        max_concurrency: Optional[int] = None,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> list[BatchResult]:
+        """
+        Fetch the status of many deals and report what changed.
+
+        The client remembers the last status it fetched for each nonce.
+        With changed_only (the default), only deals whose status differs
+        from that one are returned (a nonce seen for the first time counts
+        as changed), plus any that failed to fetch, in input order; a
+        reconciler polling its open deals then only handles the changes.
+        changed_only=False returns a result for every nonce.
+
+        Uses POST /api/v1/deals/status/batch when the server provides it
+        and otherwise falls back to parallel single GETs, as reputation_many.
+        """
+        results = await self._statuses(nonces, max_concurrency, timeout, deadline)
+        last = self._client._deal_statuses
+        changed = []
+        for result in results:
+            if not result.ok:
+                changed.append(result)
+                continue
+            status = result.value.get("status")
+            if last.get(result.key, UNSEEN) != status:
+                changed.append(result)
+            last[result.key] = status
+            last.move_to_end(result.key)
+        while len(last) > DEAL_STATUS_MEMORY:
+            last.popitem(last=False)
+        return changed if changed_only else results
+
+    async def _statuses(
+        self,
+        nonces: Iterable[str],
+        max_concurrency: Optional[int],
+        timeout: TimeoutLike,
+        deadline: Optional[Deadline],
+    ) -> list[BatchResult]:
+        ids = list(nonces)
+
+        async def one(nonce: str) -> dict:
+            return await self.status(nonce, timeout=timeout, deadline=deadline)
+
+        fetched = await self._client._batched(
+            DEAL_STATUS_BATCH,
+            ids,
+            one,
+            max_concurrency,
+            timeout,
+            deadline,
+            lambda nonce, status: self._client._typed(Deal, status),
+        )
+        return [fetched[nonce] for nonce in ids]
+
+    async def delivery(
+        self,
+        nonce: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return await self._client._get(
+            f"/api/v1/deals/{nonce}/delivery",
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    def events(
+        self,
+        wallet: Optional[str] = None,
+        *,
+        last_event_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncEventStream:
+        """Subscribe to the deal event stream, optionally filtered by wallet."""
+        return AsyncEventStream(
+            self._client,
+            wallet=wallet,
+            last_event_id=last_event_id,
+            deadline=deadline,
+        )
+
+    def watcher(self, wallet: Optional[str] = None) -> AsyncDealWatcher:
+        """
+        The client's shared AsyncDealWatcher for `wallet`: one event subscription
+        serving every deal watched through it. A closed watcher is replaced
+        by a new one.
+        """
+        watcher = self._client._watchers.get(wallet)
+        if watcher is None or watcher.closed:
+            watcher = self._client._watchers[wallet] = AsyncDealWatcher(self._client, wallet=wallet)
+        return watcher
+
+    async def approve(
+        self,
+        approval_id: int,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return await self._client._post(
+            f"/api/v1/deals/approve/{approval_id}",
+            {},
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    async def reject(
+        self,
+        approval_id: int,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return await self._client._post(
+            f"/api/v1/deals/reject/{approval_id}",
+            {},
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    async def pending(
+        self,
+        principal: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return await self._client._get(
+            f"/api/v1/deals/pending/{principal}",
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    async def list(
+        self,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = await self._client._get("/api/v1/deals", timeout=timeout, deadline=deadline)
+        return self._client._typed_items(Deal, res, "deals")
+
+    def iter_deals(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+        stream: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield deals one at a time, fetching `page_size` per request
+        and the next page in the background (unless `prefetch` is False).
+
+        With `stream=True` each page is decoded incrementally and items are
+        yielded while it is still downloading; pages are then fetched one
+        after another.
+        """
+        if stream:
+            pages = aiter_streamed_pages(
+                lambda params: self._client._stream(
+                    "/api/v1/deals",
+                    "deals",
+                    params=params,
+                    timeout=timeout,
+                    deadline=deadline,
+                ),
+                "deals",
+                page_size,
+            )
+            return self._client._typed_iter(Deal, pages)
+
+        async def fetch(params: dict) -> dict:
+            return await self._client._get(
+                "/api/v1/deals",
+                params=params,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        return self._client._typed_iter(Deal, aiter_pages(fetch, "deals", page_size, prefetch))
+
+
+@dataclass
+class AsyncCriteriaNamespace:
+    """Criteria (trust boundary) operations."""
+
+    _client: "AsyncMaldoClient"
+
+    async def get(
+        self,
+        principal: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return await self._client._get(
+            f"/api/v1/principals/{principal}/criteria",
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    async def apply_preset(
+        self,
+        principal: str,
+        preset: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = await self._client._put(
+            f"/api/v1/principals/{principal}/criteria",
+            {"preset": preset},
+            timeout=timeout,
+            deadline=deadline,
+        )
+        evaluator = self._client._evaluators.get(principal.lower())
+        if evaluator is not None:
+            evaluator.criteria = Criteria.from_dict(res)
+        return res
+
+    async def evaluate(
+        self,
+        principal: str,
+        agent_id: str,
+        price: int,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = await self._client._post(
+            "/api/v1/criteria/evaluate",
+            {"principal": principal, "agentId": agent_id, "price": price},
+            timeout=timeout,
+            deadline=deadline,
+        )
+        return self._client._typed(CriteriaEvaluation, res)
+
+    async def evaluator(
+        self,
+        principal: str,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> CriteriaEvaluator:
+        """
+        Local evaluator for `principal`'s criteria (see maldo.criteria).
+
+        The criteria are fetched once per client and kept; refresh=True
+        fetches them again. apply_preset through this client updates them.
+        """
+        key = principal.lower()
+        evaluator = self._client._evaluators.get(key)
+        if evaluator is None or refresh:
+            criteria = Criteria.from_dict(
+                await self.get(principal, timeout=timeout, deadline=deadline)
+            )
+            evaluator = self._client._evaluators.get(key)
+            if evaluator is None:
+                evaluator = self._client._evaluators[key] = CriteriaEvaluator(criteria)
+            else:
+                evaluator.criteria = criteria
+        return evaluator
+
+    async def evaluate_local(
+        self,
+        principal: str,
+        agent_id: str,
+        price: int,
+        *,
+        reputation: Optional[dict] = None,
+        verify: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """
+        Same result as evaluate(), computed in-process from the principal's
+        cached criteria and `reputation` (fetched when not given).
+
+        With verify=True the server evaluates the deal as well: a differing
+        result is recorded in the evaluator's `drift` and the server's
+        result is returned.
+        """
+        evaluator = await self.evaluator(principal, timeout=timeout, deadline=deadline)
+        if reputation is None and not evaluator.criteria.require_human_approval:
+            reputation = await self._client.agents.reputation(
+                agent_id,
+                timeout=timeout,
+                deadline=deadline,
+            )
+        result = evaluator.evaluate(reputation, price)
+        if verify:
+            server = await self.evaluate(
+                principal,
+                agent_id,
+                price,
+                timeout=timeout,
+                deadline=deadline,
+            )
+            evaluator.record(agent_id, price, result, server)
+            return server
+        return self._client._typed(CriteriaEvaluation, result)
+
+
+@dataclass
+class AsyncX402Namespace:
+    """x402 web-native payment path."""
+
+    _client: "AsyncMaldoClient"
+
+    async def get_requirements(
+        self,
+        capability: str,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """
+        Get payment requirements (returns 402 response body).
+
+        Served from the client's requirements cache when fresh; pass
+        refresh=True to bypass it.
+        """
+        cache = self._client._requirements_cache
+        if cache is not None and not refresh:
+            cached = await cache.aget(capability)
+            if cached is not None:
+                return self._client._typed(X402Requirements, cached)
+        reqs = await self._client._get(
+            f"/x402/services/{capability}",
+            accept=(402,),
+            timeout=timeout,
+            deadline=deadline,
+        )
+        if cache is not None and "requirements" in reqs:
+            await cache.aset(capability, reqs)
+        return self._client._typed(X402Requirements, reqs)
+
+    async def invalidate(self, capability: Optional[str] = None) -> None:
+        """Drop cached requirements for one capability, or all of them."""
+        cache = self._client._requirements_cache
+        if cache is None:
+            return
+        if capability is None:
+            await cache.aclear()
+        else:
+            await cache.ainvalidate(capability)
+
+    async def request(
+        self,
+        capability: str,
+        task_description: str,
+        client_address: str,
+        max_price: Optional[int] = None,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> dict:
+        # Check requirements first (usually cached); all hops share the caller's deadline
+        reqs = await self.get_requirements(capability, timeout=timeout, deadline=deadline)
+        check_max_price(reqs, max_price)
+
+        body = {
+            "taskDescription": task_description,
+            "clientAddress": client_address,
+        }
+        res = await self._client._post(
+            f"/x402/services/{capability}",
+            body,
+            timeout=timeout,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+        if not res.get("paymentRequired"):
+            return res
+
+        # Payment rejected: the cached amount is stale. Re-check the price
+        # against fresh requirements (carried by the 402 body when present)
+        # and submit once more.
+        await self.invalidate(capability)
+        if "requirements" in res:
+            reqs = res
+            if self._client._requirements_cache is not None:
+                await self._client._requirements_cache.aset(capability, reqs)
+        else:
+            reqs = await self.get_requirements(
+                capability,
+                refresh=True,
+                timeout=timeout,
+                deadline=deadline,
+            )
+        check_max_price(reqs, max_price)
+        return await self._client._post(
+            f"/x402/services/{capability}",
+            body,
+            timeout=timeout,
+            deadline=deadline,
+            # A new submission, not a replay of the rejected one
+            idempotency_key=f"{idempotency_key}:repriced" if idempotency_key else None,
+        )
+
+    async def poll_result(
+        self,
+        nonce: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return await self._client._get(
+            f"/x402/deals/{nonce}/result",
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    async def wait_for_delivery(
+        self,
+        nonce: str,
+        *,
+        max_wait: float = 60.0,
+        poll_interval: float = 2.0,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """
+        Wait until the deal's work is delivered and return its delivery record.
+
+        The delivery is checked once up front, then on the deal event stream
+        instead of polling: it is re-checked after every (re)connect, so
+        deliveries made during a reconnect gap are not missed. While the
+        stream is unavailable (the server answers 503 without a webhook
+        service) the delivery is polled every `poll_interval` seconds
+        instead. Raises MaldoTimeoutError after `max_wait` seconds (or at
+        `deadline`).
+        """
+        deadline = deadline or Deadline(max_wait)
+        delivery = await self._client.deals.delivery(nonce, deadline=deadline)
+        if is_delivered(delivery):
+            return delivery
+        stream = AsyncEventStream(
+            self._client,
+            deadline=deadline,
+            retry_delay=min(1.0, poll_interval),
+            max_retry_delay=poll_interval,
+            report_gaps=True,
+        )
+        async with stream:
+            async for event in stream:
+                if event.type in ("connected", DISCONNECTED) or (
+                    event.nonce == nonce and event.type in DELIVERY_EVENTS
+                ):
+                    delivery = await self._client.deals.delivery(nonce, deadline=deadline)
+                    if is_delivered(delivery):
+                        return delivery
+        raise MaldoTimeoutError(f"Deal {nonce} not delivered")
+
+
+class AsyncMaldoClient:
+    """
+    Async Maldo SDK client for agents running inside an asyncio event loop.
+
+    Usage:
+        async with AsyncMaldoClient(api_url="http://localhost:3000") as client:
+            agents = await client.agents.discover(capability="market-analysis")
+
+    All namespaces share one aiohttp session whose connector is sized by
+    `pool`, so a single process can keep many requests in flight over a
+    bounded set of keep-alive connections. The session is created lazily on
+    first use, inside the running loop. A caller-supplied `session` is used
+    as-is and is not closed by the client.
+
+    `timeout`, the caches and the per-call `timeout=` / `deadline=` options
+    behave as in MaldoClient; a deadline additionally caps the total time of
+    each hop.
+
+    `retry`, `circuit_breaker`, `rate_limit`, `adaptive_concurrency`,
+    `coalesce`, `conditional_get`, `codec` and `typed` also match
+    MaldoClient.
+    Backoff and rate-limit waits use asyncio.sleep, and a cache's disk tier
+    (CacheConfig.path) is read and written on a worker thread, so neither
+    blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        api_url: str = "http://localhost:3000",
+        pool: Optional[PoolConfig] = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+        timeout: TimeoutLike = Timeout(),
+        requirements_cache: Optional[CacheConfig] = CacheConfig(),
+        discovery_cache: Optional[CacheConfig] = None,
+        agents_cache: Optional[CacheConfig] = None,
+        reputation_cache: Optional[CacheConfig] = None,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        circuit_breaker: Optional[CircuitBreakerConfig] = CircuitBreakerConfig(),
+        rate_limit: Optional[RateLimitConfig] = None,
+        adaptive_concurrency: Optional[AdaptiveConcurrencyConfig] = AdaptiveConcurrencyConfig(),
+        coalesce: bool = False,
+        conditional_get: bool = False,
+        codec: CodecLike = "auto",
+        typed: bool = False,
+    ):
+        if aiohttp is None:
+            raise ImportError("AsyncMaldoClient requires aiohttp: pip install aiohttp")
+        self.base_url = api_url.rstrip("/")
+        self.pool = pool or PoolConfig()
+        self.timeout = Timeout.coerce(timeout)
+        self._codec = get_codec(codec)
+        self.typed = typed
+        self._requirements_cache = self._cache(requirements_cache, "requirements")
+        self._discovery_cache = self._cache(discovery_cache, "discovery")
+        self._agents_cache = self._cache(agents_cache, "agents")
+        self._reputation_cache = self._cache(reputation_cache, "reputation")
+        self._responses = ResponseStore() if conditional_get else None
+        self._retrier = Retrier(retry) if retry is not None else None
+        self._breakers = CircuitBreakers.from_config(circuit_breaker)
+        self._limiter = RateLimiter.from_config(rate_limit)
+        self._concurrency = AdaptiveLimiter.from_config(adaptive_concurrency)
+        self._flights = AsyncSingleFlight() if coalesce else None
+        self._unsupported: set[str] = set()  # optional endpoints the server lacks
+        self._evaluators: dict[str, CriteriaEvaluator] = {}  # by lowercased principal
+        self._deal_statuses: OrderedDict[str, Optional[str]] = OrderedDict()  # for status_many
+        self._watchers: dict[Optional[str], AsyncDealWatcher] = {}
+        self._session = session
+        self._owned = session is None
+        self._tasks: set[asyncio.Task] = set()
+        self.agents = AsyncAgentNamespace(_client=self)
+        self.deals = AsyncDealNamespace(_client=self)
+        self.criteria = AsyncCriteriaNamespace(_client=self)
+        self.x402 = AsyncX402Namespace(_client=self)
+
+    async def __aenter__(self) -> "AsyncMaldoClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        for watcher in self._watchers.values():
+            watcher.close()
+        self._watchers.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._owned and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _cache(self, config: Optional[CacheConfig], name: str) -> Optional[TTLCache]:
+        # Same on-disk namespaces as MaldoClient, so both share a cache file
+        return TTLCache.from_config(config, f"{self.base_url} {name}")
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """Hit/miss counters of the client's enabled caches, by name."""
+        caches = {
+            "requirements": self._requirements_cache,
+            "discovery": self._discovery_cache,
+            "agents": self._agents_cache,
+            "reputation": self._reputation_cache,
+            "conditional": self._responses,
+        }
+        return {name: cache.stats for name, cache in caches.items() if cache is not None}
+
+    def circuit_stats(self) -> dict[str, CircuitStats]:
+        """State and counters of each route group's circuit breaker (empty if disabled)."""
+        return self._breakers.stats() if self._breakers is not None else {}
+
+    def concurrency_stats(self) -> Optional[ConcurrencyStats]:
+        """Current adaptive in-flight limit of batch calls (None if disabled)."""
+        return self._concurrency.stats if self._concurrency is not None else None
+
+    def coalesce_stats(self) -> dict[str, FlightStats]:
+        """Calls sent vs. callers served by a shared call, per GET path + query."""
+        return self._flights.stats() if self._flights is not None else {}
+
+    def _spawn(self, coro) -> None:
+        """Run a background coroutine, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def health(
+        self,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return await self._get("/health", timeout=timeout, deadline=deadline)
+
+    def _http(self) -> "aiohttp.ClientSession":
+        if self._session is None or (self._owned and self._session.closed):
+            keep_alive = self.pool.keep_alive and self.pool.idle_timeout > 0
+            connector = aiohttp.TCPConnector(
+                limit=self.pool.pool_size,
+                limit_per_host=self.pool.max_per_host,
+                force_close=not keep_alive,
+                **({"keepalive_timeout": self.pool.idle_timeout} if keep_alive else {}),
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _get(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        accept: tuple[int, ...] = (),
+        **opts,
+    ) -> dict:
+        if self._flights is None or accept:
+            return await self._request("GET", path, params=params, accept=accept, **opts)
+        return await self._flights.do(
+            flight_key(path, params),
+            lambda: self._request("GET", path, params=params, accept=accept, **opts),
+            opts.get("deadline"),
+        )
+
+    async def _post(self, path: str, body: dict, **opts) -> dict:
+        return await self._request("POST", path, body=body, accept=(402,), **opts)
+
+    async def _put(self, path: str, body: dict, **opts) -> dict:
+        return await self._request("PUT", path, body=body, **opts)
+
+    async def _delete(self, path: str, **opts) -> dict:
+        return await self._request("DELETE", path, **opts)
+
+    def _typed(self, model: type[Model], res: Any) -> Any:
+        return model.wrap(res) if self.typed else res
+
+    def _typed_items(self, model: type[Model], res: Any, key: str) -> Any:
+        return wrap_items(model, res, key) if self.typed else res
+
+    async def _typed_iter(self, model: type[Model], items: AsyncIterator) -> AsyncIterator:
+        async for item in items:
+            yield model.wrap(item) if self.typed else item
+
+    def _error_body(self, content_type: str, raw: bytes) -> dict:
+        """Decode a JSON error body; anything else (or malformed JSON) yields {}."""
+        if not content_type.startswith("application/json"):
+            return {}
+        try:
+            data = self._codec.loads(raw)
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    async def _map(
+        self,
+        fn: Callable,
+        items: Sequence[Any],
+        max_concurrency: Optional[int] = None,
+    ) -> list[BatchResult]:
+        """Fan `fn` out over `items` under the client's adaptive concurrency limit."""
+        return await amap_bounded(fn, items, self._fan_out(max_concurrency), self._concurrency)
+
+    def _start_map(
+        self,
+        fn: Callable,
+        items: Sequence[Any],
+        max_concurrency: Optional[int] = None,
+    ) -> list[asyncio.Task]:
+        """_map as one task per item, in item order; cancel the ones no longer needed."""
+        return astart_bounded(fn, items, self._fan_out(max_concurrency), self._concurrency)
+
+    def _fan_out(self, max_concurrency: Optional[int]) -> int:
+        if max_concurrency is None:
+            return self._concurrency.config.max_limit if self._concurrency else 8
+        return max_concurrency
+
+    async def _batched(
+        self,
+        endpoint: BatchEndpoint,
+        keys: Sequence[Any],
+        one: Callable,
+        max_concurrency: Optional[int],
+        timeout: TimeoutLike,
+        deadline: Optional[Deadline],
+        value: Callable[[Any, dict], Any],
+    ) -> dict[Any, BatchResult]:
+        """afetch_batched over this client's POST and _map."""
+
+        async def post(path: str, body: dict) -> Any:
+            return await self._post(path, body, timeout=timeout, deadline=deadline)
+
+        async def each(missing: Sequence[Any]) -> list[BatchResult]:
+            return await self._map(one, missing, max_concurrency)
+
+        return await afetch_batched(endpoint, keys, post, each, self._unsupported, value)
+
+    def _timeout_for(
+        self,
+        timeout: TimeoutLike,
+        deadline: Optional[Deadline],
+    ) -> "aiohttp.ClientTimeout":
+        resolved = self.timeout if timeout is None else Timeout.coerce(timeout)
+        if deadline is not None:
+            resolved = deadline.bound(resolved)
+        return aiohttp.ClientTimeout(
+            total=deadline.remaining() if deadline is not None else None,
+            sock_connect=resolved.connect,
+            sock_read=resolved.read,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        body: Optional[dict] = None,
+        accept: tuple[int, ...] = (),
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> dict:
+        """
+        Send a request, retrying transient failures per the client's
+        RetryPolicy. Non-2xx responses not listed in `accept` raise
+        MaldoApiError.
+        """
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else {}
+        idempotent = method in IDEMPOTENT_METHODS or idempotency_key is not None
+        if self._retrier is not None:
+            self._retrier.record_request()
+        attempt = 1
+        while True:
+            try:
+                return await self._send(
+                    method,
+                    path,
+                    params,
+                    body,
+                    accept,
+                    timeout,
+                    deadline,
+                    headers,
+                )
+            except MaldoApiError as e:
+                delay = None
+                if self._retrier is not None:
+                    delay = self._retrier.next_delay(e, attempt, idempotent, deadline)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict],
+        body: Optional[dict],
+        accept: tuple[int, ...],
+        timeout: TimeoutLike,
+        deadline: Optional[Deadline],
+        headers: dict,
+    ) -> dict:
+        """Send one attempt."""
+        if self._limiter is not None:
+            await self._limiter.aacquire(path, deadline)
+        bounded = self._timeout_for(timeout, deadline)
+        if body is not None:
+            headers = {**headers, "Content-Type": "application/json"}
+        key = stored = None
+        if method == "GET" and self._responses is not None:
+            key = flight_key(path, params)
+            stored = self._responses.get(key)
+            if stored is not None:
+                headers = {**headers, **stored.conditional_headers()}
+        breaker = self._breakers.for_path(path) if self._breakers is not None else None
+        if breaker is not None:
+            breaker.acquire()
+        failed = True
+        try:
+            async with self._http().request(
+                method,
+                f"{self.base_url}{path}",
+                params=params,
+                data=self._codec.dumps(body) if body is not None else None,
+                headers=headers,
+                timeout=bounded,
+            ) as res:
+                failed = res.status >= 500
+                if res.status == 304 and stored is not None:
+                    return self._responses.not_modified(key, stored)
+                if res.status >= 400 and res.status not in accept:
+                    data = self._error_body(res.content_type, await res.read())
+                    raise MaldoApiError(
+                        res.status,
+                        data.get("error", res.reason),
+                        retry_after=parse_retry_after(res.headers.get("Retry-After")),
+                    )
+                data = self._codec.loads(await res.read())
+                if key is not None and res.status == 200:
+                    self._responses.store(
+                        key,
+                        res.headers.get("ETag"),
+                        res.headers.get("Last-Modified"),
+                        data,
+                    )
+                return data
+        except asyncio.TimeoutError as e:
+            raise MaldoTimeoutError(f"{method} {path} timed out") from e
+        except aiohttp.ClientConnectionError as e:
+            raise MaldoConnectionError(f"{method} {path} failed: {e}") from e
+        finally:
+            if breaker is not None:
+                breaker.record(failed)
+
+    def _stream(
+        self,
+        path: str,
+        key: str,
+        params: Optional[dict] = None,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncJSONArrayStream:
+        """Async counterpart of MaldoClient._stream."""
+        return AsyncJSONArrayStream(self._stream_chunks(path, params, timeout, deadline), key)
+
+    async def _stream_chunks(
+        self,
+        path: str,
+        params: Optional[dict],
+        timeout: TimeoutLike,
+        deadline: Optional[Deadline],
+    ) -> AsyncIterator[bytes]:
+        if self._limiter is not None:
+            await self._limiter.aacquire(path, deadline)
+        bounded = self._timeout_for(timeout, deadline)
+        breaker = self._breakers.for_path(path) if self._breakers is not None else None
+        if breaker is not None:
+            breaker.acquire()
+        try:
+            async with self._http().get(
+                f"{self.base_url}{path}",
+                params=params,
+                timeout=bounded,
+            ) as res:
+                if breaker is not None:
+                    breaker.record(res.status >= 500)
+                    breaker = None
+                if res.status >= 400:
+                    data = self._error_body(res.content_type, await res.read())
+                    raise MaldoApiError(
+                        res.status,
+                        data.get("error", res.reason),
+                        retry_after=parse_retry_after(res.headers.get("Retry-After")),
+                    )
+                async for chunk in res.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    yield chunk
+        except asyncio.TimeoutError as e:
+            raise MaldoTimeoutError(f"GET {path} timed out") from e
+        except aiohttp.ClientError as e:
+            raise MaldoConnectionError(f"GET {path} failed: {e}") from e
+        finally:
+            if breaker is not None:
+                breaker.record(True)  # no response
@@ -0,0 +1,258 @@
+"""
+Maldo SDK batch helpers
+
+Bounded fan-out used by the *_many namespace methods. Every input item gets
+its own BatchResult, in input order, so one failure never sinks the batch.
+With an AdaptiveLimiter the in-flight count additionally follows the
+limiter's AIMD limit, shared by every batch of the same client.
+
+fetch_batched / afetch_batched use a server batch endpoint when there is
+one and fall back to per-item calls for whatever it did not answer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional, Sequence, Union
+
+from maldo.concurrency import AdaptiveLimiter
+from maldo.errors import MaldoApiError
+
+# Statuses meaning "the server has no batch endpoint here"
+BATCH_UNSUPPORTED = (404, 405, 501)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one item of a batch call."""
+
+    key: Any
+    value: Optional[dict] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class DealSpec:
+    """One deal for deals.create_many; fields as the arguments of deals.create."""
+
+    agent_id: str
+    client_address: str
+    price_usdc: int
+    task_description: str
+    principal: Optional[str] = None
+    idempotency_key: Optional[str] = None
+
+    @classmethod
+    def coerce(cls, spec: Union["DealSpec", dict]) -> "DealSpec":
+        if isinstance(spec, cls):
+            return spec
+        if isinstance(spec, dict):
+            return cls(**spec)
+        raise TypeError(f"expected a DealSpec or dict, got {type(spec).__name__}")
+
+
+def _limited(fn: Callable[[Any], dict], limiter: Optional[AdaptiveLimiter]) -> Callable:
+    def call(item: Any) -> BatchResult:
+        try:
+            return BatchResult(item, value=fn(item))
+        except Exception as e:
+            return BatchResult(item, error=e)
+
+    def run(item: Any) -> BatchResult:
+        if limiter is None:
+            return call(item)
+        started = limiter.acquire()
+        result = call(item)
+        limiter.release(started, result.error)
+        return result
+
+    return run
+
+
+def map_bounded(
+    fn: Callable[[Any], dict],
+    items: Sequence[Any],
+    max_concurrency: int = 8,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> list[BatchResult]:
+    """Call fn for every item on at most `max_concurrency` threads."""
+    run = _limited(fn, limiter)
+    if not items:
+        return []
+    workers = max(1, min(max_concurrency, len(items)))
+    if workers == 1:
+        return [run(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run, items))
+
+
+def iter_bounded(
+    fn: Callable[[Any], dict],
+    items: Sequence[Any],
+    max_concurrency: int = 8,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> Iterator[BatchResult]:
+    """
+    map_bounded, lazily: yield the results in item order as they complete.
+    Closing the iterator early cancels the calls not yet started.
+    """
+    run = _limited(fn, limiter)
+    if not items:
+        return
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(items))))
+    try:
+        for future in [pool.submit(run, item) for item in items]:
+            yield future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def amap_bounded(
+    fn: Callable[[Any], Awaitable[dict]],
+    items: Sequence[Any],
+    max_concurrency: int = 8,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> list[BatchResult]:
+    """Await fn for every item with at most `max_concurrency` in flight."""
+    return list(await asyncio.gather(*astart_bounded(fn, items, max_concurrency, limiter)))
+
+
+def astart_bounded(
+    fn: Callable[[Any], Awaitable[dict]],
+    items: Sequence[Any],
+    max_concurrency: int = 8,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> list[asyncio.Task]:
+    """
+    Start fn for every item as a task, with at most `max_concurrency` in
+    flight; the tasks resolve to BatchResults, in item order. Cancelling a
+    task that has not started yet keeps its call from being made.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def call(item: Any) -> BatchResult:
+        try:
+            return BatchResult(item, value=await fn(item))
+        except Exception as e:
+            return BatchResult(item, error=e)
+
+    async def run(item: Any) -> BatchResult:
+        async with semaphore:
+            if limiter is None:
+                return await call(item)
+            started = await limiter.aacquire()
+            try:
+                result = await call(item)
+            except BaseException:
+                limiter.release(started)  # cancelled: free the slot
+                raise
+            limiter.release(started, result.error)
+            return result
+
+    return [asyncio.ensure_future(run(item)) for item in items]
+
+
+@dataclass(frozen=True)
+class BatchEndpoint:
+    """
+    A server batch endpoint: POST `path` with {request_field: [keys]}
+    answers {response_field: [items]}, each item naming its key in
+    `key_field`. Keys missing from the answer fail with `not_found`.
+    """
+
+    path: str
+    request_field: str
+    response_field: str
+    key_field: str
+    not_found: str = "Not found"
+
+
+def _batch_items(
+    endpoint: BatchEndpoint,
+    keys: list,
+    res: Any,
+    value: Callable[[Any, dict], Any],
+) -> dict[Any, BatchResult]:
+    by_key = {item.get(endpoint.key_field): item for item in res[endpoint.response_field]}
+    fetched = {}
+    for key in keys:
+        item = by_key.get(key)
+        fetched[key] = (
+            BatchResult(key, value=value(key, item))
+            if item is not None
+            else BatchResult(key, error=MaldoApiError(404, endpoint.not_found))
+        )
+    return fetched
+
+
+def _batch_failed(endpoint: BatchEndpoint, unsupported: set[str], error: MaldoApiError) -> None:
+    # Any batch failure falls back to per-item calls
+    if error.status in BATCH_UNSUPPORTED:
+        unsupported.add(endpoint.path)
+
+
+def fetch_batched(
+    endpoint: BatchEndpoint,
+    keys: Iterable[Any],
+    post: Callable[[str, dict], Any],
+    each: Callable[[Sequence[Any]], list[BatchResult]],
+    unsupported: set[str],
+    value: Callable[[Any, dict], Any] = lambda key, item: item,
+) -> dict[Any, BatchResult]:
+    """
+    BatchResults of the distinct `keys`, by key. The batch endpoint is tried
+    unless it is in `unsupported` (where it is added once the server shows
+    it lacks it); keys it did not answer go to `each`, the per-item fan-out.
+    Batch items are passed through value(key, item).
+    """
+    keys = list(dict.fromkeys(keys))
+    fetched: dict[Any, BatchResult] = {}
+    if keys and endpoint.path not in unsupported:
+        try:
+            res = post(endpoint.path, {endpoint.request_field: keys})
+        except MaldoApiError as e:
+            _batch_failed(endpoint, unsupported, e)
+        else:
+            if endpoint.response_field in res:
+                fetched = _batch_items(endpoint, keys, res, value)
+            else:
+                unsupported.add(endpoint.path)
+    missing = [key for key in keys if key not in fetched]
+    if missing:
+        for result in each(missing):
+            fetched[result.key] = result
+    return fetched
+
+
+async def afetch_batched(
+    endpoint: BatchEndpoint,
+    keys: Iterable[Any],
+    post: Callable[[str, dict], Awaitable[Any]],
+    each: Callable[[Sequence[Any]], Awaitable[list[BatchResult]]],
+    unsupported: set[str],
+    value: Callable[[Any, dict], Any] = lambda key, item: item,
+) -> dict[Any, BatchResult]:
+    """Async counterpart of fetch_batched."""
+    keys = list(dict.fromkeys(keys))
+    fetched: dict[Any, BatchResult] = {}
+    if keys and endpoint.path not in unsupported:
+        try:
+            res = await post(endpoint.path, {endpoint.request_field: keys})
+        except MaldoApiError as e:
+            _batch_failed(endpoint, unsupported, e)
+        else:
+            if endpoint.response_field in res:
+                fetched = _batch_items(endpoint, keys, res, value)
+            else:
+                unsupported.add(endpoint.path)
+    missing = [key for key in keys if key not in fetched]
+    if missing:
+        for result in await each(missing):
+            fetched[result.key] = result
+    return fetched
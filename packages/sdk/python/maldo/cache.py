@@ -0,0 +1,448 @@
+"""
+Maldo SDK caching
+
+In-memory, size-bounded LRU cache with per-entry expiry used by the client
+for slowly changing responses (x402 payment requirements, discovery
+results). Entries may also be served for a further `stale_ttl` seconds
+while the caller refreshes them in the background (stale-while-revalidate).
+With CacheConfig.path set, entries are also written through to a SQLite
+file (DiskCache) that every process on the host can share, so a restarted
+process starts warm; the async client reaches that file through the a*
+methods, which run the SQLite calls on a worker thread. ResponseStore keeps
+GET bodies with their ETag / Last-Modified validators for conditional
+requests. Cached payloads are shared between callers and should be treated
+as read-only.
+
+    client = MaldoClient(reputation_cache=CacheConfig(ttl=300, path="~/.cache/maldo.db"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+from maldo.codec import Codec, get_codec
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """
+    Cache settings.
+
+    ttl:        seconds an entry is served from memory as fresh
+    max_size:   entries kept before the least recently used one is evicted
+    stale_ttl:  further seconds an expired entry may be served while it is
+                refreshed in the background (0 disables)
+    path:       SQLite file the entries are also stored in, shared by every
+                process using it and kept across restarts (None: memory only)
+    disk_max_size: entries kept in that file before the oldest are evicted
+    """
+
+    ttl: float = 60.0
+    max_size: int = 256
+    stale_ttl: float = 0.0
+    path: Optional[str] = None
+    disk_max_size: int = 100_000
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    disk_hits: int = 0  # entries loaded from the disk tier
+
+
+class DiskCache:
+    """
+    Persistent cache tier in a SQLite file (WAL mode), safe to share between
+    threads and between processes on one host.
+
+    Entries are stored per `namespace` with their freshness and expiry as
+    wall-clock times. Expired entries, then the oldest ones beyond
+    `max_size`, are pruned every PRUNE_EVERY writes. Storage errors are
+    treated as misses, so a locked or unwritable file never fails a request.
+    """
+
+    PRUNE_EVERY = 64
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 100_000,
+        codec: Optional[Codec] = None,
+        busy_timeout: float = 5.0,
+    ):
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.max_size = max_size
+        self.busy_timeout = busy_timeout
+        self._codec = codec or get_codec()
+        self._local = threading.local()
+        self._writes = 0
+        self._connection()  # create the file and schema up front
+
+    def get(self, namespace: str, key: Hashable) -> Optional[tuple[float, Any]]:
+        """Return (fresh_until, value) for an unexpired entry, else None."""
+        try:
+            row = self._connection().execute(
+                "SELECT fresh_until, value FROM maldo_cache"
+                " WHERE namespace = ? AND key = ? AND expires > ?",
+                (namespace, _disk_key(key), time.time()),
+            ).fetchone()
+            return (row[0], self._codec.loads(row[1])) if row is not None else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def set(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        fresh_until: float,
+        expires: float,
+    ) -> None:
+        try:
+            data = self._codec.dumps(value)
+            self._connection().execute(
+                "INSERT OR REPLACE INTO maldo_cache"
+                " (namespace, key, value, fresh_until, expires, stored)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, _disk_key(key), data, fresh_until, expires, time.time()),
+            )
+        except (sqlite3.Error, TypeError, ValueError):
+            return
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            self.prune()
+
+    def delete(self, namespace: str, key: Hashable) -> None:
+        self._execute(
+            "DELETE FROM maldo_cache WHERE namespace = ? AND key = ?",
+            (namespace, _disk_key(key)),
+        )
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        if namespace is None:
+            self._execute("DELETE FROM maldo_cache", ())
+        else:
+            self._execute("DELETE FROM maldo_cache WHERE namespace = ?", (namespace,))
+
+    def prune(self) -> None:
+        """Drop expired entries, then the oldest ones beyond max_size."""
+        try:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM maldo_cache WHERE expires <= ?", (time.time(),))
+                (count,) = conn.execute("SELECT COUNT(*) FROM maldo_cache").fetchone()
+                if count > self.max_size:
+                    conn.execute(
+                        "DELETE FROM maldo_cache WHERE (namespace, key) IN"
+                        " (SELECT namespace, key FROM maldo_cache ORDER BY stored LIMIT ?)",
+                        (count - self.max_size,),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            pass
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM maldo_cache").fetchone()[0]
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        try:
+            self._connection().execute(sql, params)
+        except sqlite3.Error:
+            pass
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection, reopened in a forked child process."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            isolation_level=None,  # autocommit; prune() manages its transaction
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS maldo_cache ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " fresh_until REAL NOT NULL,"
+            " expires REAL NOT NULL,"
+            " stored REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key)"
+            ") WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS maldo_cache_stored ON maldo_cache (stored)")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+
+def _disk_key(key: Hashable) -> str:
+    return json.dumps(key, separators=(",", ":"), default=str)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire `ttl` seconds after being set.
+
+    With a DiskCache, entries are written through to it under `namespace`
+    and memory misses are looked up there. Async callers use aget, alookup,
+    aset, ainvalidate and aclear, which keep the disk tier off the event loop.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_size: int = 256,
+        stale_ttl: float = 0.0,
+        disk: Optional[DiskCache] = None,
+        namespace: str = "default",
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.stale_ttl = stale_ttl
+        self.disk = disk
+        self.namespace = namespace
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._refreshing: set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[CacheConfig],
+        namespace: str = "default",
+    ) -> Optional["TTLCache"]:
+        if config is None or config.ttl <= 0 or config.max_size <= 0:
+            return None
+        disk = DiskCache(config.path, config.disk_max_size) if config.path else None
+        return cls(
+            ttl=config.ttl,
+            max_size=config.max_size,
+            stale_ttl=config.stale_ttl,
+            disk=disk,
+            namespace=namespace,
+        )
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the entry for `key` if it is fresh."""
+        value, fresh = self.lookup(key, allow_stale=False)
+        return value
+
+    def lookup(self, key: Hashable, allow_stale: bool = True) -> tuple[Optional[Any], bool]:
+        """
+        Return (value, fresh). Within the stale window the value is returned
+        with fresh=False; the caller is expected to refresh it.
+        """
+        now = time.monotonic()
+        entry = self._memory(key, now)
+        if entry is None and self.disk is not None:
+            entry = self._load(key, now)
+        return self._found(key, entry, now, allow_stale)
+
+    async def aget(self, key: Hashable) -> Optional[Any]:
+        value, fresh = await self.alookup(key, allow_stale=False)
+        return value
+
+    async def alookup(self, key: Hashable, allow_stale: bool = True) -> tuple[Optional[Any], bool]:
+        now = time.monotonic()
+        entry = self._memory(key, now)
+        if entry is None and self.disk is not None:
+            entry = await asyncio.to_thread(self._load, key, now)
+        return self._found(key, entry, now, allow_stale)
+
+    def _memory(self, key: Hashable, now: float) -> Optional[tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] + self.stale_ttl <= now:
+                del self._entries[key]
+                entry = None
+            return entry
+
+    def _found(
+        self,
+        key: Hashable,
+        entry: Optional[tuple[float, Any]],
+        now: float,
+        allow_stale: bool,
+    ) -> tuple[Optional[Any], bool]:
+        with self._lock:
+            if entry is None or (entry[0] <= now and not allow_stale):
+                self.stats.misses += 1
+                return None, False
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            if entry[0] <= now:
+                self.stats.stale_hits += 1
+                return entry[1], False
+            self.stats.hits += 1
+            return entry[1], True
+
+    def _load(self, key: Hashable, now: float) -> Optional[tuple[float, Any]]:
+        """Copy `key` from the disk tier into memory, keeping its remaining lifetime."""
+        row = self.disk.get(self.namespace, key)
+        if row is None:
+            return None
+        fresh_until, value = row
+        entry = (now + fresh_until - time.time(), value)
+        if entry[0] + self.stale_ttl <= now:
+            return None
+        with self._lock:
+            self.stats.disk_hits += 1
+            self._put(key, entry)
+        return entry
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """Claim the background refresh of `key`; False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.stats.refreshes += 1
+            return True
+
+    def end_refresh(self, key: Hashable, failed: bool = False) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+            if failed:
+                self.stats.refresh_failures += 1
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._put(key, (time.monotonic() + self.ttl, value))
+        if self.disk is not None:
+            self._store(key, value)
+
+    async def aset(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._put(key, (time.monotonic() + self.ttl, value))
+        if self.disk is not None:
+            await asyncio.to_thread(self._store, key, value)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        fresh_until = time.time() + self.ttl
+        self.disk.set(self.namespace, key, value, fresh_until, fresh_until + self.stale_ttl)
+
+    def _put(self, key: Hashable, entry: tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk is not None:
+            self.disk.delete(self.namespace, key)
+
+    async def ainvalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.delete, self.namespace, key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.disk is not None:
+            self.disk.clear(self.namespace)
+
+    async def aclear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.clear, self.namespace)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class StoredResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: Any
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseStore:
+    """
+    Thread-safe LRU store of GET responses that carried validators.
+
+    Entries never expire: every use revalidates them with the server, which
+    answers 304 Not Modified when the stored body is still current. Hits
+    count 304s, misses count full responses.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, StoredResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[StoredResponse]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def not_modified(self, key: Hashable, stored: StoredResponse) -> Any:
+        """Record a 304 for `key` and return the stored body."""
+        with self._lock:
+            self.stats.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return stored.body
+
+    def store(
+        self,
+        key: Hashable,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: Any,
+    ) -> None:
+        with self._lock:
+            self.stats.misses += 1
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = StoredResponse(etag, last_modified, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,150 @@
+"""
+Maldo SDK circuit breakers
+
+One breaker per route group (services, agents, deals, criteria, x402). A
+breaker opens once the failure rate over a rolling window crosses a
+threshold, then fails calls fast with CircuitOpenError instead of letting
+them wait out timeouts against a degraded API. After a cool-down it
+half-opens and lets a few probe requests through; a successful probe closes
+it again, a failed one re-opens it.
+
+Only server-side failures count: timeouts, connection errors and 5xx
+responses. 4xx responses are the caller's problem and count as successes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from maldo.errors import CircuitOpenError
+from maldo.transport import ROUTE_GROUPS, route_group
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """
+    Circuit breaker settings, applied to every route group.
+
+    failure_rate:  fraction of failed calls in the window that opens the circuit
+    min_calls:     calls needed in the window before the rate is considered
+    window:        seconds of history the failure rate is computed over
+    open_for:      seconds an open circuit fails fast before half-opening
+    probes:        concurrent probe calls allowed while half-open
+    """
+
+    failure_rate: float = 0.5
+    min_calls: int = 20
+    window: float = 30.0
+    open_for: float = 15.0
+    probes: int = 1
+
+
+@dataclass
+class CircuitStats:
+    state: str = CLOSED
+    successes: int = 0
+    failures: int = 0
+    rejected: int = 0
+    opened: int = 0
+
+
+class CircuitBreaker:
+    """Thread-safe failure-rate circuit breaker for one route group."""
+
+    def __init__(self, name: str, config: CircuitBreakerConfig):
+        self.name = name
+        self.config = config
+        self.stats = CircuitStats()
+        self._calls: deque[tuple[float, bool]] = deque()  # (time, failed)
+        self._opened_at = 0.0
+        self._probing = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def acquire(self) -> None:
+        """Admit one call or raise CircuitOpenError; pair every admit with record()."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(now)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._probing < self.config.probes:
+                self._probing += 1
+                return
+            self.stats.rejected += 1
+            retry_in = max(0.0, self._opened_at + self.config.open_for - now)
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record(self, failed: bool) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if failed:
+                self.stats.failures += 1
+            else:
+                self.stats.successes += 1
+            if self._state(now) == HALF_OPEN:
+                self._probing = max(0, self._probing - 1)
+                if failed:
+                    self._open(now)
+                else:
+                    self._calls.clear()
+                    self.stats.state = CLOSED
+                return
+            if self.stats.state == OPEN:
+                return  # a call admitted before the circuit opened
+            self._calls.append((now, failed))
+            self._trim(now)
+            failures = sum(1 for _, f in self._calls if f)
+            if (
+                len(self._calls) >= self.config.min_calls
+                and failures / len(self._calls) >= self.config.failure_rate
+            ):
+                self._open(now)
+
+    def _state(self, now: float) -> str:
+        if self.stats.state == OPEN and now >= self._opened_at + self.config.open_for:
+            self.stats.state = HALF_OPEN
+            self._probing = 0
+        return self.stats.state
+
+    def _open(self, now: float) -> None:
+        self.stats.state = OPEN
+        self.stats.opened += 1
+        self._opened_at = now
+        self._calls.clear()
+
+    def _trim(self, now: float) -> None:
+        while self._calls and self._calls[0][0] <= now - self.config.window:
+            self._calls.popleft()
+
+
+class CircuitBreakers:
+    """The per-route-group breakers of one client."""
+
+    def __init__(self, config: CircuitBreakerConfig):
+        self.config = config
+        self._breakers = {group: CircuitBreaker(group, config) for group in ROUTE_GROUPS}
+
+    @classmethod
+    def from_config(cls, config: Optional[CircuitBreakerConfig]) -> Optional["CircuitBreakers"]:
+        return cls(config) if config is not None else None
+
+    def for_path(self, path: str) -> CircuitBreaker:
+        return self._breakers[route_group(path)]
+
+    def stats(self) -> dict[str, CircuitStats]:
+        for breaker in self._breakers.values():
+            breaker.state  # advance open -> half_open before reporting
+        return {group: breaker.stats for group, breaker in self._breakers.items()}
@@ -2,25 +2,58 @@
 Maldo Python SDK Client
 
 Wraps the Maldo REST API for Python agents.
-Supports both sync (requests) and async (aiohttp) usage.
+Supports both sync (requests) and async (aiohttp, see maldo.async_client) usage.
 """
 
 from __future__ import annotations
 
-import json
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Union
 
 import requests
 
-
-class MaldoApiError(Exception):
-    """Raised when the Maldo API returns an error."""
-
-    def __init__(self, status: int, message: str):
-        self.status = status
-        super().__init__(f"[{status}] {message}")
-
+from maldo._util import (
+    DEAL_STATUS_BATCH,
+    DEAL_STATUS_MEMORY,
+    REPUTATION_BATCH,
+    UNSEEN,
+    check_max_price,
+)
+from maldo.batch import (
+    BatchEndpoint,
+    BatchResult,
+    DealSpec,
+    fetch_batched,
+    iter_bounded,
+    map_bounded,
+)
+from maldo.cache import CacheConfig, CacheStats, ResponseStore, TTLCache
+from maldo.circuit import CircuitBreakerConfig, CircuitBreakers, CircuitStats
+from maldo.codec import CodecLike, get_codec
+from maldo.concurrency import AdaptiveConcurrencyConfig, AdaptiveLimiter, ConcurrencyStats
+from maldo.criteria import Criteria, CriteriaEvaluator
+from maldo.errors import MaldoApiError, MaldoConnectionError, MaldoTimeoutError
+from maldo.events import DELIVERY_EVENTS, DISCONNECTED, EventStream, is_delivered
+from maldo.models import (
+    Agent,
+    CriteriaEvaluation,
+    Deal,
+    Model,
+    Reputation,
+    X402Requirements,
+    wrap_items,
+)
+from maldo.paging import DEFAULT_PAGE_SIZE, iter_pages, iter_streamed_pages
+from maldo.ratelimit import RateLimitConfig, RateLimiter
+from maldo.retry import IDEMPOTENT_METHODS, Retrier, RetryPolicy, parse_retry_after
+from maldo.singleflight import FlightStats, SingleFlight, flight_key
+from maldo.streaming import STREAM_CHUNK_SIZE, JSONArrayStream
+from maldo.timeouts import Deadline, Timeout, TimeoutLike
+from maldo.transport import PoolConfig, PooledSession
+from maldo.watcher import DealWatcher
 
 @dataclass
 class AgentNamespace:
@@ -36,8 +69,11 @@ class AgentNamespace:
         description: str = "",
         base_price: int = 0,
         endpoint: str = "",
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
     ) -> dict:
-        return self._client._post(
+        res = self._client._post(
             "/api/v1/services/register",
             {
                 "name": name,
@@ -47,27 +83,224 @@ class AgentNamespace:
                 "endpoint": endpoint,
                 "wallet": wallet,
             },
+            timeout=timeout,
+            deadline=deadline,
         )
+        if self._client._agents_cache is not None:
+            self._client._agents_cache.invalidate("list")
+        return res
 
     def discover(
         self,
         capability: str,
         min_rep: Optional[int] = None,
         limit: int = 10,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
     ) -> dict:
+        """
+        Discover agents by capability, ranked by reputation.
+
+        When the client has a discovery cache, results are answered from
+        memory; entries in their stale window are returned immediately and
+        refreshed in a background thread. refresh=True bypasses the cache.
+        """
         params = {"capability": capability, "limit": str(limit)}
         if min_rep is not None:
             params["minRep"] = str(min_rep)
-        return self._client._get("/api/v1/services/discover", params=params)
+        cache = self._client._discovery_cache
+        key = (capability, min_rep, limit)
+        if cache is not None and not refresh:
+            cached, fresh = cache.lookup(key)
+            if cached is not None:
+                if not fresh and cache.begin_refresh(key):
+                    threading.Thread(
+                        target=self._refresh_discovery,
+                        args=(key, params),
+                        daemon=True,
+                    ).start()
+                return self._client._typed_items(Agent, cached, "agents")
+        res = self._client._get(
+            "/api/v1/services/discover",
+            params=params,
+            timeout=timeout,
+            deadline=deadline,
+        )
+        if cache is not None:
+            cache.set(key, res)
+        return self._client._typed_items(Agent, res, "agents")
+
+    def _refresh_discovery(self, key: tuple, params: dict) -> None:
+        cache = self._client._discovery_cache
+        failed = True
+        try:
+            cache.set(key, self._client._get("/api/v1/services/discover", params=params))
+            failed = False
+        except Exception:
+            pass  # keep serving the stale entry until its window closes
+        finally:
+            cache.end_refresh(key, failed=failed)
+
+    def get(
+        self,
+        agent_id: str,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        cache = self._client._agents_cache
+        key = ("agent", agent_id)
+        res = cache.get(key) if cache is not None and not refresh else None
+        if res is None:
+            res = self._client._get(
+                f"/api/v1/agents/{agent_id}",
+                timeout=timeout,
+                deadline=deadline,
+            )
+            if cache is not None:
+                cache.set(key, res)
+        return self._client._typed(Agent, res)
+
+    def list(
+        self,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """All registered agents; cached when the client has an agents cache."""
+        cache = self._client._agents_cache
+        res = cache.get("list") if cache is not None and not refresh else None
+        if res is None:
+            res = self._client._get("/api/v1/agents", timeout=timeout, deadline=deadline)
+            if cache is not None:
+                cache.set("list", res)
+        return self._client._typed_items(Agent, res, "agents")
+
+    def iter_agents(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+        stream: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[dict]:
+        """
+        Yield registered agents one at a time, fetching `page_size` per request
+        and the next page in the background (unless `prefetch` is False).
+
+        With `stream=True` each page is decoded incrementally and items are
+        yielded while it is still downloading; pages are then fetched one
+        after another.
+        """
+        if stream:
+            pages = iter_streamed_pages(
+                lambda params: self._client._stream(
+                    "/api/v1/agents",
+                    "agents",
+                    params=params,
+                    timeout=timeout,
+                    deadline=deadline,
+                ),
+                "agents",
+                page_size,
+            )
+            return self._client._typed_iter(Agent, pages)
+
+        def fetch(params: dict) -> dict:
+            return self._client._get(
+                "/api/v1/agents",
+                params=params,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        return self._client._typed_iter(Agent, iter_pages(fetch, "agents", page_size, prefetch))
+
+    def reputation(
+        self,
+        agent_id: str,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """An agent's reputation; cached when the client has a reputation cache."""
+        cache = self._client._reputation_cache
+        res = cache.get(agent_id) if cache is not None and not refresh else None
+        if res is None:
+            res = self._client._get(
+                f"/api/v1/agents/{agent_id}/reputation",
+                timeout=timeout,
+                deadline=deadline,
+            )
+            if cache is not None:
+                cache.set(agent_id, res)
+        return self._client._typed(Reputation, res)
+
+    def reputation_many(
+        self,
+        agent_ids: Iterable[str],
+        *,
+        refresh: bool = False,
+        max_concurrency: Optional[int] = None,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> list[BatchResult]:
+        """
+        Fetch reputations for many agents, returned in input order.
+
+        Reputations in the client's reputation cache are not fetched again
+        (unless `refresh`). The rest come from POST
+        /api/v1/agents/reputation/batch when the server provides it and
+        otherwise from parallel single GETs. Their concurrency adapts to the
+        server (see `adaptive_concurrency`), capped by `max_concurrency`.
+        Failures are reported per item.
+        """
+        ids = list(agent_ids)
+        unique = list(dict.fromkeys(ids))
+        fetched: dict[str, BatchResult] = {}
 
-    def get(self, agent_id: str) -> dict:
-        return self._client._get(f"/api/v1/agents/{agent_id}")
+        cache = self._client._reputation_cache
+        if cache is not None and not refresh:
+            for agent_id in unique:
+                rep = cache.get(agent_id)
+                if rep is not None:
+                    fetched[agent_id] = BatchResult(
+                        agent_id,
+                        value=self._client._typed(Reputation, rep),
+                    )
+            unique = [agent_id for agent_id in unique if agent_id not in fetched]
 
-    def list(self) -> dict:
-        return self._client._get("/api/v1/agents")
+        def keep(agent_id: str, rep: dict) -> Any:
+            if cache is not None:
+                cache.set(agent_id, rep)
+            return self._client._typed(Reputation, rep)
 
-    def reputation(self, agent_id: str) -> dict:
-        return self._client._get(f"/api/v1/agents/{agent_id}/reputation")
+        def one(agent_id: str) -> dict:
+            return self.reputation(
+                agent_id,
+                refresh=refresh,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        fetched.update(
+            self._client._batched(
+                REPUTATION_BATCH,
+                unique,
+                one,
+                max_concurrency,
+                timeout,
+                deadline,
+                keep,
+            )
+        )
+        return [fetched[agent_id] for agent_id in ids]
 
     def rate(
         self,
@@ -76,8 +309,11 @@ class AgentNamespace:
         rater_address: str,
         score: int,
         comment: str = "",
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
     ) -> dict:
-        return self._client._post(
+        res = self._client._post(
             f"/api/v1/agents/{agent_id}/rate",
             {
                 "dealNonce": deal_nonce,
@@ -85,7 +321,12 @@ class AgentNamespace:
                 "score": score,
                 "comment": comment,
             },
+            timeout=timeout,
+            deadline=deadline,
         )
+        if self._client._reputation_cache is not None:
+            self._client._reputation_cache.invalidate(agent_id)
+        return res
 
     def vouch(
         self,
@@ -93,6 +334,9 @@ class AgentNamespace:
         voucher_agent_id: str,
         voucher_wallet: str,
         signature: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
     ) -> dict:
         return self._client._post(
             f"/api/v1/agents/{vouchee_agent_id}/vouch",
@@ -101,10 +345,22 @@ class AgentNamespace:
                 "voucherWallet": voucher_wallet,
                 "signature": signature,
             },
+            timeout=timeout,
+            deadline=deadline,
         )
 
-    def vouches(self, agent_id: str) -> dict:
-        return self._client._get(f"/api/v1/agents/{agent_id}/vouches")
+    def vouches(
+        self,
+        agent_id: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return self._client._get(
+            f"/api/v1/agents/{agent_id}/vouches",
+            timeout=timeout,
+            deadline=deadline,
+        )
 
 
 @dataclass
@@ -120,6 +376,10 @@ class DealNamespace:
         price_usdc: int,
         task_description: str,
         principal: Optional[str] = None,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
     ) -> dict:
         body: dict[str, Any] = {
             "agentId": agent_id,
@@ -129,22 +389,257 @@ class DealNamespace:
         }
         if principal:
             body["principal"] = principal
-        return self._client._post("/api/v1/deals/create", body)
+        return self._client._post(
+            "/api/v1/deals/create",
+            body,
+            timeout=timeout,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+
+    def create_many(
+        self,
+        specs: Iterable[Union[DealSpec, dict]],
+        *,
+        max_concurrency: Optional[int] = None,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> list[BatchResult]:
+        """
+        Create many deals, returned in input order.
 
-    def status(self, nonce: str) -> dict:
-        return self._client._get(f"/api/v1/deals/{nonce}/status")
+        Specs are DealSpecs or dicts of deals.create arguments. Creations run
+        in parallel under the client's adaptive concurrency limit (see
+        `adaptive_concurrency`), capped by `max_concurrency`. Each
+        BatchResult's key is its spec as passed; values are the deals.create
+        responses (nonce or pendingApprovalId, requiresHumanApproval). A spec
+        that is not a valid DealSpec fails its own result with the TypeError.
 
-    def approve(self, approval_id: int) -> dict:
-        return self._client._post(f"/api/v1/deals/approve/{approval_id}", {})
+        Like deals.create, a spec's creation is only retried when it has an
+        idempotency_key (see new_idempotency_key). A retry is only safe if the
+        server deduplicates requests by that key; the Maldo server does not
+        yet, so after a timeout a retried or resubmitted spec may create and
+        fund a second deal. Check deals.list before resubmitting failures.
+        """
+        def one(spec: Union[DealSpec, dict]) -> dict:
+            spec = DealSpec.coerce(spec)
+            return self.create(
+                spec.agent_id,
+                spec.client_address,
+                spec.price_usdc,
+                spec.task_description,
+                spec.principal,
+                timeout=timeout,
+                deadline=deadline,
+                idempotency_key=spec.idempotency_key,
+            )
 
-    def reject(self, approval_id: int) -> dict:
-        return self._client._post(f"/api/v1/deals/reject/{approval_id}", {})
+        return self._client._map(one, list(specs), max_concurrency)
 
-    def pending(self, principal: str) -> dict:
-        return self._client._get(f"/api/v1/deals/pending/{principal}")
+    def status(
+        self,
+        nonce: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = self._client._get(
+            f"/api/v1/deals/{nonce}/status",
+            timeout=timeout,
+            deadline=deadline,
+        )
+        return self._client._typed(Deal, res)
 
-    def list(self) -> dict:
-        return self._client._get("/api/v1/deals")
+    def status_many(
+        self,
+        nonces: Iterable[str],
+        *,
+        changed_only: bool = True,
+        max_concurrency: Optional[int] = None,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> list[BatchResult]:
+        """
+        Fetch the status of many deals and report what changed.
+
+        The client remembers the last status it fetched for each nonce.
+        With changed_only (the default), only deals whose status differs
+        from that one are returned (a nonce seen for the first time counts
+        as changed), plus any that failed to fetch, in input order; a
+        reconciler polling its open deals then only handles the changes.
+        changed_only=False returns a result for every nonce.
+
+        Uses POST /api/v1/deals/status/batch when the server provides it
+        and otherwise falls back to parallel single GETs, as reputation_many.
+        """
+        results = self._statuses(nonces, max_concurrency, timeout, deadline)
+        last = self._client._deal_statuses
+        changed = []
+        for result in results:
+            if not result.ok:
+                changed.append(result)
+                continue
+            status = result.value.get("status")
+            if last.get(result.key, UNSEEN) != status:
+                changed.append(result)
+            last[result.key] = status
+            last.move_to_end(result.key)
+        while len(last) > DEAL_STATUS_MEMORY:
+            last.popitem(last=False)
+        return changed if changed_only else results
+
+    def _statuses(
+        self,
+        nonces: Iterable[str],
+        max_concurrency: Optional[int],
+        timeout: TimeoutLike,
+        deadline: Optional[Deadline],
+    ) -> list[BatchResult]:
+        ids = list(nonces)
+
+        def one(nonce: str) -> dict:
+            return self.status(nonce, timeout=timeout, deadline=deadline)
+
+        fetched = self._client._batched(
+            DEAL_STATUS_BATCH,
+            ids,
+            one,
+            max_concurrency,
+            timeout,
+            deadline,
+            lambda nonce, status: self._client._typed(Deal, status),
+        )
+        return [fetched[nonce] for nonce in ids]
+
+    def delivery(
+        self,
+        nonce: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return self._client._get(
+            f"/api/v1/deals/{nonce}/delivery",
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    def events(
+        self,
+        wallet: Optional[str] = None,
+        *,
+        last_event_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> EventStream:
+        """Subscribe to the deal event stream, optionally filtered by wallet."""
+        return EventStream(
+            self._client,
+            wallet=wallet,
+            last_event_id=last_event_id,
+            deadline=deadline,
+        )
+
+    def watcher(self, wallet: Optional[str] = None) -> DealWatcher:
+        """
+        The client's shared DealWatcher for `wallet`: one event subscription
+        serving every deal watched through it. A closed watcher is replaced
+        by a new one.
+        """
+        watcher = self._client._watchers.get(wallet)
+        if watcher is None or watcher.closed:
+            watcher = self._client._watchers[wallet] = DealWatcher(self._client, wallet=wallet)
+        return watcher
+
+    def approve(
+        self,
+        approval_id: int,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return self._client._post(
+            f"/api/v1/deals/approve/{approval_id}",
+            {},
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    def reject(
+        self,
+        approval_id: int,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return self._client._post(
+            f"/api/v1/deals/reject/{approval_id}",
+            {},
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    def pending(
+        self,
+        principal: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return self._client._get(
+            f"/api/v1/deals/pending/{principal}",
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    def list(
+        self,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = self._client._get("/api/v1/deals", timeout=timeout, deadline=deadline)
+        return self._client._typed_items(Deal, res, "deals")
+
+    def iter_deals(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+        stream: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[dict]:
+        """
+        Yield deals one at a time, fetching `page_size` per request
+        and the next page in the background (unless `prefetch` is False).
+
+        With `stream=True` each page is decoded incrementally and items are
+        yielded while it is still downloading; pages are then fetched one
+        after another.
+        """
+        if stream:
+            pages = iter_streamed_pages(
+                lambda params: self._client._stream(
+                    "/api/v1/deals",
+                    "deals",
+                    params=params,
+                    timeout=timeout,
+                    deadline=deadline,
+                ),
+                "deals",
+                page_size,
+            )
+            return self._client._typed_iter(Deal, pages)
+
+        def fetch(params: dict) -> dict:
+            return self._client._get(
+                "/api/v1/deals",
+                params=params,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+        return self._client._typed_iter(Deal, iter_pages(fetch, "deals", page_size, prefetch))
 
 
 @dataclass
@@ -153,20 +648,120 @@ class CriteriaNamespace:
 
     _client: "MaldoClient"
 
-    def get(self, principal: str) -> dict:
-        return self._client._get(f"/api/v1/principals/{principal}/criteria")
+    def get(
+        self,
+        principal: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return self._client._get(
+            f"/api/v1/principals/{principal}/criteria",
+            timeout=timeout,
+            deadline=deadline,
+        )
 
-    def apply_preset(self, principal: str, preset: str) -> dict:
-        return self._client._put(
+    def apply_preset(
+        self,
+        principal: str,
+        preset: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = self._client._put(
             f"/api/v1/principals/{principal}/criteria",
             {"preset": preset},
+            timeout=timeout,
+            deadline=deadline,
         )
+        evaluator = self._client._evaluators.get(principal.lower())
+        if evaluator is not None:
+            evaluator.criteria = Criteria.from_dict(res)
+        return res
 
-    def evaluate(self, principal: str, agent_id: str, price: int) -> dict:
-        return self._client._post(
+    def evaluate(
+        self,
+        principal: str,
+        agent_id: str,
+        price: int,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        res = self._client._post(
             "/api/v1/criteria/evaluate",
             {"principal": principal, "agentId": agent_id, "price": price},
+            timeout=timeout,
+            deadline=deadline,
         )
+        return self._client._typed(CriteriaEvaluation, res)
+
+    def evaluator(
+        self,
+        principal: str,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> CriteriaEvaluator:
+        """
+        Local evaluator for `principal`'s criteria (see maldo.criteria).
+
+        The criteria are fetched once per client and kept; refresh=True
+        fetches them again. apply_preset through this client updates them.
+        """
+        key = principal.lower()
+        evaluator = self._client._evaluators.get(key)
+        if evaluator is None or refresh:
+            criteria = Criteria.from_dict(
+                self.get(principal, timeout=timeout, deadline=deadline)
+            )
+            evaluator = self._client._evaluators.get(key)
+            if evaluator is None:
+                evaluator = self._client._evaluators[key] = CriteriaEvaluator(criteria)
+            else:
+                evaluator.criteria = criteria
+        return evaluator
+
+    def evaluate_local(
+        self,
+        principal: str,
+        agent_id: str,
+        price: int,
+        *,
+        reputation: Optional[dict] = None,
+        verify: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """
+        Same result as evaluate(), computed in-process from the principal's
+        cached criteria and `reputation` (fetched when not given).
+
+        With verify=True the server evaluates the deal as well: a differing
+        result is recorded in the evaluator's `drift` and the server's
+        result is returned.
+        """
+        evaluator = self.evaluator(principal, timeout=timeout, deadline=deadline)
+        if reputation is None and not evaluator.criteria.require_human_approval:
+            reputation = self._client.agents.reputation(
+                agent_id,
+                timeout=timeout,
+                deadline=deadline,
+            )
+        result = evaluator.evaluate(reputation, price)
+        if verify:
+            server = self.evaluate(
+                principal,
+                agent_id,
+                price,
+                timeout=timeout,
+                deadline=deadline,
+            )
+            evaluator.record(agent_id, price, result, server)
+            return server
+        return self._client._typed(CriteriaEvaluation, result)
 
 
 @dataclass
@@ -175,10 +770,44 @@ class X402Namespace:
 
     _client: "MaldoClient"
 
-    def get_requirements(self, capability: str) -> dict:
-        """Get payment requirements (returns 402 response body)."""
-        res = requests.get(f"{self._client.base_url}/x402/services/{capability}")
-        return res.json()
+    def get_requirements(
+        self,
+        capability: str,
+        *,
+        refresh: bool = False,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """
+        Get payment requirements (returns 402 response body).
+
+        Served from the client's requirements cache when fresh; pass
+        refresh=True to bypass it.
+        """
+        cache = self._client._requirements_cache
+        if cache is not None and not refresh:
+            cached = cache.get(capability)
+            if cached is not None:
+                return self._client._typed(X402Requirements, cached)
+        reqs = self._client._get(
+            f"/x402/services/{capability}",
+            accept=(402,),
+            timeout=timeout,
+            deadline=deadline,
+        )
+        if cache is not None and "requirements" in reqs:
+            cache.set(capability, reqs)
+        return self._client._typed(X402Requirements, reqs)
+
+    def invalidate(self, capability: Optional[str] = None) -> None:
+        """Drop cached requirements for one capability, or all of them."""
+        cache = self._client._requirements_cache
+        if cache is None:
+            return
+        if capability is None:
+            cache.clear()
+        else:
+            cache.invalidate(capability)
 
     def request(
         self,
@@ -186,25 +815,102 @@ class X402Namespace:
         task_description: str,
         client_address: str,
         max_price: Optional[int] = None,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
     ) -> dict:
-        # Check requirements first
-        reqs = self.get_requirements(capability)
-        if max_price and int(reqs.get("requirements", {}).get("amount", 0)) > max_price:
-            raise MaldoApiError(
-                402,
-                f"Price {reqs['requirements']['amount']} exceeds max {max_price}",
-            )
+        # Check requirements first (usually cached); all hops share the caller's deadline
+        reqs = self.get_requirements(capability, timeout=timeout, deadline=deadline)
+        check_max_price(reqs, max_price)
 
+        body = {
+            "taskDescription": task_description,
+            "clientAddress": client_address,
+        }
+        res = self._client._post(
+            f"/x402/services/{capability}",
+            body,
+            timeout=timeout,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+        if not res.get("paymentRequired"):
+            return res
+
+        # Payment rejected: the cached amount is stale. Re-check the price
+        # against fresh requirements (carried by the 402 body when present)
+        # and submit once more.
+        self.invalidate(capability)
+        if "requirements" in res:
+            reqs = res
+            if self._client._requirements_cache is not None:
+                self._client._requirements_cache.set(capability, reqs)
+        else:
+            reqs = self.get_requirements(
+                capability,
+                refresh=True,
+                timeout=timeout,
+                deadline=deadline,
+            )
+        check_max_price(reqs, max_price)
         return self._client._post(
             f"/x402/services/{capability}",
-            {
-                "taskDescription": task_description,
-                "clientAddress": client_address,
-            },
+            body,
+            timeout=timeout,
+            deadline=deadline,
+            # A new submission, not a replay of the rejected one
+            idempotency_key=f"{idempotency_key}:repriced" if idempotency_key else None,
         )
 
-    def poll_result(self, nonce: str) -> dict:
-        return self._client._get(f"/x402/deals/{nonce}/result")
+    def poll_result(
+        self,
+        nonce: str,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return self._client._get(f"/x402/deals/{nonce}/result", timeout=timeout, deadline=deadline)
+
+    def wait_for_delivery(
+        self,
+        nonce: str,
+        *,
+        max_wait: float = 60.0,
+        poll_interval: float = 2.0,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        """
+        Wait until the deal's work is delivered and return its delivery record.
+
+        The delivery is checked once up front, then on the deal event stream
+        instead of polling: it is re-checked after every (re)connect, so
+        deliveries made during a reconnect gap are not missed. While the
+        stream is unavailable (the server answers 503 without a webhook
+        service) the delivery is polled every `poll_interval` seconds
+        instead. Raises MaldoTimeoutError after `max_wait` seconds (or at
+        `deadline`).
+        """
+        deadline = deadline or Deadline(max_wait)
+        delivery = self._client.deals.delivery(nonce, deadline=deadline)
+        if is_delivered(delivery):
+            return delivery
+        stream = EventStream(
+            self._client,
+            deadline=deadline,
+            retry_delay=min(1.0, poll_interval),
+            max_retry_delay=poll_interval,
+            report_gaps=True,
+        )
+        with stream:
+            for event in stream:
+                if event.type in ("connected", DISCONNECTED) or (
+                    event.nonce == nonce and event.type in DELIVERY_EVENTS
+                ):
+                    delivery = self._client.deals.delivery(nonce, deadline=deadline)
+                    if is_delivered(delivery):
+                        return delivery
+        raise MaldoTimeoutError(f"Deal {nonce} not delivered")
 
 
 class MaldoClient:
@@ -214,50 +920,388 @@ class MaldoClient:
     Usage:
         client = MaldoClient(api_url="http://localhost:3000")
         agents = client.agents.discover(capability="market-analysis")
+
+    All namespaces share one pooled keep-alive session. Use the client as a
+    context manager (or call close()) to release its connections:
+
+        with MaldoClient(pool=PoolConfig(max_per_host=50)) as client:
+            client.deals.status(nonce)
+
+    A caller-supplied `session` is used as-is and is not closed by the client.
+
+    `timeout` is the default per-request Timeout (a float or a
+    (connect, read) tuple also work; None disables it). Every namespace method
+    accepts `timeout=` to override it and `deadline=` to bound the call by a
+    shared Deadline.
+
+    x402 payment requirements are cached per capability according to
+    `requirements_cache` (pass None to always fetch them). Discovery results
+    are cached only when `discovery_cache` is set, e.g.
+    CacheConfig(ttl=30, stale_ttl=300, max_size=1024). Likewise
+    `agents_cache` caches agents.list / agents.get and `reputation_cache`
+    agents.reputation / reputation_many. A cache with a `path` is also kept
+    in that SQLite file, shared by the processes using it, so a restarted
+    worker starts warm instead of fetching everything again.
+
+    Failed requests are retried per `retry` (pass None to disable): timeouts,
+    connection errors and 429/502/503/504 responses are retried with jittered
+    backoff, honouring Retry-After. POSTs are only retried when the caller
+    passes an `idempotency_key`.
+
+    Each route group (services, agents, deals, criteria, x402) has a circuit
+    breaker per `circuit_breaker` (None disables them). While a group's
+    circuit is open its calls raise CircuitOpenError without being sent;
+    circuit_stats() reports every breaker's state and counters.
+
+    `rate_limit` enables client-side token buckets, overall and per route
+    group; requests (including retries) wait for a token before being sent.
+    The buckets are shared by every thread using the client.
+
+    Batch helpers (reputation_many, the deal watcher's reconciliation) share
+    one AIMD in-flight limit per `adaptive_concurrency` (None fixes it at
+    each call's `max_concurrency`, default 8): it grows while calls are fast
+    and healthy and halves on timeouts, 429s and 5xx responses.
     """
 
-    def __init__(self, api_url: str = "http://localhost:3000"):
+    def __init__(
+        self,
+        api_url: str = "http://localhost:3000",
+        pool: Optional[PoolConfig] = None,
+        session: Optional[requests.Session] = None,
+        timeout: TimeoutLike = Timeout(),
+        requirements_cache: Optional[CacheConfig] = CacheConfig(),
+        discovery_cache: Optional[CacheConfig] = None,
+        agents_cache: Optional[CacheConfig] = None,
+        reputation_cache: Optional[CacheConfig] = None,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        circuit_breaker: Optional[CircuitBreakerConfig] = CircuitBreakerConfig(),
+        rate_limit: Optional[RateLimitConfig] = None,
+        adaptive_concurrency: Optional[AdaptiveConcurrencyConfig] = AdaptiveConcurrencyConfig(),
+        coalesce: bool = False,
+        conditional_get: bool = False,
+        codec: CodecLike = "auto",
+        typed: bool = False,
+    ):
         self.base_url = api_url.rstrip("/")
+        self.pool = pool or PoolConfig()
+        self.timeout = Timeout.coerce(timeout)
+        self._codec = get_codec(codec)
+        self.typed = typed
+        self._requirements_cache = self._cache(requirements_cache, "requirements")
+        self._discovery_cache = self._cache(discovery_cache, "discovery")
+        self._agents_cache = self._cache(agents_cache, "agents")
+        self._reputation_cache = self._cache(reputation_cache, "reputation")
+        self._responses = ResponseStore() if conditional_get else None
+        self._retrier = Retrier(retry) if retry is not None else None
+        self._breakers = CircuitBreakers.from_config(circuit_breaker)
+        self._limiter = RateLimiter.from_config(rate_limit)
+        self._concurrency = AdaptiveLimiter.from_config(adaptive_concurrency)
+        self._flights = SingleFlight() if coalesce else None
+        self._unsupported: set[str] = set()  # optional endpoints the server lacks
+        self._evaluators: dict[str, CriteriaEvaluator] = {}  # by lowercased principal
+        self._deal_statuses: OrderedDict[str, Optional[str]] = OrderedDict()  # for status_many
+        self._watchers: dict[Optional[str], DealWatcher] = {}
+        self._http = PooledSession(self.pool, session)
         self.agents = AgentNamespace(_client=self)
         self.deals = DealNamespace(_client=self)
         self.criteria = CriteriaNamespace(_client=self)
         self.x402 = X402Namespace(_client=self)
 
-    def health(self) -> dict:
-        return self._get("/health")
-
-    def _get(self, path: str, params: Optional[dict] = None) -> dict:
-        res = requests.get(f"{self.base_url}{path}", params=params)
-        if not res.ok:
-            body = res.json() if res.headers.get("content-type", "").startswith("application/json") else {}
-            raise MaldoApiError(res.status_code, body.get("error", res.reason))
-        return res.json()
-
-    def _post(self, path: str, body: dict) -> dict:
-        res = requests.post(
-            f"{self.base_url}{path}",
-            json=body,
-            headers={"Content-Type": "application/json"},
+    def __enter__(self) -> "MaldoClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for watcher in self._watchers.values():
+            watcher.close()
+        self._watchers.clear()
+        self._http.close()
+
+    def _cache(self, config: Optional[CacheConfig], name: str) -> Optional[TTLCache]:
+        # On disk, entries are kept apart per API and cache
+        return TTLCache.from_config(config, f"{self.base_url} {name}")
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """Hit/miss counters of the client's enabled caches, by name."""
+        caches = {
+            "requirements": self._requirements_cache,
+            "discovery": self._discovery_cache,
+            "agents": self._agents_cache,
+            "reputation": self._reputation_cache,
+            "conditional": self._responses,
+        }
+        return {name: cache.stats for name, cache in caches.items() if cache is not None}
+
+    def circuit_stats(self) -> dict[str, CircuitStats]:
+        """State and counters of each route group's circuit breaker (empty if disabled)."""
+        return self._breakers.stats() if self._breakers is not None else {}
+
+    def concurrency_stats(self) -> Optional[ConcurrencyStats]:
+        """Current adaptive in-flight limit of batch calls (None if disabled)."""
+        return self._concurrency.stats if self._concurrency is not None else None
+
+    def coalesce_stats(self) -> dict[str, FlightStats]:
+        """Calls sent vs. callers served by a shared call, per GET path + query."""
+        return self._flights.stats() if self._flights is not None else {}
+
+    def health(
+        self,
+        *,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> dict:
+        return self._get("/health", timeout=timeout, deadline=deadline)
+
+    def _get(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        accept: tuple[int, ...] = (),
+        **opts,
+    ) -> dict:
+        if self._flights is None or accept:
+            return self._request("GET", path, params=params, accept=accept, **opts)
+        return self._flights.do(
+            flight_key(path, params),
+            lambda: self._request("GET", path, params=params, accept=accept, **opts),
+            opts.get("deadline"),
         )
-        if not res.ok and res.status_code != 402:
-            data = res.json() if res.headers.get("content-type", "").startswith("application/json") else {}
-            raise MaldoApiError(res.status_code, data.get("error", res.reason))
-        return res.json()
-
-    def _put(self, path: str, body: dict) -> dict:
-        res = requests.put(
-            f"{self.base_url}{path}",
-            json=body,
-            headers={"Content-Type": "application/json"},
+
+    def _post(self, path: str, body: dict, **opts) -> dict:
+        return self._request("POST", path, body=body, accept=(402,), **opts)
+
+    def _put(self, path: str, body: dict, **opts) -> dict:
+        return self._request("PUT", path, body=body, **opts)
+
+    def _delete(self, path: str, **opts) -> dict:
+        return self._request("DELETE", path, **opts)
+
+    def _typed(self, model: type[Model], res: Any) -> Any:
+        return model.wrap(res) if self.typed else res
+
+    def _typed_items(self, model: type[Model], res: Any, key: str) -> Any:
+        return wrap_items(model, res, key) if self.typed else res
+
+    def _typed_iter(self, model: type[Model], items: Iterator) -> Iterator:
+        return map(model.wrap, items) if self.typed else items
+
+    def _error_body(self, content_type: str, raw: bytes) -> dict:
+        """Decode a JSON error body; anything else (or malformed JSON) yields {}."""
+        if not content_type.startswith("application/json"):
+            return {}
+        try:
+            data = self._codec.loads(raw)
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _map(
+        self,
+        fn: Callable,
+        items: Sequence[Any],
+        max_concurrency: Optional[int] = None,
+    ) -> list[BatchResult]:
+        """Fan `fn` out over `items` under the client's adaptive concurrency limit."""
+        return map_bounded(fn, items, self._fan_out(max_concurrency), self._concurrency)
+
+    def _imap(
+        self,
+        fn: Callable,
+        items: Sequence[Any],
+        max_concurrency: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """_map, yielding results in item order; closing it cancels the calls not yet started."""
+        return iter_bounded(fn, items, self._fan_out(max_concurrency), self._concurrency)
+
+    def _fan_out(self, max_concurrency: Optional[int]) -> int:
+        if max_concurrency is None:
+            return self._concurrency.config.max_limit if self._concurrency else 8
+        return max_concurrency
+
+    def _batched(
+        self,
+        endpoint: BatchEndpoint,
+        keys: Sequence[Any],
+        one: Callable,
+        max_concurrency: Optional[int],
+        timeout: TimeoutLike,
+        deadline: Optional[Deadline],
+        value: Callable[[Any, dict], Any],
+    ) -> dict[Any, BatchResult]:
+        """fetch_batched over this client's POST and _map."""
+
+        def post(path: str, body: dict) -> Any:
+            return self._post(path, body, timeout=timeout, deadline=deadline)
+
+        return fetch_batched(
+            endpoint,
+            keys,
+            post,
+            lambda missing: self._map(one, missing, max_concurrency),
+            self._unsupported,
+            value,
         )
-        if not res.ok:
-            data = res.json() if res.headers.get("content-type", "").startswith("application/json") else {}
-            raise MaldoApiError(res.status_code, data.get("error", res.reason))
-        return res.json()
-
-    def _delete(self, path: str) -> dict:
-        res = requests.delete(f"{self.base_url}{path}")
-        if not res.ok:
-            data = res.json() if res.headers.get("content-type", "").startswith("application/json") else {}
-            raise MaldoApiError(res.status_code, data.get("error", res.reason))
-        return res.json()
+
+    def _timeout_for(self, timeout: TimeoutLike, deadline: Optional[Deadline]) -> Timeout:
+        resolved = self.timeout if timeout is None else Timeout.coerce(timeout)
+        return deadline.bound(resolved) if deadline is not None else resolved
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        body: Optional[dict] = None,
+        accept: tuple[int, ...] = (),
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> dict:
+        """
+        Send a request, retrying transient failures per the client's
+        RetryPolicy. Non-2xx responses not listed in `accept` raise
+        MaldoApiError.
+        """
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else {}
+        idempotent = method in IDEMPOTENT_METHODS or idempotency_key is not None
+        if self._retrier is not None:
+            self._retrier.record_request()
+        attempt = 1
+        while True:
+            try:
+                return self._send(method, path, params, body, accept, timeout, deadline, headers)
+            except MaldoApiError as e:
+                delay = None
+                if self._retrier is not None:
+                    delay = self._retrier.next_delay(e, attempt, idempotent, deadline)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict],
+        body: Optional[dict],
+        accept: tuple[int, ...],
+        timeout: TimeoutLike,
+        deadline: Optional[Deadline],
+        headers: dict,
+    ) -> dict:
+        """Send one attempt."""
+        if self._limiter is not None:
+            self._limiter.acquire(path, deadline)
+        bounded = self._timeout_for(timeout, deadline)
+        if body is not None:
+            headers = {**headers, "Content-Type": "application/json"}
+        key = stored = None
+        if method == "GET" and self._responses is not None:
+            key = flight_key(path, params)
+            stored = self._responses.get(key)
+            if stored is not None:
+                headers = {**headers, **stored.conditional_headers()}
+        breaker = self._breakers.for_path(path) if self._breakers is not None else None
+        if breaker is not None:
+            breaker.acquire()
+        failed = True
+        try:
+            res = self._http.request(
+                method,
+                f"{self.base_url}{path}",
+                params=params,
+                data=self._codec.dumps(body) if body is not None else None,
+                headers=headers,
+                timeout=(bounded.connect, bounded.read),
+            )
+            failed = res.status_code >= 500
+        except requests.Timeout as e:
+            raise MaldoTimeoutError(f"{method} {path} timed out: {e}") from e
+        except requests.ConnectionError as e:
+            raise MaldoConnectionError(f"{method} {path} failed: {e}") from e
+        finally:
+            if breaker is not None:
+                breaker.record(failed)
+        if res.status_code == 304 and stored is not None:
+            return self._responses.not_modified(key, stored)
+        if not res.ok and res.status_code not in accept:
+            data = self._error_body(res.headers.get("content-type", ""), res.content)
+            raise MaldoApiError(
+                res.status_code,
+                data.get("error", res.reason),
+                retry_after=parse_retry_after(res.headers.get("Retry-After")),
+            )
+        data = self._codec.loads(res.content)
+        if key is not None and res.status_code == 200:
+            self._responses.store(
+                key,
+                res.headers.get("ETag"),
+                res.headers.get("Last-Modified"),
+                data,
+            )
+        return data
+
+    def _stream(
+        self,
+        path: str,
+        key: str,
+        params: Optional[dict] = None,
+        timeout: TimeoutLike = None,
+        deadline: Optional[Deadline] = None,
+    ) -> JSONArrayStream:
+        """
+        GET `path` and decode the `key` array of its body as it arrives.
+        The request is sent when iteration starts; it is not retried,
+        coalesced or stored, since the body is consumed as it streams.
+        """
+        return JSONArrayStream(self._stream_chunks(path, params, timeout, deadline), key)
+
+    def _stream_chunks(
+        self,
+        path: str,
+        params: Optional[dict],
+        timeout: TimeoutLike,
+        deadline: Optional[Deadline],
+    ) -> Iterator[bytes]:
+        if self._limiter is not None:
+            self._limiter.acquire(path, deadline)
+        bounded = self._timeout_for(timeout, deadline)
+        breaker = self._breakers.for_path(path) if self._breakers is not None else None
+        if breaker is not None:
+            breaker.acquire()
+        failed = True
+        try:
+            res = self._http.request(
+                "GET",
+                f"{self.base_url}{path}",
+                params=params,
+                stream=True,
+                timeout=(bounded.connect, bounded.read),
+            )
+            failed = res.status_code >= 500
+        except requests.Timeout as e:
+            raise MaldoTimeoutError(f"GET {path} timed out: {e}") from e
+        except requests.ConnectionError as e:
+            raise MaldoConnectionError(f"GET {path} failed: {e}") from e
+        finally:
+            if breaker is not None:
+                breaker.record(failed)
+        try:
+            if not res.ok:
+                data = self._error_body(res.headers.get("content-type", ""), res.content)
+                raise MaldoApiError(
+                    res.status_code,
+                    data.get("error", res.reason),
+                    retry_after=parse_retry_after(res.headers.get("Retry-After")),
+                )
+            for chunk in res.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if deadline is not None and deadline.expired:
+                    raise MaldoTimeoutError(f"Deadline of {deadline.seconds}s exceeded")
+                yield chunk
+        except requests.RequestException as e:
+            raise MaldoConnectionError(f"GET {path} failed mid-body: {e}") from e
+        finally:
+            res.close()
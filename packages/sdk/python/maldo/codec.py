@@ -0,0 +1,100 @@
+"""
+Maldo SDK JSON codecs
+
+Encoding of request bodies and decoding of every response body (errors
+included) go through one codec per client. By default the fastest
+installed library is used: orjson, then msgspec, then the standard library.
+Response models (maldo.models) are encoded through their to_dict().
+
+    client = MaldoClient(codec="json")  # force the stdlib codec
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None
+
+
+def _encode_default(obj: Any) -> Any:
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+class Codec:
+    """Standard-library JSON codec; subclasses swap in faster libraries."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=_encode_default).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_encode_default)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(Codec):
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e  # match json / orjson
+
+
+CodecLike = Union[Codec, str]
+
+
+def get_codec(codec: CodecLike = "auto") -> Codec:
+    """
+    Resolve a codec instance or name ("auto", "orjson", "msgspec", "json").
+    Naming a library that is not installed raises ImportError.
+    """
+    if isinstance(codec, Codec):
+        return codec
+    if codec == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return Codec()
+    if codec == "orjson":
+        if orjson is None:
+            raise ImportError("codec='orjson' requires orjson: pip install orjson")
+        return OrjsonCodec()
+    if codec == "msgspec":
+        if msgspec is None:
+            raise ImportError("codec='msgspec' requires msgspec: pip install msgspec")
+        return MsgspecCodec()
+    if codec == "json":
+        return Codec()
+    raise ValueError(f"Unknown codec {codec!r}")
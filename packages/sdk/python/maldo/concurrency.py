@@ -0,0 +1,149 @@
+"""
+Maldo SDK adaptive concurrency
+
+AIMD (additive increase, multiplicative decrease) limit on the requests a
+client's batch helpers keep in flight. The limit grows by about one per
+round of healthy calls and is cut by a factor whenever a call signals
+overload (timeout, connection error, 429 or 5xx), so fan-out settles at what
+the server can absorb rather than a fixed guess. Calls much slower than the
+best latency seen hold the limit steady instead of growing it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from maldo.errors import MaldoApiError, MaldoConnectionError, MaldoTimeoutError
+
+# Statuses that mean "slow down"
+OVERLOAD_STATUSES = (429, 500, 502, 503, 504)
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrencyConfig:
+    """
+    Adaptive concurrency settings.
+
+    initial:            in-flight limit to start from
+    min_limit:          the limit never drops below this
+    max_limit:          the limit never grows past this
+    backoff:            factor applied to the limit on overload
+    latency_tolerance:  calls slower than this multiple of the baseline
+                        latency do not grow the limit
+    """
+
+    initial: int = 8
+    min_limit: int = 1
+    max_limit: int = 64
+    backoff: float = 0.5
+    latency_tolerance: float = 2.0
+
+
+@dataclass
+class ConcurrencyStats:
+    limit: int = 0
+    in_flight: int = 0
+    increases: int = 0
+    decreases: int = 0
+
+
+def is_overload(error: Optional[Exception]) -> bool:
+    if isinstance(error, (MaldoTimeoutError, MaldoConnectionError)):
+        return True
+    return isinstance(error, MaldoApiError) and error.status in OVERLOAD_STATUSES
+
+
+class AdaptiveLimiter:
+    """
+    Shared in-flight gate for a client's batch calls.
+
+    Threads wait with acquire(), coroutines with aacquire(); both report the
+    outcome through release(), which also adjusts the limit.
+    """
+
+    def __init__(self, config: AdaptiveConcurrencyConfig):
+        self.config = config
+        self._limit = float(min(max(config.initial, config.min_limit), config.max_limit))
+        self._in_flight = 0
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._stats = ConcurrencyStats()
+        self._changed = threading.Condition()
+        self._waiters: list[asyncio.Future] = []
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[AdaptiveConcurrencyConfig],
+    ) -> Optional["AdaptiveLimiter"]:
+        return cls(config) if config is not None else None
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def stats(self) -> ConcurrencyStats:
+        with self._changed:
+            self._stats.limit = self.limit
+            self._stats.in_flight = self._in_flight
+            return self._stats
+
+    def acquire(self) -> float:
+        """Block until a slot is free; returns the start time to pass to release()."""
+        with self._changed:
+            while self._in_flight >= self.limit:
+                self._changed.wait()
+            self._in_flight += 1
+        return time.monotonic()
+
+    async def aacquire(self) -> float:
+        """Wait on the event loop until a slot is free; returns the start time."""
+        while True:
+            with self._changed:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return time.monotonic()
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+            await waiter
+
+    def release(self, started: float, error: Optional[Exception] = None) -> None:
+        """Free a slot and feed the call's outcome into the limit."""
+        now = time.monotonic()
+        with self._changed:
+            self._in_flight -= 1
+            if is_overload(error):
+                self._decrease(started, now)
+            elif error is None:
+                self._increase(now - started)
+            self._changed.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _increase(self, latency: float) -> None:
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            self._baseline += (latency - self._baseline) * 0.01  # let it drift up slowly
+        if latency > self._baseline * self.config.latency_tolerance:
+            return
+        if self._limit < self.config.max_limit:
+            # +1 per round: every one of `limit` concurrent calls adds 1/limit
+            self._limit = min(self.config.max_limit, self._limit + 1 / self._limit)
+            self._stats.increases += 1
+
+    def _decrease(self, started: float, now: float) -> None:
+        # Calls started before the last cut saw the old limit; cutting again
+        # for each of them would collapse the limit for one burst of errors.
+        if started < self._last_decrease:
+            return
+        self._limit = max(self.config.min_limit, self._limit * self.config.backoff)
+        self._last_decrease = now
+        self._stats.decreases += 1
@@ -0,0 +1,260 @@
+"""
+Maldo SDK local criteria evaluation
+
+In-process copy of the server's deal criteria checks (POST
+/api/v1/criteria/evaluate), so candidates can be screened without a round
+trip each. The principal's criteria are fetched once and reused; results
+have the server's {autoApprove, failedChecks, reasons} shape.
+
+    evaluator = client.criteria.evaluator("0xPrincipal")
+    results = evaluator.evaluate_many(client.agents.discover("market-analysis", limit=100))
+
+Reputation is taken from the SDK's reputation payloads (score in stars,
+reviewCount). The server reads it from its own reputation source, which
+may disagree; use verify mode (criteria.evaluate_local(..., verify=True))
+to compare both and collect any drift.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Iterable, Mapping, Optional, Sequence, Union
+
+from maldo.batch import BatchResult
+from maldo.models import unwrap
+from maldo.table import AgentTable
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Mirrors services/criteria.ts
+PRESETS = {
+    "Conservative": (480, 5, 100_000),
+    "Balanced": (450, 3, 1_000_000),
+    "Aggressive": (0, 0, 10_000_000),
+    "Demo": (0, 0, 100_000_000),
+}
+DEFAULT_PRESET = "Conservative"  # used by the server for principals without criteria
+HIGH_VALUE_THRESHOLD = 100_000_000
+
+
+@dataclass(frozen=True)
+class Criteria:
+    """
+    A principal's criteria, as returned by GET /principals/:address/criteria.
+
+    min_reputation:   minimum average rating × 100 (450 = 4.50 stars)
+    min_review_count: minimum number of reviews
+    max_price:        maximum price in USDC atomic units (6 decimals)
+    """
+
+    preset: str = DEFAULT_PRESET
+    min_reputation: int = PRESETS[DEFAULT_PRESET][0]
+    min_review_count: int = PRESETS[DEFAULT_PRESET][1]
+    max_price: int = PRESETS[DEFAULT_PRESET][2]
+    require_human_approval: bool = False
+
+    @classmethod
+    def from_dict(cls, res: Mapping[str, Any]) -> "Criteria":
+        return cls(
+            preset=res.get("preset", "Custom"),
+            min_reputation=res["minReputation"],
+            min_review_count=res["minReviewCount"],
+            max_price=res["maxPriceUSDC"],
+            require_human_approval=bool(res.get("requireHumanApproval", False)),
+        )
+
+    @classmethod
+    def from_preset(cls, preset: str) -> "Criteria":
+        min_reputation, min_review_count, max_price = PRESETS[preset]
+        return cls(preset, min_reputation, min_review_count, max_price)
+
+
+@dataclass
+class EvaluatorStats:
+    evaluated: int = 0  # candidates evaluated locally
+    verified: int = 0  # of which also evaluated by the server
+    drifted: int = 0  # verified candidates where the server disagreed
+
+
+@dataclass
+class CriteriaDrift:
+    """A verified evaluation whose local and server results differ."""
+
+    agent_id: str
+    price: int
+    local: dict
+    server: dict
+
+
+def _js_number(x: float) -> str:
+    """Format a number the way JavaScript's String(number) does."""
+    if float(x).is_integer():
+        return str(int(x))
+    return format(Decimal(repr(float(x))), "f")
+
+
+def _average_value(score: float) -> int:
+    return math.floor(score * 100 + 0.5)  # Math.round, as the server rounds
+
+
+def _result(failed: list[str], reasons: list[str]) -> dict:
+    return {"autoApprove": not failed, "failedChecks": failed, "reasons": reasons}
+
+
+class CriteriaEvaluator:
+    """
+    Evaluates candidates against one principal's criteria, locally.
+
+    Results of verified evaluations that disagree with the server are kept
+    in `drift` (the most recent `max_drift`).
+    """
+
+    def __init__(self, criteria: Criteria, max_drift: int = 100):
+        self.criteria = criteria
+        self.stats = EvaluatorStats()
+        self.drift: deque[CriteriaDrift] = deque(maxlen=max_drift)
+
+    def evaluate(self, reputation: Optional[Mapping[str, Any]], price: int) -> dict:
+        """
+        Evaluate one candidate from its reputation payload (agents.reputation
+        or a discovered agent's `reputation`); None counts as no reviews.
+        """
+        self.stats.evaluated += 1
+        c = self.criteria
+        if c.require_human_approval:
+            return self._human_approval()
+        reputation = reputation or {}
+        average = _average_value(reputation.get("score") or 0)
+        count = reputation.get("reviewCount") or 0
+        failed: list[str] = []
+        reasons: list[str] = []
+        if average < c.min_reputation:
+            failed.append("INSUFFICIENT_REPUTATION")
+            reasons.append(self._reputation_reason(average))
+        if count < c.min_review_count:
+            failed.append("INSUFFICIENT_REVIEWS")
+            reasons.append(self._reviews_reason(count))
+        if price > c.max_price:
+            failed.append("PRICE_EXCEEDS_LIMIT")
+            reasons.append(self._price_reason(price))
+        if price > HIGH_VALUE_THRESHOLD:
+            failed.append("HIGH_VALUE_SAFEGUARD")
+            reasons.append(self._high_value_reason())
+        return _result(failed, reasons)
+
+    def evaluate_many(
+        self,
+        agents: Union[dict, Iterable[Any], AgentTable],
+        prices: Optional[Sequence[int]] = None,
+        reputations: Union[Mapping[str, Any], Iterable[BatchResult], None] = None,
+    ) -> list[dict]:
+        """
+        Evaluate a list of agents (as for AgentTable.from_agents, or an
+        AgentTable) in one pass over columns. `prices` defaults to each
+        agent's basePrice. Results are in input order.
+        """
+        table = agents
+        if not isinstance(table, AgentTable):
+            table = AgentTable.from_agents(agents, reputations)
+        n = len(table)
+        self.stats.evaluated += n
+        if self.criteria.require_human_approval:
+            return [self._human_approval() for _ in range(n)]
+        prices = table.base_price if prices is None else prices
+        checks = self._checks(table, prices)
+        results = []
+        for i in range(n):
+            failed: list[str] = []
+            reasons: list[str] = []
+            for name, mask, reason in checks:
+                if mask[i]:
+                    failed.append(name)
+                    reasons.append(reason(i))
+            results.append(_result(failed, reasons))
+        return results
+
+    def approved(
+        self,
+        table: AgentTable,
+        prices: Optional[Sequence[int]] = None,
+    ) -> Sequence[bool]:
+        """Column of autoApprove flags, without building per-agent results."""
+        if self.criteria.require_human_approval:
+            return [False] * len(table)
+        prices = table.base_price if prices is None else prices
+        masks = [mask for _, mask, _ in self._checks(table, prices)]
+        if np is not None:
+            return ~np.logical_or.reduce(masks)
+        return [not any(failed) for failed in zip(*masks)]
+
+    def record(self, agent_id: str, price: int, local: Mapping, server: Mapping) -> bool:
+        """Compare a local result with the server's; True (and kept in `drift`) if they differ."""
+        local = unwrap(local)
+        server = unwrap(server)
+        self.stats.verified += 1
+        same = bool(local.get("autoApprove")) == bool(server.get("autoApprove")) and list(
+            local.get("failedChecks") or []
+        ) == list(server.get("failedChecks") or [])
+        if not same:
+            self.stats.drifted += 1
+            self.drift.append(CriteriaDrift(agent_id, price, dict(local), dict(server)))
+        return not same
+
+    def _checks(self, table: AgentTable, prices: Sequence[int]) -> list[tuple]:
+        """(check, failed mask, reason(i)) for every check, vectorized when numpy is available."""
+        c = self.criteria
+        if np is not None:
+            average = np.floor(table.score * 100 + 0.5).astype(np.int64)
+            prices = np.asarray(prices, dtype=np.int64)
+            masks = (
+                average < c.min_reputation,
+                table.review_count < c.min_review_count,
+                prices > c.max_price,
+                prices > HIGH_VALUE_THRESHOLD,
+            )
+        else:
+            average = [_average_value(s) for s in table.score]
+            masks = (
+                [a < c.min_reputation for a in average],
+                [n < c.min_review_count for n in table.review_count],
+                [p > c.max_price for p in prices],
+                [p > HIGH_VALUE_THRESHOLD for p in prices],
+            )
+        counts = table.review_count
+        return [
+            (
+                "INSUFFICIENT_REPUTATION",
+                masks[0],
+                lambda i: self._reputation_reason(int(average[i])),
+            ),
+            ("INSUFFICIENT_REVIEWS", masks[1], lambda i: self._reviews_reason(int(counts[i]))),
+            ("PRICE_EXCEEDS_LIMIT", masks[2], lambda i: self._price_reason(int(prices[i]))),
+            ("HIGH_VALUE_SAFEGUARD", masks[3], lambda i: self._high_value_reason()),
+        ]
+
+    def _human_approval(self) -> dict:
+        return {
+            "autoApprove": False,
+            "failedChecks": ["HUMAN_APPROVAL_REQUIRED"],
+            "reasons": ["Principal requires human approval for all deals"],
+        }
+
+    def _reputation_reason(self, average: int) -> str:
+        required = _js_number(self.criteria.min_reputation / 100)
+        return f"Agent reputation {_js_number(average / 100)} < required {required}"
+
+    def _reviews_reason(self, count: int) -> str:
+        return f"Agent has {count} reviews < required {self.criteria.min_review_count}"
+
+    def _price_reason(self, price: int) -> str:
+        limit = _js_number(self.criteria.max_price / 1_000_000)
+        return f"Price ${_js_number(price / 1_000_000)} > max ${limit}"
+
+    def _high_value_reason(self) -> str:
+        return "Price > $100 requires explicit human confirmation"
@@ -0,0 +1,42 @@
+"""
+Maldo SDK exceptions.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+class MaldoApiError(Exception):
+    """Raised when the Maldo API returns an error."""
+
+    def __init__(self, status: int, message: str, retry_after: Optional[float] = None):
+        self.status = status
+        self.retry_after = retry_after  # seconds, from a Retry-After header
+        super().__init__(f"[{status}] {message}")
+
+
+class MaldoTimeoutError(MaldoApiError):
+    """Raised when a request times out or its deadline runs out before completion."""
+
+    def __init__(self, message: str = "Request timed out"):
+        super().__init__(408, message)
+
+
+class MaldoConnectionError(MaldoApiError):
+    """Raised when the API cannot be reached or the connection drops mid-request."""
+
+    def __init__(self, message: str = "Connection failed"):
+        super().__init__(503, message)
+
+
+class CircuitOpenError(MaldoApiError):
+    """Raised without sending a request while the circuit for its route group is open."""
+
+    def __init__(self, group: str, retry_in: float):
+        self.group = group
+        super().__init__(
+            503,
+            f"Circuit open for {group} (retry in {retry_in:.1f}s)",
+            retry_after=retry_in,
+        )
@@ -0,0 +1,326 @@
+"""
+Maldo SDK deal events
+
+Consumes the server's Server-Sent Events stream at GET /api/v1/deals/events.
+Streams reconnect with backoff after a dropped connection (or while the
+server answers 5xx, e.g. without a webhook service) and resume with
+Last-Event-ID when the server tags events with ids.
+
+    with client.deals.events(wallet="0x...") as stream:
+        for event in stream:
+            print(event.type, event.nonce)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional
+
+import requests
+
+from maldo.errors import MaldoApiError, MaldoTimeoutError
+from maldo.timeouts import Deadline
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, only needed by AsyncEventStream
+    aiohttp = None
+
+if TYPE_CHECKING:
+    from maldo.async_client import AsyncMaldoClient
+    from maldo.client import MaldoClient
+
+EVENTS_PATH = "/api/v1/deals/events"
+
+# Events after which a deal's delivery can be fetched
+DELIVERY_EVENTS = ("deal.delivered", "deal.completed")
+
+# Yielded by streams with report_gaps before each reconnect wait
+DISCONNECTED = "disconnected"
+
+
+@dataclass
+class DealEvent:
+    """One event from the deal stream (type is the SSE event name)."""
+
+    type: str
+    nonce: Optional[str] = None
+    timestamp: Optional[str] = None
+    data: dict = field(default_factory=dict)
+    id: Optional[str] = None
+
+
+def is_delivered(delivery: dict) -> bool:
+    """True if a /deals/:nonce/delivery body shows the work was delivered."""
+    return bool(delivery.get("deliveredAt")) or delivery.get("status") == "Completed"
+
+
+class _SSEParser:
+    """Incremental text/event-stream parser; feed it one line at a time."""
+
+    def __init__(self):
+        self.retry: Optional[float] = None
+        self._event = "message"
+        self._data: list[str] = []
+        self._id: Optional[str] = None
+
+    def feed(self, line: str) -> Optional[DealEvent]:
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None  # comment / keep-alive ping
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        elif name == "id":
+            self._id = value
+        elif name == "retry" and value.isdigit():
+            self.retry = int(value) / 1000
+        return None
+
+    def _dispatch(self) -> Optional[DealEvent]:
+        if not self._data:
+            self._event = "message"
+            return None
+        text = "\n".join(self._data)
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            payload = {"raw": text}
+        if not isinstance(payload, dict):
+            payload = {"value": payload}
+        if "nonce" in payload and "type" in payload:
+            event = DealEvent(
+                type=self._event,
+                nonce=payload.get("nonce"),
+                timestamp=payload.get("timestamp"),
+                data=payload.get("data") or {},
+                id=self._id,
+            )
+        else:
+            event = DealEvent(type=self._event, data=payload, id=self._id)
+        self._event = "message"
+        self._data = []
+        return event
+
+
+class _Backoff:
+    """Reconnect delay shared by the sync and async streams."""
+
+    def __init__(self, initial: float, maximum: float):
+        self.initial = initial
+        self.maximum = maximum
+        self.delay = initial
+
+    def reset(self, server_retry: Optional[float] = None) -> None:
+        if server_retry is not None:
+            self.initial = server_retry
+        self.delay = self.initial
+
+    def next(self, deadline: Optional[Deadline]) -> float:
+        delay = self.delay
+        self.delay = min(self.delay * 2, self.maximum)
+        if deadline is not None:
+            _check(deadline)
+            delay = min(delay, deadline.remaining())
+        return delay
+
+
+def _check(deadline: Deadline) -> None:
+    if deadline.expired:
+        raise MaldoTimeoutError(f"Deadline of {deadline.seconds}s exceeded")
+
+
+class EventStream:
+    """
+    Blocking iterator over deal events with automatic reconnect.
+
+    Every (re)connection first yields the server's `connected` event, which
+    lets consumers re-check state that may have changed while disconnected.
+    With `report_gaps`, a DISCONNECTED event is yielded whenever the stream
+    is down, before each reconnect wait (at most `max_retry_delay`), so
+    consumers can poll instead. Iteration stops on close(); with a deadline
+    it raises MaldoTimeoutError once the deadline passes.
+    """
+
+    def __init__(
+        self,
+        client: "MaldoClient",
+        wallet: Optional[str] = None,
+        last_event_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+        read_timeout: float = 75.0,
+        report_gaps: bool = False,
+    ):
+        self._client = client
+        self.wallet = wallet
+        self.last_event_id = last_event_id
+        self.deadline = deadline
+        self.read_timeout = read_timeout  # server pings every 30s
+        self.report_gaps = report_gaps
+        self._backoff = _Backoff(retry_delay, max_retry_delay)
+        self._response: Optional[requests.Response] = None
+        self._closed = False
+
+    def __enter__(self) -> "EventStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._closed = True
+        if self._response is not None:
+            self._response.close()
+
+    def __iter__(self) -> Iterator[DealEvent]:
+        while not self._closed:
+            try:
+                yield from self._read_once()
+            except requests.RequestException:
+                pass  # dropped: reconnect below
+            except Exception:
+                # Closing the response from another thread surfaces as an
+                # arbitrary error in the reading thread
+                if not self._closed:
+                    raise
+            if self._closed:
+                return
+            if self.report_gaps:
+                yield DealEvent(type=DISCONNECTED)
+                if self._closed:
+                    return
+            time.sleep(self._backoff.next(self.deadline))
+
+    def _read_once(self) -> Iterator[DealEvent]:
+        read = self.read_timeout
+        if self.deadline is not None:
+            _check(self.deadline)
+            read = min(read, self.deadline.remaining())
+        headers = {"Accept": "text/event-stream"}
+        if self.last_event_id:
+            headers["Last-Event-ID"] = self.last_event_id
+        res = self._client._http.request(
+            "GET",
+            f"{self._client.base_url}{EVENTS_PATH}",
+            params={"wallet": self.wallet} if self.wallet else None,
+            headers=headers,
+            stream=True,
+            timeout=(self._client.timeout.connect, read),
+        )
+        self._response = res
+        try:
+            if res.status_code >= 500:
+                return
+            if not res.ok:
+                raise MaldoApiError(res.status_code, res.reason)
+            res.encoding = "utf-8"
+            parser = _SSEParser()
+            for line in res.iter_lines(chunk_size=None, decode_unicode=True):
+                if self.deadline is not None:
+                    _check(self.deadline)  # pings keep the socket busy past it
+                event = parser.feed(line)
+                if event is None:
+                    continue
+                if event.type == "connected":
+                    self._backoff.reset(parser.retry)
+                if event.id:
+                    self.last_event_id = event.id
+                yield event
+                if self._closed:
+                    return
+        finally:
+            res.close()
+            self._response = None
+
+
+class AsyncEventStream:
+    """Async iterator over deal events; behaves like EventStream."""
+
+    def __init__(
+        self,
+        client: "AsyncMaldoClient",
+        wallet: Optional[str] = None,
+        last_event_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+        read_timeout: float = 75.0,
+        report_gaps: bool = False,
+    ):
+        self._client = client
+        self.wallet = wallet
+        self.last_event_id = last_event_id
+        self.deadline = deadline
+        self.read_timeout = read_timeout
+        self.report_gaps = report_gaps
+        self._backoff = _Backoff(retry_delay, max_retry_delay)
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncEventStream":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._closed = True
+
+    async def __aiter__(self) -> AsyncIterator[DealEvent]:
+        while not self._closed:
+            try:
+                async for event in self._read_once():
+                    yield event
+                    if self._closed:
+                        return
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass  # dropped: reconnect below
+            if self._closed:
+                return
+            if self.report_gaps:
+                yield DealEvent(type=DISCONNECTED)
+                if self._closed:
+                    return
+            await asyncio.sleep(self._backoff.next(self.deadline))
+
+    async def _read_once(self) -> AsyncIterator[DealEvent]:
+        total = None
+        if self.deadline is not None:
+            _check(self.deadline)
+            total = self.deadline.remaining()
+        headers = {"Accept": "text/event-stream"}
+        if self.last_event_id:
+            headers["Last-Event-ID"] = self.last_event_id
+        async with self._client._http().get(
+            f"{self._client.base_url}{EVENTS_PATH}",
+            params={"wallet": self.wallet} if self.wallet else None,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(
+                total=total,
+                sock_connect=self._client.timeout.connect,
+                sock_read=self.read_timeout,
+            ),
+        ) as res:
+            if res.status >= 500:
+                return
+            if res.status >= 400:
+                raise MaldoApiError(res.status, res.reason or "")
+            parser = _SSEParser()
+            async for raw in res.content:
+                event = parser.feed(raw.decode("utf-8").rstrip("\r\n"))
+                if event is None:
+                    continue
+                if event.type == "connected":
+                    self._backoff.reset(parser.retry)
+                if event.id:
+                    self.last_event_id = event.id
+                yield event
@@ -0,0 +1,6 @@
+"""
+Maldo SDK integrations
+
+Adapters for agent frameworks. Each submodule needs its framework
+installed and is not imported by `maldo` itself.
+"""
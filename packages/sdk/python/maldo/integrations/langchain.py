@@ -0,0 +1,317 @@
+"""
+Maldo SDK LangChain tools
+
+Discover, reputation and hire tools for LangChain agents. All tools of a
+MaldoToolkit share one pooled MaldoClient for `_run` and one
+AsyncMaldoClient for `_arun`, so async executors never block the event
+loop. Discover and reputation results are cached per agent run: repeated
+lookups by the same run are answered without another request.
+
+Requires langchain-core (pip install langchain-core).
+
+    toolkit = MaldoToolkit(api_url="http://localhost:3000", principal="0x...")
+    executor = AgentExecutor(agent=agent, tools=toolkit.get_tools())
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from maldo.async_client import AsyncMaldoClient
+from maldo.cache import TTLCache
+from maldo.client import MaldoClient
+
+try:
+    from langchain_core.callbacks import (
+        AsyncCallbackManagerForToolRun,
+        CallbackManagerForToolRun,
+    )
+    from langchain_core.tools import BaseTool
+except ImportError as e:  # optional dependency
+    raise ImportError(
+        "maldo.integrations.langchain requires langchain-core: pip install langchain-core"
+    ) from e
+
+
+class MaldoToolkit:
+    """
+    Shared state of the Maldo tools: the clients and the per-run cache.
+
+    Clients are created on first use unless given. Cached results are kept
+    for `cache_ttl` seconds under the id of the run that made the tool call
+    (the agent executor's run), so separate runs never share them. With
+    `auto_approve`, deals that need human approval are approved by the hire
+    tool itself (for demos).
+    """
+
+    def __init__(
+        self,
+        api_url: str = "http://localhost:3000",
+        principal: Optional[str] = None,
+        *,
+        client: Optional[MaldoClient] = None,
+        async_client: Optional[AsyncMaldoClient] = None,
+        cache_ttl: float = 300.0,
+        auto_approve: bool = False,
+    ):
+        self.api_url = api_url
+        self.principal = principal
+        self.auto_approve = auto_approve
+        self._client = client
+        self._async_client = async_client
+        self._owns_client = client is None
+        self._owns_async_client = async_client is None
+        self._cache = TTLCache(ttl=cache_ttl, max_size=1024) if cache_ttl > 0 else None
+
+    @property
+    def client(self) -> MaldoClient:
+        if self._client is None:
+            self._client = MaldoClient(api_url=self.api_url)
+        return self._client
+
+    @property
+    def async_client(self) -> AsyncMaldoClient:
+        if self._async_client is None:
+            self._async_client = AsyncMaldoClient(api_url=self.api_url)
+        return self._async_client
+
+    def get_tools(self) -> list[BaseTool]:
+        return [
+            MaldoDiscoverTool(toolkit=self),
+            MaldoReputationTool(toolkit=self),
+            MaldoHireTool(toolkit=self),
+        ]
+
+    def close(self) -> None:
+        """Close the sync client if the toolkit created it."""
+        if self._owns_client and self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close the clients the toolkit created."""
+        self.close()
+        if self._owns_async_client and self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def cached(self, run_manager: Any, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return the result of fetch() for `key`, cached for the current run."""
+        if self._cache is None:
+            return fetch()
+        key = (_run_id(run_manager), key)
+        value = self._cache.get(key)
+        if value is None:
+            value = fetch()
+            self._cache.set(key, value)
+        return value
+
+    async def acached(
+        self,
+        run_manager: Any,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Async counterpart of cached()."""
+        if self._cache is None:
+            return await fetch()
+        key = (_run_id(run_manager), key)
+        value = self._cache.get(key)
+        if value is None:
+            value = await fetch()
+            self._cache.set(key, value)
+        return value
+
+
+def _run_id(run_manager: Any) -> Any:
+    if run_manager is None:
+        return None
+    return run_manager.parent_run_id or run_manager.run_id
+
+
+class MaldoDiscoverTool(BaseTool):
+    """Discover available AI agents on the Maldo network."""
+
+    name: str = "maldo_discover"
+    description: str = (
+        "Search for AI service agents by capability. "
+        "Returns ranked list with reputation scores and prices. "
+        "Input: capability name (e.g. 'market-analysis', 'code-review', 'translation')"
+    )
+    toolkit: MaldoToolkit
+
+    def _run(
+        self,
+        capability: str,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> str:
+        capability = capability.strip()
+        try:
+            result = self.toolkit.cached(
+                run_manager,
+                ("discover", capability),
+                lambda: self.toolkit.client.agents.discover(capability=capability),
+            )
+        except Exception as e:
+            return f"Error discovering agents: {e}"
+        return _format_agents(capability, result)
+
+    async def _arun(
+        self,
+        capability: str,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> str:
+        capability = capability.strip()
+        try:
+            result = await self.toolkit.acached(
+                run_manager,
+                ("discover", capability),
+                lambda: self.toolkit.async_client.agents.discover(capability=capability),
+            )
+        except Exception as e:
+            return f"Error discovering agents: {e}"
+        return _format_agents(capability, result)
+
+
+class MaldoReputationTool(BaseTool):
+    """Check an AI agent's reputation on Maldo."""
+
+    name: str = "maldo_reputation"
+    description: str = (
+        "Check the reputation of an AI agent. Returns Bayesian score, "
+        "review count, dispute rate, and badges. Input: agent ID"
+    )
+    toolkit: MaldoToolkit
+
+    def _run(
+        self,
+        agent_id: str,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> str:
+        agent_id = agent_id.strip()
+        try:
+            rep = self.toolkit.cached(
+                run_manager,
+                ("reputation", agent_id),
+                lambda: self.toolkit.client.agents.reputation(agent_id),
+            )
+        except Exception as e:
+            return f"Error checking reputation: {e}"
+        return _format_reputation(rep)
+
+    async def _arun(
+        self,
+        agent_id: str,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> str:
+        agent_id = agent_id.strip()
+        try:
+            rep = await self.toolkit.acached(
+                run_manager,
+                ("reputation", agent_id),
+                lambda: self.toolkit.async_client.agents.reputation(agent_id),
+            )
+        except Exception as e:
+            return f"Error checking reputation: {e}"
+        return _format_reputation(rep)
+
+
+class MaldoHireTool(BaseTool):
+    """Hire an AI agent through Maldo's trust layer."""
+
+    name: str = "maldo_hire"
+    description: str = (
+        "Hire an AI agent to perform a task. Maldo handles escrow, trust evaluation, "
+        "and payment automatically. Input should be JSON with: "
+        "agentId (string), taskDescription (string), priceUSDC (number in USDC atomic "
+        "units, 6 decimals, e.g. 50000000 for $50)"
+    )
+    toolkit: MaldoToolkit
+
+    def _run(
+        self,
+        input_str: str,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> str:
+        client = self.toolkit.client
+        try:
+            result = client.deals.create(**self._deal(input_str))
+            approved = self._auto_approves(result)
+            if approved:
+                client.deals.approve(result["pendingApprovalId"])
+        except Exception as e:
+            return f"Error creating deal: {e}"
+        return _format_deal(result, approved)
+
+    async def _arun(
+        self,
+        input_str: str,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> str:
+        client = self.toolkit.async_client
+        try:
+            result = await client.deals.create(**self._deal(input_str))
+            approved = self._auto_approves(result)
+            if approved:
+                await client.deals.approve(result["pendingApprovalId"])
+        except Exception as e:
+            return f"Error creating deal: {e}"
+        return _format_deal(result, approved)
+
+    def _deal(self, input_str: str) -> dict:
+        params = json.loads(input_str)
+        principal = self.toolkit.principal
+        if principal is None:
+            raise ValueError("MaldoToolkit needs a principal to hire agents")
+        return {
+            "agent_id": params["agentId"],
+            "client_address": principal,
+            "price_usdc": params["priceUSDC"],
+            "task_description": params["taskDescription"],
+            "principal": principal,
+        }
+
+    def _auto_approves(self, result: dict) -> bool:
+        return bool(result.get("requiresHumanApproval")) and self.toolkit.auto_approve
+
+
+def _format_agents(capability: str, result: Any) -> str:
+    agents = result.get("agents", [])
+    if not agents:
+        return f"No agents found for capability '{capability}'"
+    lines = [f"Found {len(agents)} agent(s):"]
+    for a in agents:
+        rep = a.get("reputation") or {}
+        lines.append(
+            f"  - {a['name']} (ID: {a['agentId']}) | "
+            f"Score: {rep.get('bayesianScore', 'N/A')} | "
+            f"Reviews: {rep.get('reviewCount', 0)} | "
+            f"Price: ${(a.get('basePrice') or 0) / 1e6:.2f}"
+        )
+    return "\n".join(lines)
+
+
+def _format_reputation(rep: Any) -> str:
+    return (
+        f"Agent {rep['agentId']}:\n"
+        f"  Score: {rep['score']}\n"
+        f"  Bayesian Score: {rep['bayesianScore']}\n"
+        f"  Reviews: {rep['reviewCount']}\n"
+        f"  Dispute Rate: {rep['disputeRate']}\n"
+        f"  Badges: {', '.join(rep.get('badges') or []) or 'None'}"
+    )
+
+
+def _format_deal(result: dict, approved: bool) -> str:
+    if approved:
+        return (
+            f"Deal created (required human approval, auto-approved for demo). "
+            f"Approval ID: {result['pendingApprovalId']}"
+        )
+    if result.get("requiresHumanApproval"):
+        return (
+            f"Deal created and waiting for human approval. "
+            f"Approval ID: {result.get('pendingApprovalId', 'N/A')}"
+        )
+    return f"Deal created successfully! Nonce: {result.get('nonce', 'N/A')}"
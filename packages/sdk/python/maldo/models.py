@@ -0,0 +1,239 @@
+"""
+Maldo SDK response models
+
+Typed, slotted records decoded from API payloads, returned when a client is
+created with typed=True. Every field is decoded once, when the model is
+built, into a slot of its own; the payload dict is not kept, so reading an
+attribute is a plain slot access and nested models (agent.reputation) are
+decoded up front too. Keys the model does not know are kept aside and still
+served. Models answer dict-style lookups by API key (model["agentId"],
+model.get("name")), so code written for the dict responses keeps working,
+and to_dict() returns a JSON-ready dict (the client codecs encode models
+with it).
+
+    client = MaldoClient(typed=True)
+    agent = client.agents.get("market-analyst")
+    print(agent.name, agent.reputation.bayesian_score)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Optional, Type, TypeVar
+
+M = TypeVar("M", bound="Model")
+
+_MISSING = object()
+
+
+class _Field:
+    """
+    Field declaration: decoded from the first present raw key (dotted paths
+    allowed), converted when not None, `default` when absent.
+    """
+
+    def __init__(
+        self,
+        *keys: str,
+        convert: Optional[Callable[[Any], Any]] = None,
+        default: Any = None,
+    ):
+        self.keys = keys
+        self.convert = convert
+        self.default = default
+        self.nested = "." in keys[0]  # read from inside another key
+
+    def decode(self, raw: dict) -> Any:
+        for key in self.keys:
+            value = _lookup(raw, key) if self.nested else raw.get(key, _MISSING)
+            if value is not _MISSING:
+                break
+        else:
+            return self.default
+        if value is not None and self.convert is not None:
+            value = self.convert(value)
+        return value
+
+
+def _lookup(raw: dict, key: str) -> Any:
+    for part in key.split("."):
+        if not isinstance(raw, dict) or part not in raw:
+            return _MISSING
+        raw = raw[part]
+    return raw
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+class _ModelMeta(type):
+    """Turns a model's _Field declarations into slots plus a decoding table."""
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict) -> "_ModelMeta":
+        fields = [(attr, f) for attr, f in namespace.items() if isinstance(f, _Field)]
+        for attr, _ in fields:
+            del namespace[attr]
+        namespace["__slots__"] = tuple(namespace.get("__slots__", ())) + tuple(
+            attr for attr, _ in fields
+        )
+        cls = super().__new__(mcs, name, bases, namespace)
+        cls._fields = getattr(cls, "_fields", ()) + tuple(fields)
+        # Top-level API key (any alias) -> attribute, for dict-style access
+        cls._attrs = {
+            key: attr for attr, f in cls._fields if not f.nested for key in f.keys
+        }
+        return cls
+
+
+class Model(metaclass=_ModelMeta):
+    """
+    Base of the response models: a read-only record of a payload's fields.
+
+    Fields read under an alias (e.g. deal_id from "dealId" or "deal_id")
+    answer to either key, and to_dict() writes them under the first one.
+    """
+
+    __slots__ = ("_extra",)
+
+    _fields: tuple[tuple[str, _Field], ...] = ()
+    _attrs: dict[str, str] = {}
+
+    def __init__(self, raw: dict):
+        for attr, field in self._fields:
+            setattr(self, attr, field.decode(raw))
+        attrs = self._attrs
+        self._extra = None
+        if not attrs.keys() >= raw.keys():
+            self._extra = {key: value for key, value in raw.items() if key not in attrs}
+
+    @classmethod
+    def wrap(cls: Type[M], raw: Any) -> Any:
+        """Model for a payload dict; other values (and models) pass through."""
+        return cls(raw) if isinstance(raw, dict) else raw
+
+    def to_dict(self) -> dict:
+        """The payload as plain JSON-ready values; fields that are None are left out."""
+        out = {}
+        for attr, field in self._fields:
+            if not field.nested:
+                value = getattr(self, attr)
+                if value is not None:
+                    out[field.keys[0]] = _plain(value)
+        if self._extra:
+            out.update(self._extra)
+        return out
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._attrs.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            if value is not None:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def keys(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    __iter__ = keys
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Model):
+            return type(other) is type(self) and other.to_dict() == self.to_dict()
+        return NotImplemented
+
+    __hash__ = None  # compared by value
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+def unwrap(value: Any) -> Any:
+    """The payload dict of a model; other values pass through."""
+    return value.to_dict() if isinstance(value, Model) else value
+
+
+class Reputation(Model):
+    """GET /api/v1/agents/:id/reputation, or the `reputation` of a discovered agent."""
+
+    agent_id: Optional[str] = _Field("agentId")
+    score: float = _Field("score", default=0.0)
+    bayesian_score: Optional[float] = _Field("bayesianScore")
+    review_count: int = _Field("reviewCount", default=0)
+    dispute_rate: float = _Field("disputeRate", default=0.0)
+    badges: tuple = _Field("badges", convert=tuple, default=())
+
+
+class Agent(Model):
+    """A registered agent (agents.get/list) or a discovery result (agents.discover)."""
+
+    agent_id: str = _Field("agentId")
+    name: Optional[str] = _Field("name")
+    description: Optional[str] = _Field("description")
+    capabilities: tuple = _Field("capabilities", convert=tuple, default=())
+    base_price: Optional[int] = _Field("basePrice")
+    endpoint: Optional[str] = _Field("endpoint")
+    wallet: Optional[str] = _Field("wallet")
+    source: Optional[str] = _Field("source")
+    created_at: Optional[str] = _Field("createdAt")
+    reputation: Optional[Reputation] = _Field("reputation", convert=Reputation.wrap)
+    rank_score: Optional[float] = _Field("rankScore")
+
+
+class Deal(Model):
+    """deals.status, or a row of deals.list (whose keys are snake_case)."""
+
+    nonce: str = _Field("nonce")
+    deal_id: Optional[int] = _Field("dealId", "deal_id")
+    client: Optional[str] = _Field("client")
+    server: Optional[str] = _Field("server")
+    amount: Optional[int] = _Field("amount")
+    fee: Optional[int] = _Field("fee")
+    status: Optional[str] = _Field("status")
+    task_description: Optional[str] = _Field("taskDescription", "task_description")
+    created_at: Any = _Field("createdAt", "created_at")
+
+
+class CriteriaEvaluation(Model):
+    """POST /api/v1/criteria/evaluate."""
+
+    auto_approve: bool = _Field("autoApprove", default=False)
+    failed_checks: tuple = _Field("failedChecks", convert=tuple, default=())
+    reasons: tuple = _Field("reasons", convert=tuple, default=())
+
+
+class X402Requirements(Model):
+    """The 402 body of GET /x402/services/:capability."""
+
+    scheme: Optional[str] = _Field("requirements.scheme")
+    network: Optional[str] = _Field("requirements.network")
+    amount: Optional[int] = _Field("requirements.amount", convert=int)
+    asset: Optional[str] = _Field("requirements.asset")
+    pay_to: Optional[str] = _Field("requirements.payTo")
+    extra: Optional[dict] = _Field("requirements.extra")
+    agent: Optional[dict] = _Field("agent")
+
+
+def wrap_items(model: Type[Model], res: Any, key: str) -> Any:
+    """Wrap the items of a list envelope such as {"agents": [...]} in `model`."""
+    if not isinstance(res, dict) or not isinstance(res.get(key), list):
+        return res
+    return {**res, key: [model.wrap(item) for item in res[key]]}
@@ -0,0 +1,158 @@
+"""
+Maldo SDK paging
+
+Generators that walk a list endpoint page by page and yield its items one
+at a time, fetching the next page in the background while the current one
+is consumed. At most two pages are held in memory.
+
+Pages are requested with `limit` plus either `cursor` (when the server
+returns a `nextCursor`) or `offset`. Servers that ignore these parameters
+return the whole collection at once; it is then yielded as a single page.
+The *_streamed_pages variants decode each page incrementally instead (see
+maldo.streaming).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from maldo.streaming import AsyncJSONArrayStream, JSONArrayStream
+
+DEFAULT_PAGE_SIZE = 100
+
+
+class _Pager:
+    """Works out the next page's params from the page just received."""
+
+    def __init__(self, key: str, page_size: int):
+        self.key = key
+        self.page_size = max(1, page_size)
+        self.params: Optional[dict] = {"limit": self.page_size, "offset": 0}
+        self._pages = 0
+        self._first: Any = None
+
+    def advance(self, page: dict) -> list:
+        """Return the page's items and set `params` for the next page (None when done)."""
+        items = page.get(self.key) or []
+        if items and not self.accept_first(items[0]):
+            return []
+        self.finish(len(items), page)
+        return items
+
+    def accept_first(self, item: Any) -> bool:
+        """Check a page's first item; False (and done) if the server repeated page one."""
+        if self._pages == 0:
+            self._first = item
+        elif "offset" in self.params and item == self._first:
+            self.params = None  # offset ignored: the server repeated the first page
+            return False
+        return True
+
+    def finish(self, count: int, fields: dict) -> None:
+        """Record a page of `count` items whose other top-level fields are `fields`."""
+        params, self.params = self.params, None
+        self._pages += 1
+        if "nextCursor" in fields:
+            if fields["nextCursor"] and count:
+                self.params = {"limit": self.page_size, "cursor": fields["nextCursor"]}
+        elif count == self.page_size and "offset" in params:
+            self.params = {"limit": self.page_size, "offset": params["offset"] + count}
+        # Fewer items means the last page; more means the server ignored
+        # `limit` and returned everything.
+
+
+def iter_pages(
+    fetch: Callable[[dict], dict],
+    key: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+) -> Iterator[dict]:
+    """Yield the `key` items of every page returned by fetch(params)."""
+    pager = _Pager(key, page_size)
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending: Optional[Future] = None
+    try:
+        page = fetch(pager.params)
+        while True:
+            items = pager.advance(page)
+            if pager.params is not None and executor is not None:
+                pending = executor.submit(fetch, pager.params)
+            yield from items
+            if pager.params is None:
+                return
+            page = pending.result() if pending is not None else fetch(pager.params)
+            pending = None
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: Callable[[dict], Awaitable[dict]],
+    key: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+) -> AsyncIterator[dict]:
+    """Async counterpart of iter_pages."""
+    pager = _Pager(key, page_size)
+    pending: Optional[asyncio.Future] = None
+    try:
+        page = await fetch(pager.params)
+        while True:
+            items = pager.advance(page)
+            if pager.params is not None and prefetch:
+                pending = asyncio.ensure_future(fetch(pager.params))
+            for item in items:
+                yield item
+            if pager.params is None:
+                return
+            page = await pending if pending is not None else await fetch(pager.params)
+            pending = None
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def iter_streamed_pages(
+    open_page: Callable[[dict], "JSONArrayStream"],
+    key: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[dict]:
+    """
+    Like iter_pages, but each page is a JSONArrayStream whose items are
+    yielded while the page is still downloading. The next page is requested
+    once the current one has been read.
+    """
+    pager = _Pager(key, page_size)
+    while pager.params is not None:
+        stream = open_page(pager.params)
+        count = 0
+        for item in stream:
+            if count == 0 and not pager.accept_first(item):
+                return
+            count += 1
+            yield item
+        pager.finish(count, stream.fields)
+
+
+async def aiter_streamed_pages(
+    open_page: Callable[[dict], "AsyncJSONArrayStream"],
+    key: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[dict]:
+    """Async counterpart of iter_streamed_pages."""
+    pager = _Pager(key, page_size)
+    while pager.params is not None:
+        stream = open_page(pager.params)
+        count = 0
+        async for item in stream:
+            if count == 0 and not pager.accept_first(item):
+                return
+            count += 1
+            yield item
+        pager.finish(count, stream.fields)
@@ -0,0 +1,450 @@
+"""
+Maldo SDK hire pipeline
+
+Discover → reputation + criteria → x402 requirements → pay → wait, with
+the independent steps run concurrently: requirements are prefetched while
+agents are discovered and evaluated, and the candidates' reputations
+(reputation_many) and criteria evaluations are fetched in parallel through
+the client's batch helpers, under its adaptive concurrency limit. Results
+are taken in rank order: the first candidate that passes is hired as soon
+as every higher-ranked one has failed, and the evaluations not started yet
+are cancelled. Each stage's wall time is reported.
+
+    pipeline = HirePipeline(client, principal="0x...")
+    result = pipeline.run("market-analysis", "Analyze Q1 soy exports", max_price=50_000_000)
+    if result.hired:
+        print(result.candidate["agentId"], result.deal, result.timings)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from maldo.batch import BatchResult
+from maldo.errors import MaldoApiError
+from maldo.timeouts import Deadline
+
+if TYPE_CHECKING:
+    from maldo.async_client import AsyncMaldoClient
+    from maldo.client import MaldoClient
+    from maldo.criteria import CriteriaEvaluator
+
+HIRE_VIA = ("x402", "deal")
+
+
+@dataclass
+class CandidateCheck:
+    """Reputation and criteria evaluation of one discovered agent."""
+
+    agent: dict
+    reputation: Optional[dict] = None
+    evaluation: Optional[dict] = None
+    error: Optional[Exception] = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and bool(self.evaluation and self.evaluation.get("autoApprove"))
+
+
+@dataclass
+class HireResult:
+    """
+    Outcome of HirePipeline.run.
+
+    checks holds the candidates' evaluations in rank order, up to the hired
+    one (every candidate with check_all); `candidate` is the first that
+    passed. `via` is how it was hired ("x402" or "deal").
+    timings maps each stage run ("discover", "requirements", "evaluate",
+    "hire", "delivery") and "total" to seconds.
+    """
+
+    hired: bool = False
+    candidate: Optional[dict] = None
+    via: Optional[str] = None
+    deal: Optional[dict] = None
+    delivery: Optional[dict] = None
+    checks: list[CandidateCheck] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+class _Timer:
+    def __init__(self, timings: dict[str, float], stage: str):
+        self.timings = timings
+        self.stage = stage
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self.timings[self.stage] = time.perf_counter() - self.started
+
+
+def _timed(timings: dict[str, float], stage: str, fn: Any, *args: Any, **kwargs: Any) -> Any:
+    with _Timer(timings, stage):
+        return fn(*args, **kwargs)
+
+
+def _affordable(agents: list, max_price: Optional[int]) -> list:
+    if max_price is None:
+        return list(agents)
+    return [a for a in agents if (a.get("basePrice") or 0) <= max_price]
+
+
+def _deal_nonce(deal: Any) -> Optional[str]:
+    return deal.get("dealNonce") or deal.get("nonce")
+
+
+def _check(
+    agent: dict,
+    reputation: BatchResult,
+    evaluation: Optional[BatchResult],
+    evaluator: Optional["CriteriaEvaluator"],
+) -> CandidateCheck:
+    """An agent's check, from its batch results (or the local evaluator)."""
+    error = reputation.error or (evaluation.error if evaluation is not None else None)
+    if error is not None:
+        return CandidateCheck(agent, error=error)
+    if evaluator is not None:
+        local = evaluator.evaluate(reputation.value, agent.get("basePrice") or 0)
+        return CandidateCheck(agent, reputation.value, local)
+    return CandidateCheck(agent, reputation.value, evaluation.value)
+
+
+def _billed_agent(requirements: Any) -> Optional[str]:
+    """The agent an x402 payment settles with (the server's pick for the capability)."""
+    extra = (requirements.get("requirements") or {}).get("extra") or {}
+    return extra.get("serviceId")
+
+
+class HirePipeline:
+    """
+    Hires the best discovered agent that meets `principal`'s criteria.
+
+    client_address defaults to the principal. The `candidates` best
+    affordable agents are discovered (optionally with discover's `min_rep`)
+    and evaluated with at most `max_concurrency` calls in flight (default:
+    the client's adaptive limit). With `local_criteria`, candidates are
+    evaluated in-process (see maldo.criteria) instead of by the server.
+    Evaluation stops at the first candidate that passes unless `check_all`
+    is set, in which case every candidate is evaluated and reported.
+
+    via="deal" creates a deal with the selected candidate. via="x402" pays
+    through the x402 service endpoint, which bills the agent the server
+    picks for the capability (requirements.extra.serviceId); when that is
+    not the selected candidate, or the requirements cannot be fetched, the
+    pipeline creates a deal with the candidate instead, so it never pays an
+    agent it did not evaluate. With `wait`, run() also waits up to
+    `max_wait` seconds for the delivery.
+    """
+
+    def __init__(
+        self,
+        client: "MaldoClient",
+        principal: str,
+        client_address: Optional[str] = None,
+        *,
+        candidates: int = 5,
+        min_rep: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        local_criteria: bool = False,
+        check_all: bool = False,
+        via: str = "x402",
+        wait: bool = False,
+        max_wait: float = 60.0,
+    ):
+        if via not in HIRE_VIA:
+            raise ValueError(f"via must be one of {HIRE_VIA}, got {via!r}")
+        self.client = client
+        self.principal = principal
+        self.client_address = client_address or principal
+        self.candidates = candidates
+        self.min_rep = min_rep
+        self.max_concurrency = max_concurrency
+        self.local_criteria = local_criteria
+        self.check_all = check_all
+        self.via = via
+        self.wait = wait
+        self.max_wait = max_wait
+
+    def run(
+        self,
+        capability: str,
+        task_description: str,
+        *,
+        max_price: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> HireResult:
+        """
+        Run the pipeline for one task. Candidates priced above `max_price`
+        are skipped. Errors of individual candidates are reported in their
+        checks; discovery, criteria and hiring errors are raised.
+        """
+        client = self.client
+        result = HireResult()
+        timings = result.timings
+        started = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=4)  # stages only; batches fan out themselves
+        evaluations: Optional[Iterator[BatchResult]] = None
+        try:
+            # Neither depends on discovery: start them first
+            prefetch: Optional[Future] = None
+            if self.via == "x402":
+                prefetch = pool.submit(
+                    _timed,
+                    timings,
+                    "requirements",
+                    client.x402.get_requirements,
+                    capability,
+                    deadline=deadline,
+                )
+            evaluator: Optional[Future] = None
+            if self.local_criteria:
+                evaluator = pool.submit(
+                    client.criteria.evaluator,
+                    self.principal,
+                    deadline=deadline,
+                )
+
+            with _Timer(timings, "discover"):
+                found = client.agents.discover(
+                    capability,
+                    min_rep=self.min_rep,
+                    limit=self.candidates,
+                    deadline=deadline,
+                )
+            # The server does not apply `limit` to discovery
+            agents = _affordable(found.get("agents") or [], max_price)[: self.candidates]
+
+            with _Timer(timings, "evaluate"):
+                reputations = pool.submit(
+                    client.agents.reputation_many,
+                    [agent.get("agentId") for agent in agents],
+                    max_concurrency=self.max_concurrency,
+                    deadline=deadline,
+                )
+                if not self.local_criteria:
+                    evaluations = client._imap(
+                        lambda agent: client.criteria.evaluate(
+                            self.principal,
+                            agent.get("agentId"),
+                            agent.get("basePrice") or 0,
+                            deadline=deadline,
+                        ),
+                        agents,
+                        self.max_concurrency,
+                    )
+                local = evaluator.result() if evaluator is not None else None
+                reps = reputations.result()
+                for i, agent in enumerate(agents):
+                    check = _check(
+                        agent,
+                        reps[i],
+                        next(evaluations) if evaluations is not None else None,
+                        local,
+                    )
+                    result.checks.append(check)
+                    if check.passed and result.candidate is None:
+                        result.candidate = agent
+                        if not self.check_all:
+                            break
+                if evaluations is not None:
+                    evaluations.close()  # not needed: skip the ones not started yet
+            if result.candidate is None:
+                return result
+
+            requirements = None
+            if prefetch is not None:
+                try:
+                    requirements = prefetch.result()
+                except MaldoApiError:
+                    pass  # unavailable: hire through a deal
+            result.via = self._via(requirements, result.candidate)
+            with _Timer(timings, "hire"):
+                result.deal = self._hire(
+                    result.via,
+                    capability,
+                    task_description,
+                    result.candidate,
+                    max_price,
+                    deadline,
+                )
+            result.hired = True
+
+            nonce = _deal_nonce(result.deal)
+            if self.wait and nonce:
+                with _Timer(timings, "delivery"):
+                    result.delivery = client.x402.wait_for_delivery(
+                        nonce,
+                        max_wait=self.max_wait,
+                        deadline=deadline,
+                    )
+            return result
+        finally:
+            if evaluations is not None:
+                evaluations.close()
+            pool.shutdown(wait=False, cancel_futures=True)
+            timings["total"] = time.perf_counter() - started
+
+    def _via(self, requirements: Any, candidate: dict) -> str:
+        if self.via != "x402" or requirements is None:
+            return "deal"
+        return "x402" if _billed_agent(requirements) == candidate.get("agentId") else "deal"
+
+    def _hire(
+        self,
+        via: str,
+        capability: str,
+        task_description: str,
+        candidate: dict,
+        max_price: Optional[int],
+        deadline: Optional[Deadline],
+    ) -> dict:
+        if via == "x402":
+            return self.client.x402.request(
+                capability,
+                task_description,
+                self.client_address,
+                max_price,
+                deadline=deadline,
+            )
+        return self.client.deals.create(
+            candidate["agentId"],
+            self.client_address,
+            candidate.get("basePrice") or 0,
+            task_description,
+            self.principal,
+            deadline=deadline,
+        )
+
+
+class AsyncHirePipeline(HirePipeline):
+    """HirePipeline for an AsyncMaldoClient; run() is a coroutine."""
+
+    client: "AsyncMaldoClient"
+
+    async def run(  # type: ignore[override]
+        self,
+        capability: str,
+        task_description: str,
+        *,
+        max_price: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> HireResult:
+        client = self.client
+        result = HireResult()
+        timings = result.timings
+        started = time.perf_counter()
+        tasks: list[asyncio.Future] = []
+
+        def start(fn: Any, *args: Any, **kwargs: Any) -> asyncio.Future:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            tasks.append(task)
+            return task
+
+        async def timed(stage: str, fn: Any, *args: Any, **kwargs: Any) -> Any:
+            with _Timer(timings, stage):
+                return await fn(*args, **kwargs)
+
+        async def evaluate(agent: dict) -> dict:
+            return await client.criteria.evaluate(
+                self.principal,
+                agent.get("agentId"),
+                agent.get("basePrice") or 0,
+                deadline=deadline,
+            )
+
+        try:
+            prefetch: Optional[asyncio.Future] = None
+            if self.via == "x402":
+                prefetch = start(
+                    timed,
+                    "requirements",
+                    client.x402.get_requirements,
+                    capability,
+                    deadline=deadline,
+                )
+            evaluator: Optional[asyncio.Future] = None
+            if self.local_criteria:
+                evaluator = start(
+                    client.criteria.evaluator,
+                    self.principal,
+                    deadline=deadline,
+                )
+
+            with _Timer(timings, "discover"):
+                found = await client.agents.discover(
+                    capability,
+                    min_rep=self.min_rep,
+                    limit=self.candidates,
+                    deadline=deadline,
+                )
+            agents = _affordable(found.get("agents") or [], max_price)[: self.candidates]
+
+            with _Timer(timings, "evaluate"):
+                reputations = start(
+                    client.agents.reputation_many,
+                    [agent.get("agentId") for agent in agents],
+                    max_concurrency=self.max_concurrency,
+                    deadline=deadline,
+                )
+                evaluations: Optional[list[asyncio.Task]] = None
+                if not self.local_criteria:
+                    evaluations = client._start_map(evaluate, agents, self.max_concurrency)
+                    tasks.extend(evaluations)
+                local = await evaluator if evaluator is not None else None
+                reps = await reputations
+                for i, agent in enumerate(agents):
+                    check = _check(
+                        agent,
+                        reps[i],
+                        await evaluations[i] if evaluations is not None else None,
+                        local,
+                    )
+                    result.checks.append(check)
+                    if check.passed and result.candidate is None:
+                        result.candidate = agent
+                        if not self.check_all:
+                            break
+                for task in evaluations or ():
+                    task.cancel()  # not needed: skip the ones not started yet
+            if result.candidate is None:
+                return result
+
+            requirements = None
+            if prefetch is not None:
+                try:
+                    requirements = await prefetch
+                except MaldoApiError:
+                    pass  # unavailable: hire through a deal
+            result.via = self._via(requirements, result.candidate)
+            with _Timer(timings, "hire"):
+                result.deal = await self._hire(
+                    result.via,
+                    capability,
+                    task_description,
+                    result.candidate,
+                    max_price,
+                    deadline,
+                )
+            result.hired = True
+
+            nonce = _deal_nonce(result.deal)
+            if self.wait and nonce:
+                with _Timer(timings, "delivery"):
+                    result.delivery = await client.x402.wait_for_delivery(
+                        nonce,
+                        max_wait=self.max_wait,
+                        deadline=deadline,
+                    )
+            return result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # retrieved: raised above or no longer needed
+            timings["total"] = time.perf_counter() - started
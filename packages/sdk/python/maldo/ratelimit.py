@@ -0,0 +1,127 @@
+"""
+Maldo SDK rate limiting
+
+Client-side token buckets that smooth a client's traffic before it reaches
+the API: one bucket for all requests and optional buckets per route group
+(services, agents, deals, criteria, x402). A request takes a token from
+every bucket that applies to it and waits until they have refilled, so many
+threads or tasks sharing one client stay under the configured rates instead
+of bursting into server-side throttling.
+
+    client = MaldoClient(rate_limit=RateLimitConfig(
+        total=RateLimit(rate=50, burst=20),
+        groups={"x402": RateLimit(rate=5)},
+    ))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from maldo.errors import MaldoTimeoutError
+from maldo.timeouts import Deadline
+from maldo.transport import route_group
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    One token bucket.
+
+    rate:   requests per second sustained
+    burst:  requests that may be sent back to back after an idle period
+    """
+
+    rate: float
+    burst: int = 1
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """
+    Rate limits of a client.
+
+    total:   bucket shared by every request (None for no overall limit)
+    groups:  buckets per route group, e.g. {"deals": RateLimit(rate=10)}
+    """
+
+    total: Optional[RateLimit] = None
+    groups: dict[str, RateLimit] = field(default_factory=dict)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket handing out reservations.
+
+    reserve() takes a token immediately, letting the balance go negative, and
+    returns how long the caller must wait before using it. Waiters are
+    therefore served in arrival order and the same bucket works for threads
+    (time.sleep) and coroutines (asyncio.sleep).
+    """
+
+    def __init__(self, limit: RateLimit):
+        self.rate = limit.rate
+        self.burst = max(1, limit.burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Take a token and return the wait in seconds, or None if it exceeds max_wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+    def refund(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+
+class RateLimiter:
+    """The token buckets of one client."""
+
+    def __init__(self, config: RateLimitConfig):
+        self.config = config
+        self._total = TokenBucket(config.total) if config.total is not None else None
+        self._groups = {group: TokenBucket(limit) for group, limit in config.groups.items()}
+
+    @classmethod
+    def from_config(cls, config: Optional[RateLimitConfig]) -> Optional["RateLimiter"]:
+        if config is None or (config.total is None and not config.groups):
+            return None
+        return cls(config)
+
+    def acquire(self, path: str, deadline: Optional[Deadline] = None) -> None:
+        """Block until a request to `path` may be sent."""
+        wait = self._reserve(path, deadline)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, path: str, deadline: Optional[Deadline] = None) -> None:
+        """Wait, without blocking the event loop, until a request to `path` may be sent."""
+        wait = self._reserve(path, deadline)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _reserve(self, path: str, deadline: Optional[Deadline]) -> float:
+        max_wait = deadline.remaining() if deadline is not None else None
+        buckets = [b for b in (self._groups.get(route_group(path)), self._total) if b is not None]
+        waits: list[float] = []
+        for bucket in buckets:
+            wait = bucket.reserve(max_wait)
+            if wait is None:
+                for taken in buckets[: len(waits)]:
+                    taken.refund()
+                raise MaldoTimeoutError(f"Deadline of {deadline.seconds}s exceeded (rate limited)")
+            waits.append(wait)
+        return max(waits, default=0.0)
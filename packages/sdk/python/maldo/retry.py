@@ -0,0 +1,124 @@
+"""
+Maldo SDK retries
+
+Transient failures (connection errors, timeouts, 429/502/503/504) are
+retried with exponential backoff and full jitter, honouring Retry-After.
+Only idempotent requests are retried: GET/PUT/DELETE always, POST only when
+the call carries an idempotency key. The key is sent as Idempotency-Key and
+only keeps a retried POST from locking escrow funds twice if the server
+deduplicates by it. A per-client retry budget caps retries to a fraction of
+traffic so a degraded server is not hit by a retry storm.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import uuid
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional
+
+from maldo.errors import (
+    CircuitOpenError,
+    MaldoApiError,
+    MaldoConnectionError,
+    MaldoTimeoutError,
+)
+from maldo.timeouts import Deadline
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE")
+
+
+def new_idempotency_key() -> str:
+    """A random key for idempotency_key= arguments."""
+    return uuid.uuid4().hex
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry settings.
+
+    max_attempts:     total attempts per call, including the first
+    backoff_base:     delay scale in seconds; attempt n waits up to base * 2**(n-1)
+    backoff_max:      upper bound of the backoff delay
+    retry_statuses:   HTTP statuses treated as transient
+    max_retry_after:  longest server-requested Retry-After that is honoured
+    budget_ratio:     retry tokens earned per request sent
+    budget_burst:     retry tokens available at start and at most (one per retry)
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.1
+    backoff_max: float = 5.0
+    retry_statuses: tuple[int, ...] = (429, 502, 503, 504)
+    max_retry_after: float = 30.0
+    budget_ratio: float = 0.2
+    budget_burst: float = 10.0
+
+    def is_retryable(self, error: MaldoApiError, idempotent: bool) -> bool:
+        if not idempotent or isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error, (MaldoTimeoutError, MaldoConnectionError)):
+            return True
+        return error.status in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (1-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+
+class Retrier:
+    """Applies a RetryPolicy for one client and tracks its retry budget."""
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self._tokens = policy.budget_burst
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._tokens = min(self.policy.budget_burst, self._tokens + self.policy.budget_ratio)
+
+    def next_delay(
+        self,
+        error: MaldoApiError,
+        attempt: int,
+        idempotent: bool,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[float]:
+        """Seconds to wait before retrying after `attempt` failed, or None to give up."""
+        policy = self.policy
+        if attempt >= policy.max_attempts or not policy.is_retryable(error, idempotent):
+            return None
+        delay = policy.backoff(attempt)
+        if error.retry_after is not None:
+            if error.retry_after > policy.max_retry_after:
+                return None
+            delay = max(delay, error.retry_after)
+        if deadline is not None and delay >= deadline.remaining():
+            return None
+        with self._lock:
+            if self._tokens < 1:
+                return None
+            self._tokens -= 1
+        return delay
@@ -0,0 +1,138 @@
+"""
+Maldo SDK request coalescing
+
+Identical GETs that are in flight at the same time share one HTTP call:
+the first caller sends it and everyone who asks for the same key meanwhile
+waits for, and receives, the same parsed result (or error). Shared results
+should be treated as read-only, like cached ones. Each waiter still honours
+its own deadline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional
+from urllib.parse import urlencode
+
+from maldo.errors import MaldoTimeoutError
+from maldo.timeouts import Deadline
+
+
+def flight_key(path: str, params: Optional[dict] = None) -> str:
+    """Key identifying a GET: its path and sorted query string."""
+    if not params:
+        return path
+    return f"{path}?{urlencode(sorted((k, v) for k, v in params.items() if v is not None))}"
+
+
+@dataclass
+class FlightStats:
+    calls: int = 0  # HTTP calls actually sent
+    shared: int = 0  # callers served by another caller's call
+
+
+class _Stats:
+    """Per-key FlightStats, keeping only the most recently used `max_keys`."""
+
+    def __init__(self, max_keys: int = 1024):
+        self.max_keys = max_keys
+        self._by_key: OrderedDict[Hashable, FlightStats] = OrderedDict()
+
+    def record(self, key: Hashable, shared: bool) -> None:
+        stats = self._by_key.get(key)
+        if stats is None:
+            stats = self._by_key[key] = FlightStats()
+            while len(self._by_key) > self.max_keys:
+                self._by_key.popitem(last=False)
+        self._by_key.move_to_end(key)
+        if shared:
+            stats.shared += 1
+        else:
+            stats.calls += 1
+
+    def snapshot(self) -> dict[Hashable, FlightStats]:
+        return dict(self._by_key)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key across threads."""
+
+    def __init__(self, max_keys: int = 1024):
+        self._calls: dict[Hashable, _Call] = {}
+        self._stats = _Stats(max_keys)
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any], deadline: Optional[Deadline] = None) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            self._stats.record(key, shared=not leader)
+        if not leader:
+            wait = deadline.remaining() if deadline is not None else None
+            if not call.done.wait(wait):
+                raise MaldoTimeoutError(f"Deadline of {deadline.seconds}s exceeded")
+            if call.error is not None:
+                raise call.error
+            return call.value
+        try:
+            call.value = fn()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict[Hashable, FlightStats]:
+        with self._lock:
+            return self._stats.snapshot()
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent coroutine calls with the same key on one event loop."""
+
+    def __init__(self, max_keys: int = 1024):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self._stats = _Stats(max_keys)
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        task = self._calls.get(key)
+        self._stats.record(key, shared=task is not None)
+        if task is None:
+            # The call runs as its own task so that cancelling the caller
+            # that started it does not fail everyone sharing it.
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._forget(key, t))
+        if deadline is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), deadline.remaining())
+        except asyncio.TimeoutError:
+            raise MaldoTimeoutError(f"Deadline of {deadline.seconds}s exceeded") from None
+
+    def stats(self) -> dict[Hashable, FlightStats]:
+        return self._stats.snapshot()
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        self._calls.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every waiter gave up
@@ -0,0 +1,176 @@
+"""
+Maldo SDK streaming JSON decoding
+
+Incremental decoder for list responses such as {"deals": [...]}: the body
+is parsed chunk by chunk as it arrives and array elements are yielded as
+soon as each one is complete, so the whole body is never buffered and
+processing overlaps the transfer. Other top-level fields (e.g. nextCursor)
+are collected in `fields`.
+
+    stream = JSONArrayStream(res.iter_content(65536), key="deals")
+    for deal in stream:
+        ...
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WS = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+_MORE = object()  # sentinel: the next value is not complete yet
+
+
+class JSONArrayParser:
+    """
+    Push parser yielding the elements of one JSON array.
+
+    With `key`, the array is the value of that field of a top-level object;
+    without, the document itself must be an array. feed() returns the
+    elements completed by each chunk; close() checks the document ended.
+    """
+
+    def __init__(self, key: Optional[str] = None):
+        self.key = key
+        self.fields: dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"
+        self._field: Optional[str] = None
+
+    def feed(self, text: str) -> list:
+        self._buf = self._buf[self._pos:] + text
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> list:
+        items = self._parse(final=True)
+        if self._state != "done":
+            raise ValueError("Truncated JSON response")
+        return items
+
+    def _parse(self, final: bool) -> list:
+        items: list = []
+        while True:
+            self._pos = _WS.match(self._buf, self._pos).end()
+            if self._pos >= len(self._buf):
+                return items
+            char = self._buf[self._pos]
+            state = self._state
+            if state == "start":
+                self._expect(char, "[" if self.key is None else "{")
+                self._state = "first_element" if self.key is None else "first_field"
+            elif state == "first_field" and char == "}":
+                self._pos += 1
+                self._state = "done"
+            elif state in ("first_field", "field"):
+                name = self._value(final)
+                if name is _MORE:
+                    return items
+                if not isinstance(name, str):
+                    raise ValueError(f"Expected a field name at offset {self._pos}")
+                self._field = name
+                self._state = "colon"
+            elif state == "colon":
+                self._expect(char, ":")
+                self._state = "array" if self._field == self.key else "value"
+            elif state == "array":
+                self._expect(char, "[")
+                self._state = "first_element"
+            elif state == "first_element" and char == "]":
+                self._pos += 1
+                self._state = "after_field" if self.key is not None else "done"
+            elif state in ("first_element", "element"):
+                item = self._value(final)
+                if item is _MORE:
+                    return items
+                items.append(item)
+                self._state = "after_element"
+            elif state == "after_element":
+                self._expect(char, ",]")
+                if char == ",":
+                    self._state = "element"
+                else:
+                    self._state = "after_field" if self.key is not None else "done"
+            elif state == "value":
+                value = self._value(final)
+                if value is _MORE:
+                    return items
+                self.fields[self._field] = value
+                self._state = "after_field"
+            elif state == "after_field":
+                self._expect(char, ",}")
+                self._state = "field" if char == "," else "done"
+            else:
+                raise ValueError(f"Unexpected data after JSON document at offset {self._pos}")
+
+    def _expect(self, char: str, allowed: str) -> None:
+        if char not in allowed:
+            raise ValueError(f"Expected {allowed!r} at offset {self._pos}, got {char!r}")
+        self._pos += 1
+
+    def _value(self, final: bool) -> Any:
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _MORE
+        if not final and (
+            end == len(self._buf)
+            or (
+                isinstance(value, (int, float))
+                and _NUMBER_TAIL.fullmatch(self._buf, end) is not None
+            )
+        ):
+            return _MORE  # a number may continue in the next chunk
+        self._pos = end
+        return value
+
+
+class JSONArrayStream:
+    """Iterates the array elements decoded from an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes], key: Optional[str] = None):
+        self._chunks = chunks
+        self._parser = JSONArrayParser(key)
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        """Top-level fields other than the array; complete once iteration ends."""
+        return self._parser.fields
+
+    def __iter__(self) -> Iterator[Any]:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for chunk in self._chunks:
+            yield from self._parser.feed(decoder.decode(chunk))
+        yield from self._parser.feed(decoder.decode(b"", final=True))
+        yield from self._parser.close()
+
+
+class AsyncJSONArrayStream:
+    """Async counterpart of JSONArrayStream over an async iterable of chunks."""
+
+    def __init__(self, chunks: AsyncIterable[bytes], key: Optional[str] = None):
+        self._chunks = chunks
+        self._parser = JSONArrayParser(key)
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        return self._parser.fields
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        async for chunk in self._chunks:
+            for item in self._parser.feed(decoder.decode(chunk)):
+                yield item
+        for item in self._parser.feed(decoder.decode(b"", final=True)):
+            yield item
+        for item in self._parser.close():
+            yield item
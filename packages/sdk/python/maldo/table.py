@@ -0,0 +1,219 @@
+"""
+Maldo SDK agent table
+
+Columnar view of agent listings for ranking and filtering many agents
+locally. Reputation fields live in contiguous columns (numpy arrays when
+numpy is installed, array.array otherwise) and the server's discovery
+ranking is reproduced over whole columns at once:
+
+    bayesian  = (v / (v + m)) * R + (m / (v + m)) * C      (C=3.5, m=10)
+    rankScore = bayesian * min(v / 100, 1) * (1 - disputeRate)
+
+    table = AgentTable.from_agents(client.agents.discover("market-analysis", limit=1000))
+    best = table.where(max_price=500_000).top(10)
+"""
+
+from __future__ import annotations
+
+import array
+from typing import Any, Iterable, Mapping, Optional, Sequence, Union
+
+from maldo.batch import BatchResult
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Server discovery constants (services/discovery.ts)
+BAYESIAN_PRIOR = 3.5
+BAYESIAN_MIN_REVIEWS = 10
+FULL_VOLUME_REVIEWS = 100
+
+Column = Any  # numpy.ndarray, or array.array without numpy
+
+
+def _column(values: Iterable[Any], typecode: str) -> Column:
+    if np is not None:
+        return np.asarray(list(values), dtype=np.float64 if typecode == "d" else np.int64)
+    return array.array(typecode, values)
+
+
+def _field(item: Any, key: str, default: Any) -> Any:
+    value = item.get(key) if item is not None else None
+    return default if value is None else value
+
+
+class AgentTable:
+    """
+    Agents as columns: `agent_ids` plus score, review_count, dispute_rate
+    and base_price, all of the same length. Scoring methods return a float
+    column aligned with the rows; filters return a new table.
+    """
+
+    def __init__(
+        self,
+        agent_ids: Sequence[str],
+        score: Iterable[float],
+        review_count: Iterable[int],
+        dispute_rate: Iterable[float],
+        base_price: Iterable[int],
+    ):
+        self.agent_ids = list(agent_ids)
+        self.score = _column(score, "d")
+        self.review_count = _column(review_count, "q")
+        self.dispute_rate = _column(dispute_rate, "d")
+        self.base_price = _column(base_price, "q")
+        n = len(self.agent_ids)
+        for column in (self.score, self.review_count, self.dispute_rate, self.base_price):
+            if len(column) != n:
+                raise ValueError("AgentTable columns must all have the same length")
+
+    @classmethod
+    def from_agents(
+        cls,
+        agents: Union[dict, Iterable[Any]],
+        reputations: Union[Mapping[str, Any], Iterable[BatchResult], None] = None,
+    ) -> "AgentTable":
+        """
+        Build a table from agents.list() / agents.discover() output (the
+        envelope or its items, as dicts or models).
+
+        Reputation comes from `reputations` when given (agent id → reputation,
+        or the BatchResults of reputation_many) and otherwise from each
+        agent's embedded `reputation`, as in discovery results. Agents with
+        neither get a zero reputation, as on the server.
+        """
+        if isinstance(agents, dict):
+            agents = agents.get("agents") or []
+        if reputations is not None and not isinstance(reputations, Mapping):
+            reputations = {r.key: r.value for r in reputations if r.ok}
+
+        ids, scores, counts, disputes, prices = [], [], [], [], []
+        for agent in agents:
+            agent_id = agent.get("agentId")
+            rep = reputations.get(agent_id) if reputations is not None else None
+            if rep is None:
+                rep = agent.get("reputation")
+            ids.append(agent_id)
+            scores.append(float(_field(rep, "score", 0.0)))
+            counts.append(int(_field(rep, "reviewCount", 0)))
+            disputes.append(float(_field(rep, "disputeRate", 0.0)))
+            prices.append(int(_field(agent, "basePrice", 0)))
+        return cls(ids, scores, counts, disputes, prices)
+
+    def __len__(self) -> int:
+        return len(self.agent_ids)
+
+    def bayesian_score(
+        self,
+        prior: float = BAYESIAN_PRIOR,
+        min_reviews: float = BAYESIAN_MIN_REVIEWS,
+    ) -> Column:
+        """Review-count-weighted blend of each agent's score with `prior`."""
+        if np is not None:
+            v = self.review_count.astype(np.float64)
+            return (v * self.score + min_reviews * prior) / (v + min_reviews)
+        return array.array(
+            "d",
+            (
+                (v / (v + min_reviews)) * r + (min_reviews / (v + min_reviews)) * prior
+                for v, r in zip(self.review_count, self.score)
+            ),
+        )
+
+    def rank_score(
+        self,
+        prior: float = BAYESIAN_PRIOR,
+        min_reviews: float = BAYESIAN_MIN_REVIEWS,
+        full_volume: float = FULL_VOLUME_REVIEWS,
+        volume_weight: float = 1.0,
+        dispute_weight: float = 1.0,
+    ) -> Column:
+        """
+        bayesian × volume^volume_weight × (1 − disputeRate)^dispute_weight,
+        where volume = min(reviewCount / full_volume, 1). The defaults give
+        the server's rankScore; a weight of 0 drops that factor.
+        """
+        bayesian = self.bayesian_score(prior, min_reviews)
+        if np is not None:
+            volume = np.minimum(self.review_count / full_volume, 1.0)
+            return bayesian * volume**volume_weight * (1.0 - self.dispute_rate) ** dispute_weight
+        return array.array(
+            "d",
+            (
+                b * min(v / full_volume, 1.0) ** volume_weight * (1.0 - d) ** dispute_weight
+                for b, v, d in zip(bayesian, self.review_count, self.dispute_rate)
+            ),
+        )
+
+    def filter(self, mask: Sequence[bool]) -> "AgentTable":
+        """Rows where `mask` is true, in order."""
+        if np is not None:
+            mask = np.asarray(mask, dtype=bool)
+            return AgentTable(
+                [self.agent_ids[i] for i in np.flatnonzero(mask)],
+                self.score[mask],
+                self.review_count[mask],
+                self.dispute_rate[mask],
+                self.base_price[mask],
+            )
+        rows = [i for i, keep in enumerate(mask) if keep]
+        return AgentTable(
+            [self.agent_ids[i] for i in rows],
+            [self.score[i] for i in rows],
+            [self.review_count[i] for i in rows],
+            [self.dispute_rate[i] for i in rows],
+            [self.base_price[i] for i in rows],
+        )
+
+    def where(
+        self,
+        *,
+        min_bayesian_score: Optional[float] = None,
+        min_reviews: Optional[int] = None,
+        max_dispute_rate: Optional[float] = None,
+        max_price: Optional[int] = None,
+    ) -> "AgentTable":
+        """
+        Rows meeting every given bound. `min_bayesian_score` filters like
+        discover's minReputation.
+        """
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            if min_bayesian_score is not None:
+                mask &= self.bayesian_score() >= min_bayesian_score
+            if min_reviews is not None:
+                mask &= self.review_count >= min_reviews
+            if max_dispute_rate is not None:
+                mask &= self.dispute_rate <= max_dispute_rate
+            if max_price is not None:
+                mask &= self.base_price <= max_price
+            return self.filter(mask)
+        bayesian = self.bayesian_score() if min_bayesian_score is not None else None
+        mask = [
+            (bayesian is None or bayesian[i] >= min_bayesian_score)
+            and (min_reviews is None or self.review_count[i] >= min_reviews)
+            and (max_dispute_rate is None or self.dispute_rate[i] <= max_dispute_rate)
+            and (max_price is None or self.base_price[i] <= max_price)
+            for i in range(len(self))
+        ]
+        return self.filter(mask)
+
+    def top(
+        self,
+        n: Optional[int] = None,
+        scores: Optional[Sequence[float]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        (agent_id, score) pairs by descending score, ties kept in table
+        order like the server's sort. `scores` defaults to rank_score().
+        """
+        if scores is None:
+            scores = self.rank_score()
+        if np is not None:
+            scores = np.asarray(scores, dtype=np.float64)
+            order = np.argsort(-scores, kind="stable")[:n]
+            return [(self.agent_ids[i], float(scores[i])) for i in order]
+        order = sorted(range(len(self)), key=lambda i: -scores[i])[:n]
+        return [(self.agent_ids[i], scores[i]) for i in order]
@@ -0,0 +1,66 @@
+"""
+Maldo SDK timeouts
+
+Timeout bounds a single HTTP hop (connect + read). Deadline bounds a whole
+operation: pass the same Deadline to every call of a multi-step flow and
+each hop only gets the time that is left.
+
+    deadline = Deadline(10.0)
+    reqs = client.x402.get_requirements("market-analysis", deadline=deadline)
+    deal = client.x402.request("market-analysis", task, wallet, deadline=deadline)
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from maldo.errors import MaldoTimeoutError
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """Per-request connect/read timeouts in seconds (None disables either)."""
+
+    connect: Optional[float] = 5.0
+    read: Optional[float] = 30.0
+
+    @classmethod
+    def coerce(cls, value: "TimeoutLike") -> "Timeout":
+        if isinstance(value, Timeout):
+            return value
+        if isinstance(value, tuple):
+            return cls(*value)
+        return cls(value, value)
+
+
+TimeoutLike = Union[Timeout, float, tuple, None]
+
+
+class Deadline:
+    """An absolute point in time after which no further request may start."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def bound(self, timeout: Timeout) -> Timeout:
+        """Clamp a per-hop timeout to the time left; raise if nothing is left."""
+        left = self.remaining()
+        if left <= 0:
+            raise MaldoTimeoutError(f"Deadline of {self.seconds}s exceeded")
+        return Timeout(
+            connect=left if timeout.connect is None else min(timeout.connect, left),
+            read=left if timeout.read is None else min(timeout.read, left),
+        )
+
+    def __repr__(self) -> str:
+        return f"Deadline({self.seconds}s, remaining={self.remaining():.3f}s)"
@@ -0,0 +1,110 @@
+"""
+Maldo SDK transport
+
+Connection pooling shared by every namespace of a client. Each client owns
+one pool, so repeated calls reuse keep-alive connections instead of opening
+a fresh TCP (and TLS) connection per request.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Endpoint groups used for per-route resilience settings
+ROUTE_GROUPS = ("services", "agents", "deals", "criteria", "x402", "default")
+
+# First path segment under /api/v1 -> route group
+_API_GROUPS = {
+    "services": "services",
+    "agents": "agents",
+    "deals": "deals",
+    "criteria": "criteria",
+    "principals": "criteria",  # /principals/:address/criteria
+}
+
+
+def route_group(path: str) -> str:
+    """The route group an API path belongs to, e.g. "/api/v1/deals/0x1/status" -> "deals"."""
+    if path.startswith("/x402/"):
+        return "x402"
+    if path.startswith("/api/v1/"):
+        return _API_GROUPS.get(path[len("/api/v1/"):].split("/", 1)[0], "default")
+    return "default"
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    Connection pool settings.
+
+    pool_size:     total connections kept open across all hosts
+    max_per_host:  connections kept open per host
+    keep_alive:    reuse connections between requests
+    idle_timeout:  seconds a pool may sit unused before its connections are dropped
+    block:         wait for a free connection instead of opening an unpooled one
+    """
+
+    pool_size: int = 100
+    max_per_host: int = 20
+    keep_alive: bool = True
+    idle_timeout: float = 60.0
+    block: bool = False
+
+
+class PooledSession:
+    """A requests.Session with a sized connection pool and idle eviction."""
+
+    def __init__(self, config: PoolConfig, session: Optional[requests.Session] = None):
+        self.config = config
+        self._owned = session is None
+        self.session = session or requests.Session()
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()
+        self._in_flight = 0
+
+        if self._owned:
+            adapter = HTTPAdapter(
+                pool_connections=max(1, config.pool_size // max(1, config.max_per_host)),
+                pool_maxsize=config.max_per_host,
+                pool_block=config.block,
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            if not config.keep_alive:
+                self.session.headers["Connection"] = "close"
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        self._acquire()
+        try:
+            return self.session.request(method, url, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_used = time.monotonic()
+
+    def _acquire(self) -> None:
+        """Count a request as in flight, first dropping the pools if they sat idle."""
+        with self._lock:
+            idle = time.monotonic() - self._last_used
+            if (
+                self._owned
+                and self.config.idle_timeout > 0
+                and self._in_flight == 0
+                and idle >= self.config.idle_timeout
+            ):
+                # Closing the adapter only empties its pools; new connections
+                # are opened on demand by this request.
+                for adapter in self.session.adapters.values():
+                    adapter.close()
+            self._in_flight += 1
+            self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        if self._owned:
+            self.session.close()
@@ -0,0 +1,356 @@
+"""
+Maldo SDK deal watcher
+
+Waits on many outstanding deals over a single event-stream subscription.
+Events are dispatched to per-nonce futures through an in-memory index.
+After every (re)connect, deals still pending are reconciled by fetching
+their statuses (one batch request, or bounded parallel deals.status calls),
+so events missed during a reconnect gap do not leave waiters hanging.
+Nonces watched while the stream is live get one such check too (a deal may
+have finished before it was watched), and while the stream is down the
+pending deals are polled instead.
+
+    watcher = client.deals.watcher(wallet="0x...")
+    futures = [watcher.watch(deal["nonce"]) for deal in deals]
+    for future in futures:
+        event = future.result(timeout=300)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from maldo.events import DISCONNECTED, AsyncEventStream, DealEvent, EventStream
+from maldo.models import unwrap
+
+if TYPE_CHECKING:
+    from maldo.async_client import AsyncMaldoClient
+    from maldo.client import MaldoClient
+
+# Events that settle a watch unless the caller passes its own `until`
+DONE_EVENTS = ("deal.delivered", "deal.completed", "deal.refunded", "deal.resolved")
+
+# Deal statuses (GET /deals/:nonce/status) and the event each one implies
+STATUS_EVENTS = {
+    "Completed": "deal.completed",
+    "Refunded": "deal.refunded",
+    "Resolved": "deal.resolved",
+    "Disputed": "deal.disputed",
+}
+
+
+def _notify(callback: Callable[[DealEvent], None]) -> Callable:
+    """Adapt a DealEvent callback to a future done-callback (skips failures)."""
+
+    def done(future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            callback(future.result())
+
+    return done
+
+
+def _status_event(nonce: str, status: dict) -> Optional[DealEvent]:
+    event_type = STATUS_EVENTS.get(status.get("status", ""))
+    if event_type is None:
+        return None
+    return DealEvent(type=event_type, nonce=nonce, data=unwrap(status))
+
+
+def _subscribe(watcher: Union["DealWatcher", "AsyncDealWatcher"], stream_type: type) -> Any:
+    # report_gaps: each DISCONNECTED event triggers a poll of the pending deals,
+    # and the capped backoff keeps those polls `poll_interval` apart.
+    return stream_type(
+        watcher._client,
+        wallet=watcher.wallet,
+        retry_delay=min(1.0, watcher.poll_interval),
+        max_retry_delay=watcher.poll_interval,
+        report_gaps=True,
+    )
+
+
+class DealWatcher:
+    """
+    Resolves a Future per watched nonce from one deal event subscription.
+
+    The subscription runs on a daemon thread started by the first watch().
+    If it ends on a non-retryable error, the pending futures fail with it
+    and the next watch() subscribes again. While it is down, pending deals
+    are polled every `poll_interval` seconds. Reconciliation only sees deal
+    statuses, so a `deal.delivered` event missed in a gap is picked up once
+    the deal is completed.
+    """
+
+    def __init__(
+        self,
+        client: "MaldoClient",
+        wallet: Optional[str] = None,
+        until: tuple[str, ...] = DONE_EVENTS,
+        max_concurrency: Optional[int] = None,
+        poll_interval: float = 5.0,
+    ):
+        self._client = client
+        self.wallet = wallet
+        self.until = until
+        self.max_concurrency = max_concurrency
+        self.poll_interval = poll_interval
+        self._index: dict[str, list[Future]] = {}
+        self._lock = threading.Lock()
+        self._stream: Optional[EventStream] = None
+        self._thread: Optional[threading.Thread] = None
+        self._connected = False
+        self._unchecked: set[str] = set()  # watched while connected, not yet checked
+        self._checking = False
+        self._closed = False
+
+    def __enter__(self) -> "DealWatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def watch(self, nonce: str, callback: Optional[Callable[[DealEvent], None]] = None) -> Future:
+        """Return a Future resolved with the first matching DealEvent for `nonce`."""
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(_notify(callback))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("DealWatcher is closed")
+            self._index.setdefault(nonce, []).append(future)
+            if self._thread is None:
+                self._stream = _subscribe(self, EventStream)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="maldo-deal-watcher",
+                    daemon=True,
+                )
+                self._thread.start()
+            elif self._connected:
+                # Missed by the last reconcile: check it (batched with others)
+                self._unchecked.add(nonce)
+                if not self._checking:
+                    self._checking = True
+                    threading.Thread(
+                        target=self._check_unchecked,
+                        name="maldo-deal-watcher-check",
+                        daemon=True,
+                    ).start()
+        return future
+
+    def unwatch(self, nonce: str) -> None:
+        with self._lock:
+            futures = self._index.pop(nonce, [])
+        for future in futures:
+            future.cancel()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            futures = [f for fs in self._index.values() for f in fs]
+            self._index.clear()
+        if self._stream is not None:
+            self._stream.close()
+        for future in futures:
+            future.cancel()
+
+    def _run(self) -> None:
+        error: Exception = RuntimeError("Deal event stream ended")
+        try:
+            for event in self._stream:
+                if event.type in ("connected", DISCONNECTED):
+                    with self._lock:
+                        self._connected = event.type == "connected"
+                    self._reconcile()
+                elif event.nonce and event.type in self.until:
+                    self._resolve(event.nonce, event)
+        except Exception as e:
+            error = e
+        finally:
+            # The stream only ends on close() or a non-retryable error: fail
+            # every waiter rather than leaving it hanging, and let the next
+            # watch() subscribe again.
+            with self._lock:
+                futures = [f for fs in self._index.values() for f in fs]
+                self._index.clear()
+                self._stream = None
+                self._thread = None
+                self._connected = False
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+
+    def _resolve(self, nonce: str, event: DealEvent) -> None:
+        with self._lock:
+            futures = self._index.pop(nonce, [])
+        for future in futures:
+            if not future.done():
+                future.set_result(event)
+
+    def _reconcile(self) -> None:
+        with self._lock:
+            nonces = list(self._index)
+            self._unchecked.clear()  # covered here
+        self._check(nonces)
+
+    def _check_unchecked(self) -> None:
+        while True:
+            with self._lock:
+                nonces = [n for n in self._unchecked if n in self._index]
+                self._unchecked.clear()
+                if not nonces:
+                    self._checking = False
+                    return
+            self._check(nonces)
+
+    def _check(self, nonces: list[str]) -> None:
+        if not nonces:
+            return
+        results = self._client.deals._statuses(nonces, self.max_concurrency, None, None)
+        for result in results:
+            event = _status_event(result.key, result.value) if result.ok else None
+            if event is not None and event.type in self.until:
+                self._resolve(result.key, event)
+
+
+class AsyncDealWatcher:
+    """asyncio counterpart of DealWatcher; watch() returns an asyncio.Future."""
+
+    def __init__(
+        self,
+        client: "AsyncMaldoClient",
+        wallet: Optional[str] = None,
+        until: tuple[str, ...] = DONE_EVENTS,
+        max_concurrency: Optional[int] = None,
+        poll_interval: float = 5.0,
+    ):
+        self._client = client
+        self.wallet = wallet
+        self.until = until
+        self.max_concurrency = max_concurrency
+        self.poll_interval = poll_interval
+        self._index: dict[str, list[asyncio.Future]] = {}
+        self._stream: Optional[AsyncEventStream] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = False
+        self._unchecked: set[str] = set()
+        self._check_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncDealWatcher":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        return len(self._index)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def watch(
+        self,
+        nonce: str,
+        callback: Optional[Callable[[DealEvent], None]] = None,
+    ) -> asyncio.Future:
+        """Return a Future resolved with the first matching DealEvent for `nonce`."""
+        if self._closed:
+            raise RuntimeError("AsyncDealWatcher is closed")
+        future = asyncio.get_running_loop().create_future()
+        if callback is not None:
+            future.add_done_callback(_notify(callback))
+        self._index.setdefault(nonce, []).append(future)
+        if self._task is None:
+            self._stream = _subscribe(self, AsyncEventStream)
+            self._task = asyncio.ensure_future(self._run())
+        elif self._connected:
+            self._unchecked.add(nonce)
+            if self._check_task is None:
+                self._check_task = asyncio.ensure_future(self._check_unchecked())
+        return future
+
+    def unwatch(self, nonce: str) -> None:
+        for future in self._index.pop(nonce, []):
+            future.cancel()
+
+    def close(self) -> None:
+        self._closed = True
+        if self._stream is not None:
+            self._stream.close()
+        if self._task is not None:
+            self._task.cancel()
+        if self._check_task is not None:
+            self._check_task.cancel()
+        for futures in self._index.values():
+            for future in futures:
+                future.cancel()
+        self._index.clear()
+
+    async def _run(self) -> None:
+        error: Exception = RuntimeError("Deal event stream ended")
+        try:
+            async for event in self._stream:
+                if event.type in ("connected", DISCONNECTED):
+                    self._connected = event.type == "connected"
+                    await self._reconcile()
+                elif event.nonce and event.type in self.until:
+                    self._resolve(event.nonce, event)
+        except Exception as e:
+            error = e
+        finally:
+            futures = [f for fs in self._index.values() for f in fs]
+            self._index.clear()
+            self._stream = None
+            self._task = None
+            self._connected = False
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+
+    def _resolve(self, nonce: str, event: DealEvent) -> None:
+        for future in self._index.pop(nonce, []):
+            if not future.done():
+                future.set_result(event)
+
+    async def _reconcile(self) -> None:
+        self._unchecked.clear()
+        await self._check(list(self._index))
+
+    async def _check_unchecked(self) -> None:
+        try:
+            while True:
+                nonces = [n for n in self._unchecked if n in self._index]
+                self._unchecked.clear()
+                if not nonces:
+                    return
+                await self._check(nonces)
+        finally:
+            self._check_task = None
+
+    async def _check(self, nonces: list[str]) -> None:
+        if not nonces:
+            return
+        results = await self._client.deals._statuses(
+            nonces,
+            self.max_concurrency,
+            None,
+            None,
+        )
+        for result in results:
+            event = _status_event(result.key, result.value) if result.ok else None
+            if event is not None and event.type in self.until:
+                self._resolve(result.key, event)
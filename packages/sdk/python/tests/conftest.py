@@ -0,0 +1,83 @@
+import json
+import threading
+from typing import Any, Callable, Union
+from urllib.parse import urlparse
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from maldo import MaldoClient, RetryPolicy
+
+Handler = Union[tuple, Callable[["Call"], tuple]]
+
+
+class Call:
+    """One request seen by FakeSession."""
+
+    def __init__(self, method: str, path: str, kwargs: dict):
+        self.method = method
+        self.path = path
+        self.params = kwargs.get("params")
+        self.headers = kwargs.get("headers") or {}
+        data = kwargs.get("data")
+        self.body = json.loads(data) if data else None
+
+
+class FakeSession:
+    """
+    Stand-in for requests.Session. Routes "METHOD /path" to a handler: a
+    (status, body) tuple, a list of them served in turn (the last one
+    repeats), or a callable taking the Call. A route ending in "*" matches
+    any path with that prefix. Unrouted requests get a 404.
+    """
+
+    def __init__(self):
+        self.routes: dict[str, Union[Handler, list]] = {}
+        self.calls: list[Call] = []
+        self._lock = threading.Lock()
+
+    def route(self, key: str, handler: Union[Handler, list]) -> None:
+        self.routes[key] = handler
+
+    def hits(self, key: str) -> list[Call]:
+        return [c for c in self.calls if f"{c.method} {c.path}" == key]
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        call = Call(method, urlparse(url).path, kwargs)
+        key = f"{method} {call.path}"
+        with self._lock:
+            self.calls.append(call)
+            handler = self.routes.get(key) or next(
+                (h for k, h in self.routes.items() if k.endswith("*") and key.startswith(k[:-1])),
+                (404, {"error": "Not found"}),
+            )
+            if isinstance(handler, list):
+                handler = handler.pop(0) if len(handler) > 1 else handler[0]
+        status, body = handler(call) if callable(handler) else handler
+        res = requests.Response()
+        res.status_code = status
+        res.reason = "Fake"
+        res.headers = CaseInsensitiveDict({"content-type": "application/json"})
+        res._content = json.dumps(body).encode()
+        return res
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def session() -> FakeSession:
+    return FakeSession()
+
+
+@pytest.fixture
+def client(session: FakeSession):
+    client = MaldoClient(
+        "http://maldo.test",
+        session=session,
+        retry=RetryPolicy(backoff_base=0.0),
+        codec="json",
+    )
+    yield client
+    client.close()
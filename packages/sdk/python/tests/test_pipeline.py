@@ -0,0 +1,116 @@
+import time
+
+import pytest
+
+from maldo import HirePipeline
+
+EVALUATE = "POST /api/v1/criteria/evaluate"
+REQUIREMENTS = "GET /x402/services/market-analysis"
+CREATE = "POST /api/v1/deals/create"
+AGENTS = [{"agentId": f"a{i}", "basePrice": 1000 * i} for i in range(1, 6)]
+
+
+@pytest.fixture
+def delays():
+    """Seconds an agent's criteria evaluation takes (default 50ms)."""
+    return {}
+
+
+@pytest.fixture
+def approve(session, delays):
+    """Agent ids the criteria evaluation approves."""
+    approved = set()
+
+    def evaluate(call):
+        agent_id = call.body["agentId"]
+        time.sleep(delays.get(agent_id, 0.05))
+        return 200, {"autoApprove": agent_id in approved, "failedChecks": []}
+
+    def reputations(call):
+        return 200, {"reputations": [{"agentId": a, "score": 4.5} for a in call.body["agentIds"]]}
+
+    session.route("GET /api/v1/services/discover", (200, {"agents": AGENTS}))
+    session.route("POST /api/v1/agents/reputation/batch", reputations)
+    session.route(EVALUATE, evaluate)
+    session.route(CREATE, (200, {"nonce": "0xdeal", "requiresHumanApproval": False}))
+    return approved
+
+
+def billed(agent_id: str) -> tuple:
+    requirements = {"amount": "1", "extra": {"serviceId": agent_id}}
+    return 402, {"paymentRequired": True, "requirements": requirements}
+
+
+def evaluated(session) -> list[str]:
+    return [c.body["agentId"] for c in session.hits(EVALUATE)]
+
+
+def run(client, **kwargs):
+    kwargs.setdefault("via", "deal")
+    kwargs.setdefault("max_concurrency", 1)
+    pipeline = HirePipeline(client, "0xprincipal", **kwargs)
+    return pipeline.run("market-analysis", "Analyze Q1 soy exports")
+
+
+def test_first_passing_candidate_in_rank_order_is_hired(client, session, approve):
+    approve.update({"a2", "a4"})
+    result = run(client)
+    assert result.hired and result.candidate["agentId"] == "a2"
+    assert [c.agent["agentId"] for c in result.checks] == ["a1", "a2"]
+    assert [c.passed for c in result.checks] == [False, True]
+    assert session.hits(CREATE)[0].body["agentId"] == "a2"
+
+
+def test_evaluations_not_started_are_cancelled(client, session, approve):
+    approve.add("a1")
+    run(client)
+    time.sleep(0.2)  # anything left running would have been sent by now
+    # a2 may already have been in flight when a1 passed; nothing after it
+    assert evaluated(session) in (["a1"], ["a1", "a2"])
+
+
+def test_lower_ranked_pass_waits_for_higher_ranked_results(client, approve, delays):
+    approve.add("a3")
+    delays["a1"] = 0.2  # a3 passes first, but a1 and a2 must fail before it is hired
+    result = run(client, max_concurrency=None)
+    assert result.candidate["agentId"] == "a3"
+    assert [c.passed for c in result.checks] == [False, False, True]
+
+
+def test_slow_higher_ranked_pass_wins(client, approve, delays):
+    approve.update({"a1", "a3"})
+    delays["a1"] = 0.2
+    result = run(client, max_concurrency=None)
+    assert result.candidate["agentId"] == "a1"
+    assert len(result.checks) == 1
+
+
+def test_check_all_evaluates_every_candidate(client, session, approve):
+    approve.update({"a2", "a4"})
+    result = run(client, check_all=True)
+    assert result.candidate["agentId"] == "a2"
+    assert [c.passed for c in result.checks] == [False, True, False, True, False]
+    assert sorted(evaluated(session)) == ["a1", "a2", "a3", "a4", "a5"]
+
+
+def test_no_passing_candidate_hires_nobody(client, session, approve):
+    result = run(client)
+    assert not result.hired and result.candidate is None
+    assert len(result.checks) == 5
+    assert not session.hits(CREATE)
+
+
+def test_x402_pays_only_the_evaluated_candidate(client, session, approve):
+    approve.add("a2")
+    session.route(REQUIREMENTS, billed("a1"))
+    result = run(client, via="x402")
+    assert (result.candidate["agentId"], result.via) == ("a2", "deal")
+    assert not session.hits("POST /x402/services/market-analysis")
+
+
+def test_requirements_failure_falls_back_to_a_deal(client, session, approve):
+    approve.add("a1")
+    session.route(REQUIREMENTS, (500, {"error": "boom"}))
+    result = run(client, via="x402")
+    assert result.hired and result.via == "deal"
+    assert session.hits(CREATE)[0].body["agentId"] == "a1"
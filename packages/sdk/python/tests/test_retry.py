@@ -0,0 +1,75 @@
+import pytest
+
+from maldo import MaldoApiError, MaldoClient, MaldoTimeoutError, RetryPolicy
+from maldo.retry import Retrier
+
+CREATE = "POST /api/v1/deals/create"
+DEAL = {"nonce": "0x1", "requiresHumanApproval": False}
+
+
+def create(client, **kwargs):
+    return client.deals.create("a1", "0xclient", 1000, "task", **kwargs)
+
+
+def test_post_without_key_is_not_retried(client, session):
+    session.route(CREATE, [(503, {"error": "busy"}), (200, DEAL)])
+    with pytest.raises(MaldoApiError) as e:
+        create(client)
+    assert e.value.status == 503
+    assert len(session.hits(CREATE)) == 1
+
+
+def test_post_with_key_is_retried_with_the_same_key(client, session):
+    session.route(CREATE, [(503, {"error": "busy"}), (502, {"error": "bad gateway"}), (200, DEAL)])
+    assert create(client, idempotency_key="k-1")["nonce"] == "0x1"
+    calls = session.hits(CREATE)
+    assert len(calls) == 3
+    assert {c.headers.get("Idempotency-Key") for c in calls} == {"k-1"}
+
+
+def test_post_without_key_sends_no_idempotency_header(client, session):
+    session.route(CREATE, (200, DEAL))
+    create(client)
+    assert "Idempotency-Key" not in session.hits(CREATE)[0].headers
+
+
+def test_get_is_retried_without_key(client, session):
+    session.route("GET /api/v1/agents/a1", [(503, {"error": "busy"}), (200, {"agentId": "a1"})])
+    assert client.agents.get("a1")["agentId"] == "a1"
+    assert len(session.hits("GET /api/v1/agents/a1")) == 2
+
+
+def test_non_transient_status_is_not_retried(client, session):
+    session.route(CREATE, [(400, {"error": "bad request"}), (200, DEAL)])
+    with pytest.raises(MaldoApiError):
+        create(client, idempotency_key="k-2")
+    assert len(session.hits(CREATE)) == 1
+
+
+def test_attempts_are_capped(session):
+    client = MaldoClient(
+        "http://maldo.test",
+        session=session,
+        retry=RetryPolicy(max_attempts=2, backoff_base=0.0),
+        circuit_breaker=None,
+    )
+    session.route(CREATE, (503, {"error": "busy"}))
+    with pytest.raises(MaldoApiError):
+        create(client, idempotency_key="k-3")
+    assert len(session.hits(CREATE)) == 2
+
+
+def test_policy_only_retries_idempotent_calls():
+    policy = RetryPolicy()
+    timeout = MaldoTimeoutError("timed out")
+    assert policy.is_retryable(timeout, idempotent=True)
+    assert not policy.is_retryable(timeout, idempotent=False)
+    assert not policy.is_retryable(MaldoApiError(503, "busy"), idempotent=False)
+
+
+def test_retry_budget_runs_out():
+    retrier = Retrier(RetryPolicy(max_attempts=10, budget_ratio=0.0, budget_burst=2.0))
+    error = MaldoApiError(503, "busy")
+    assert retrier.next_delay(error, 1, idempotent=True) is not None
+    assert retrier.next_delay(error, 1, idempotent=True) is not None
+    assert retrier.next_delay(error, 1, idempotent=True) is None
@@ -0,0 +1,78 @@
+import pytest
+
+BATCH = "POST /api/v1/deals/status/batch"
+
+
+@pytest.fixture
+def statuses(session):
+    """Deal statuses served per nonce; unknown nonces answer 404."""
+    current = {"0x1": "Funded", "0x2": "Funded", "0x3": "Funded"}
+
+    def status(call):
+        nonce = call.path.split("/")[4]
+        if nonce not in current:
+            return 404, {"error": "Deal not found"}
+        return 200, {"nonce": nonce, "status": current[nonce]}
+
+    for nonce in ("0x1", "0x2", "0x3", "0xbad"):
+        session.route(f"GET /api/v1/deals/{nonce}/status", status)
+    return current
+
+
+def keys(results):
+    return [r.key for r in results]
+
+
+def test_first_poll_reports_every_deal(client, statuses):
+    results = client.deals.status_many(["0x1", "0x2", "0x3"])
+    assert keys(results) == ["0x1", "0x2", "0x3"]
+    assert [r.value["status"] for r in results] == ["Funded"] * 3
+
+
+def test_unchanged_deals_are_skipped(client, statuses):
+    client.deals.status_many(["0x1", "0x2", "0x3"])
+    assert client.deals.status_many(["0x1", "0x2", "0x3"]) == []
+
+
+def test_only_changed_deals_are_reported_in_input_order(client, statuses):
+    client.deals.status_many(["0x1", "0x2", "0x3"])
+    statuses["0x3"] = "Completed"
+    statuses["0x1"] = "Disputed"
+    results = client.deals.status_many(["0x1", "0x2", "0x3"])
+    assert keys(results) == ["0x1", "0x3"]
+    assert results[1].value["status"] == "Completed"
+    # The change is remembered: it is not reported again
+    assert client.deals.status_many(["0x1", "0x2", "0x3"]) == []
+
+
+def test_new_nonce_counts_as_changed(client, statuses):
+    client.deals.status_many(["0x1"])
+    assert keys(client.deals.status_many(["0x1", "0x2"])) == ["0x2"]
+
+
+def test_failures_are_always_reported(client, statuses):
+    first = client.deals.status_many(["0x1", "0xbad"])
+    second = client.deals.status_many(["0x1", "0xbad"])
+    assert keys(first) == ["0x1", "0xbad"]
+    assert keys(second) == ["0xbad"]
+    assert not second[0].ok and second[0].error.status == 404
+
+
+def test_changed_only_false_returns_every_deal(client, statuses):
+    client.deals.status_many(["0x1", "0x2"])
+    assert keys(client.deals.status_many(["0x1", "0x2"], changed_only=False)) == ["0x1", "0x2"]
+
+
+def test_batch_endpoint_is_used_when_available(client, session, statuses):
+    def batch(call):
+        nonces = call.body["nonces"]
+        found = [{"nonce": n, "status": statuses[n]} for n in nonces if n in statuses]
+        return 200, {"statuses": found}
+
+    session.route(BATCH, batch)
+    client.deals.status_many(["0x1", "0x2", "0xbad"])
+    statuses["0x2"] = "Refunded"
+    results = client.deals.status_many(["0x1", "0x2", "0xbad"])
+    assert keys(results) == ["0x2", "0xbad"]
+    assert len(session.hits(BATCH)) == 2
+    assert not [c for c in session.calls if c.method == "GET"]
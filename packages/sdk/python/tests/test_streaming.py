@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+import pytest
+
+from maldo.streaming import AsyncJSONArrayStream, JSONArrayParser, JSONArrayStream
+
+DOC = {
+    "deals": [
+        {"nonce": "0x1", "status": "Funded", "price": 50000, "task": "análisis de soja"},
+        {"nonce": "0x2", "status": "Completed", "price": 1.5e3, "tags": ["a", "b"]},
+        12345,
+        "café ☃",
+        None,
+        True,
+    ],
+    "nextCursor": "abc",
+    "count": 6,
+}
+BODY = json.dumps(DOC, ensure_ascii=False).encode()
+
+
+def chunked(data: bytes, *sizes: int) -> list[bytes]:
+    chunks, pos = [], 0
+    for size in sizes:
+        chunks.append(data[pos:pos + size])
+        pos += size
+    return chunks + [data[pos:]]
+
+
+@pytest.mark.parametrize("split", range(1, len(BODY)))
+def test_split_anywhere(split):
+    # Including inside numbers, strings, keywords and multi-byte characters
+    stream = JSONArrayStream(chunked(BODY, split), key="deals")
+    assert list(stream) == DOC["deals"]
+    assert stream.fields == {"nextCursor": "abc", "count": 6}
+
+
+def test_byte_at_a_time():
+    stream = JSONArrayStream([BODY[i:i + 1] for i in range(len(BODY))], key="deals")
+    assert list(stream) == DOC["deals"]
+    assert stream.fields["nextCursor"] == "abc"
+
+
+def test_elements_yielded_before_the_body_ends():
+    parser = JSONArrayParser("deals")
+    assert parser.feed('{"deals": [{"nonce": "0x1"}, {"non') == [{"nonce": "0x1"}]
+    assert parser.feed('ce": "0x2"}]}') == [{"nonce": "0x2"}]
+    assert parser.close() == []
+
+
+def test_number_split_at_chunk_end_is_not_cut_short():
+    parser = JSONArrayParser()
+    assert parser.feed("[12") == []
+    assert parser.feed("34, 5") == [1234]
+    assert parser.feed("6]") == [56]
+    assert parser.close() == []
+
+
+def test_bare_array_and_empty_array():
+    assert list(JSONArrayStream([b"[1, ", b"2]"])) == [1, 2]
+    assert list(JSONArrayStream([b'{"deals": []}'], key="deals")) == []
+    assert list(JSONArrayStream([b"{}"], key="deals")) == []
+
+
+@pytest.mark.parametrize("cut", [1, 10, len(BODY) // 2, len(BODY) - 1])
+def test_truncated_body_raises(cut):
+    stream = JSONArrayStream([BODY[:cut]], key="deals")
+    with pytest.raises(ValueError):
+        list(stream)
+
+
+def test_truncated_body_yields_complete_elements_first():
+    seen = []
+    with pytest.raises(ValueError):
+        for item in JSONArrayStream([b'[{"a": 1}, {"b": 2}, {"c"'], key=None):
+            seen.append(item)
+    assert seen == [{"a": 1}, {"b": 2}]
+
+
+@pytest.mark.parametrize("body", [b'{"deals": {}}', b'["a" "b"]', b"[1] 2", b'{"deals": [1,]}'])
+def test_malformed_body_raises(body):
+    with pytest.raises(ValueError):
+        list(JSONArrayStream([body], key="deals" if body.startswith(b"{") else None))
+
+
+def test_async_stream_split_chunks():
+    async def chunks():
+        for chunk in chunked(BODY, 7, 3, 50, 1):
+            yield chunk
+
+    async def collect():
+        stream = AsyncJSONArrayStream(chunks(), key="deals")
+        return [item async for item in stream], stream.fields
+
+    items, fields = asyncio.run(collect())
+    assert items == DOC["deals"]
+    assert fields["count"] == 6
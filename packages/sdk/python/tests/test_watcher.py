@@ -0,0 +1,155 @@
+import queue
+import time
+
+import pytest
+
+from maldo import DealEvent, DealWatcher, MaldoApiError
+from maldo import watcher as watcher_module
+from maldo.events import DISCONNECTED
+
+TIMEOUT = 5.0
+
+
+class FakeStream:
+    """Event stream fed by the test; iteration ends on close() or end()."""
+
+    _END = object()
+
+    def __init__(self):
+        self._events: queue.Queue = queue.Queue()
+
+    def push(self, event) -> None:
+        self._events.put(event)
+
+    def end(self) -> None:
+        self._events.put(self._END)
+
+    close = end
+
+    def __iter__(self):
+        while True:
+            event = self._events.get()
+            if event is self._END:
+                return
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+
+def wait_until(predicate) -> None:
+    stop = time.monotonic() + TIMEOUT
+    while not predicate():
+        assert time.monotonic() < stop, "timed out"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    streams = []
+
+    def subscribe(watcher, stream_type):
+        streams.append(FakeStream())
+        return streams[-1]
+
+    monkeypatch.setattr(watcher_module, "_subscribe", subscribe)
+    return streams
+
+
+@pytest.fixture
+def deals(session):
+    """Deal statuses served by GET /deals/:nonce/status."""
+    current = {}
+
+    def status(call):
+        nonce = call.path.split("/")[4]
+        return 200, {"nonce": nonce, "status": current.get(nonce, "Funded")}
+
+    session.route("GET /api/v1/deals/*", status)
+    return current
+
+
+def status_checks(session) -> list[str]:
+    return [c.path.split("/")[4] for c in session.calls if c.path.endswith("/status")]
+
+
+def test_events_resolve_watches(client, stream, deals):
+    watcher = DealWatcher(client)
+    future = watcher.watch("0x1")
+    stream[0].push(DealEvent("connected"))
+    stream[0].push(DealEvent("deal.funded", nonce="0x1"))
+    stream[0].push(DealEvent("deal.completed", nonce="0x1"))
+    assert future.result(TIMEOUT).type == "deal.completed"
+    assert watcher.pending == 0
+    watcher.close()
+
+
+def test_connect_reconciles_pending_deals(client, session, stream, deals):
+    deals["0x1"] = "Completed"
+    watcher = DealWatcher(client)
+    done, pending = watcher.watch("0x1"), watcher.watch("0x2")
+    stream[0].push(DealEvent("connected"))
+    event = done.result(TIMEOUT)
+    assert (event.type, event.nonce) == ("deal.completed", "0x1")
+    assert not pending.done()
+    assert sorted(status_checks(session)) == ["0x1", "0x2"]
+    watcher.close()
+    assert pending.cancelled()
+
+
+def test_gap_in_stream_polls_pending_deals(client, session, stream, deals):
+    watcher = DealWatcher(client)
+    future = watcher.watch("0x1")
+    stream[0].push(DealEvent("connected"))
+    wait_until(lambda: len(status_checks(session)) == 1)
+    # The completion event is lost while the stream is down
+    deals["0x1"] = "Refunded"
+    stream[0].push(DealEvent(DISCONNECTED))
+    assert future.result(TIMEOUT).type == "deal.refunded"
+    watcher.close()
+
+
+def test_late_watch_is_checked_once_connected(client, session, stream, deals):
+    watcher = DealWatcher(client)
+    watcher.watch("0x1")
+    stream[0].push(DealEvent("connected"))
+    wait_until(lambda: status_checks(session) == ["0x1"])
+    # Finished before it was watched: no event will come for it
+    deals["0x2"] = "Completed"
+    late = watcher.watch("0x2")
+    assert late.result(TIMEOUT).type == "deal.completed"
+    assert status_checks(session) == ["0x1", "0x2"]
+    assert len(stream) == 1  # served by the existing subscription
+    watcher.close()
+
+
+def test_late_watch_of_pending_deal_waits_for_its_event(client, session, stream, deals):
+    watcher = DealWatcher(client)
+    watcher.watch("0x1")
+    stream[0].push(DealEvent("connected"))
+    wait_until(lambda: status_checks(session) == ["0x1"])
+    late = watcher.watch("0x2")
+    wait_until(lambda: status_checks(session) == ["0x1", "0x2"])
+    assert not late.done()
+    stream[0].push(DealEvent("deal.completed", nonce="0x2"))
+    assert late.result(TIMEOUT).nonce == "0x2"
+    watcher.close()
+
+
+def test_stream_error_fails_waiters_and_next_watch_resubscribes(client, stream, deals):
+    watcher = DealWatcher(client)
+    future = watcher.watch("0x1")
+    stream[0].push(MaldoApiError(403, "forbidden"))
+    with pytest.raises(MaldoApiError):
+        future.result(TIMEOUT)
+    watcher.watch("0x2")
+    assert len(stream) == 2
+    watcher.close()
+
+
+def test_closed_watcher_rejects_watches(client, stream, deals):
+    watcher = DealWatcher(client)
+    future = watcher.watch("0x1")
+    watcher.close()
+    assert future.cancelled()
+    with pytest.raises(RuntimeError):
+        watcher.watch("0x2")